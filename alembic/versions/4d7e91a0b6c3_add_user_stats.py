@@ -0,0 +1,49 @@
+"""add user_stats summary table
+
+Revision ID: 4d7e91a0b6c3
+Revises: c5f202e371ff
+Create Date: 2026-10-19 12:40:08.117342
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4d7e91a0b6c3"
+down_revision: str | Sequence[str] | None = "c5f202e371ff"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The table starts empty: missing rows are created on the next write and
+    reads fall back to aggregating orders. Fill it in advance with
+    ``python -m app.commands.repair_user_stats``.
+    """
+    op.create_table(
+        "user_stats",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("total_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("pending_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("completed_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "total_spent",
+            sa.Numeric(precision=14, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("total_reviews", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("user_stats")
@@ -0,0 +1,86 @@
+"""add indexes for hot query shapes
+
+Revision ID: c5f202e371ff
+Revises: 893b6920c186
+Create Date: 2026-10-19 10:12:31.402817
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5f202e371ff"
+down_revision: str | Sequence[str] | None = "893b6920c186"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ACTIVE = sa.text("is_active")
+
+# name, table, columns, partial index condition
+INDEXES: list[tuple[str, str, list[str], sa.TextClause | None]] = [
+    ("ix_products_category_id", "products", ["category_id"], None),
+    (
+        "ix_products_active_category_id_created_at",
+        "products",
+        ["category_id", "created_at"],
+        ACTIVE,
+    ),
+    (
+        "ix_products_active_category_id_price",
+        "products",
+        ["category_id", "price"],
+        ACTIVE,
+    ),
+    ("ix_products_active_created_at", "products", ["created_at"], ACTIVE),
+    ("ix_products_active_price", "products", ["price"], ACTIVE),
+    ("ix_products_active_name", "products", ["name"], ACTIVE),
+    ("ix_products_active_stock", "products", ["stock"], ACTIVE),
+    ("ix_orders_user_id_created_at", "orders", ["user_id", "created_at"], None),
+    ("ix_orders_status_created_at", "orders", ["status", "created_at"], None),
+    ("ix_order_items_order_id", "order_items", ["order_id"], None),
+    ("ix_order_items_product_id", "order_items", ["product_id"], None),
+    (
+        "ix_reviews_product_id_created_at",
+        "reviews",
+        ["product_id", "created_at"],
+        None,
+    ),
+    ("ix_reviews_user_id_product_id", "reviews", ["user_id", "product_id"], None),
+    ("ix_users_active_created_at", "users", ["created_at"], ACTIVE),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes are built CONCURRENTLY so writes are not blocked on large
+    tables. That cannot run inside a transaction, hence the autocommit
+    block; ``if_not_exists`` lets a failed run be repeated. An interrupted
+    concurrent build leaves an INVALID index that has to be dropped by hand.
+    """
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
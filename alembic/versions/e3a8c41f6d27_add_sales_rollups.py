@@ -0,0 +1,122 @@
+"""add daily sales rollup tables
+
+Revision ID: e3a8c41f6d27
+Revises: 7b2f0c9d4e15
+Create Date: 2026-10-19 18:21:05.630914
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a8c41f6d27"
+down_revision: str | Sequence[str] | None = "7b2f0c9d4e15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# name, columns of the orders indexes the rollup job reads by
+ORDER_INDEXES = [
+    ("ix_orders_updated_at", ["updated_at"]),
+    ("ix_orders_created_at", ["created_at"]),
+]
+
+
+def _counter_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("units", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "revenue",
+            sa.Numeric(precision=14, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+        sa.Column("order_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("cancelled_orders", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("cancelled_units", sa.Integer(), server_default="0", nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The rollup tables start empty; the first run of the rollup job fills them
+    from all orders in batches. Orders indexes are built CONCURRENTLY outside
+    the transaction, like in ``c5f202e371ff``.
+    """
+    op.create_table(
+        "sales_daily_products",
+        *_counter_columns(),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("day", "product_id"),
+    )
+    op.create_index(
+        "ix_sales_daily_products_product_id_day",
+        "sales_daily_products",
+        ["product_id", "day"],
+    )
+    op.create_table(
+        "sales_daily_categories",
+        *_counter_columns(),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("day", "category_id"),
+    )
+    op.create_index(
+        "ix_sales_daily_categories_category_id_day",
+        "sales_daily_categories",
+        ["category_id", "day"],
+    )
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("watermark", sa.DateTime(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("TIMEZONE('utc', now())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    with op.get_context().autocommit_block():
+        for name, columns in ORDER_INDEXES:
+            op.create_index(
+                name,
+                "orders",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(ORDER_INDEXES):
+            op.drop_index(
+                name,
+                table_name="orders",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_table("rollup_watermarks")
+    op.drop_index(
+        "ix_sales_daily_categories_category_id_day",
+        table_name="sales_daily_categories",
+    )
+    op.drop_table("sales_daily_categories")
+    op.drop_index(
+        "ix_sales_daily_products_product_id_day", table_name="sales_daily_products"
+    )
+    op.drop_table("sales_daily_products")
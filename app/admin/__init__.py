@@ -7,6 +7,8 @@ from app.admin.views import (
     OrderItemAdmin,
     ProductAdmin,
     ReviewAdmin,
+    SalesDailyCategoryAdmin,
+    SalesDailyProductAdmin,
     UserAdmin,
 )
 
@@ -21,4 +23,6 @@ ALL_ADMIN_VIEWS = [
     OrderAdmin,
     ProductAdmin,
     ReviewAdmin,
+    SalesDailyProductAdmin,
+    SalesDailyCategoryAdmin,
 ]
@@ -3,8 +3,10 @@
 from sqladmin.authentication import AuthenticationBackend
 from starlette.requests import Request
 
-from app.core.database import get_async_session
+from app.core.database import get_admin_session
 from app.core.security import AuthUtils
+from app.core.token_cache import token_cache
+from app.core.user_cache import user_cache
 from app.crud import user_crud
 
 
@@ -17,12 +19,14 @@ class AdminAuth(AuthenticationBackend):
         username = form.get("username")
         password = form.get("password")
 
-        async for session in get_async_session():
+        async for session in get_admin_session():
             user = await user_crud.get_user_by_username(session, username)
             if not user:
                 return False
 
-            if not AuthUtils.verify_password(password, user.hashed_password):
+            if not await AuthUtils.verify_password_async(
+                password, user.hashed_password
+            ):
                 return False
 
             if not user.is_superuser:
@@ -47,7 +51,9 @@ class AdminAuth(AuthenticationBackend):
 
     async def logout(self, request: Request) -> bool:
         """Logout - clear only admin data from session."""
-        request.session.pop("admin_token", None)
+        token = request.session.pop("admin_token", None)
+        if token:
+            token_cache.evict(token)
         request.session.pop("admin_user_id", None)
         request.session.pop("admin_username", None)
         return True
@@ -60,11 +66,11 @@ class AdminAuth(AuthenticationBackend):
             return False
 
         try:
-            payload = AuthUtils.decode_jwt(token)
+            payload = token_cache.decode(token)
             AuthUtils.validate_token_type(payload, "access")
             user_id = int(payload.get("sub"))
-            async for session in get_async_session():
-                user = await user_crud.get(session, user_id)
+            async for session in get_admin_session():
+                user = await user_cache.load(session, user_id)
                 if user and user.is_active and user.is_superuser:
                     return True
 
@@ -8,7 +8,7 @@ from starlette.datastructures import FormData, UploadFile
 
 from app.admin import ALL_ADMIN_VIEWS, AdminAuth
 from app.admin.views import UPLOAD_DIR
-from app.core import async_engine, settings
+from app.core import engines, settings
 from app.models import Product
 
 
@@ -49,7 +49,7 @@ def setup_admin(app: FastAPI):
     """Initialize admin panel with views."""
     admin = AdminWithUploads(
         app,
-        async_engine,
+        engines["admin"],
         authentication_backend=AdminAuth(secret_key=settings.admin.SECRET_KEY),
     )
 
@@ -8,7 +8,24 @@ from sqladmin import ModelView
 from wtforms import FileField
 
 from app.core import settings
-from app.models import Category, Order, OrderItem, Product, Review, User
+from app.core.http_cache import (
+    PurgeEvent,
+    collect_purge,
+    purge_event_for,
+    purge_objects,
+    schedule_purge,
+)
+from app.core.user_cache import user_cache
+from app.models import (
+    Category,
+    Order,
+    OrderItem,
+    Product,
+    Review,
+    SalesDailyCategory,
+    SalesDailyProduct,
+    User,
+)
 
 UPLOAD_DIR = Path("app/static/img/products")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -20,6 +37,20 @@ class BaseAdmin(ModelView):
     can_delete = settings.admin.CAN_DELETE
     can_view_details = settings.admin.CAN_VIEW_DETAILS
 
+    async def on_model_change(self, data, model, is_created, request):
+        """Remember pages showing the object before the edit, like its old slug."""
+        if not is_created:
+            request.state.purge_before = purge_event_for(model, data.keys())
+
+    async def after_model_change(self, data, model, is_created, request):
+        """Purge cached pages showing the changed object."""
+        purge = collect_purge([model], changed=None if is_created else data.keys())
+        schedule_purge(purge | getattr(request.state, "purge_before", PurgeEvent()))
+
+    async def after_model_delete(self, model, request):
+        """Purge cached pages showing the deleted object."""
+        purge_objects(model)
+
 
 class UserAdmin(BaseAdmin, model=User):
     column_list = [
@@ -33,6 +64,16 @@ class UserAdmin(BaseAdmin, model=User):
     column_details_exclude_list = [User.hashed_password]
     form_excluded_columns = [User.hashed_password]
 
+    async def after_model_change(self, data, model, is_created, request):
+        """Drop cached identity of the edited user."""
+        await super().after_model_change(data, model, is_created, request)
+        user_cache.invalidate(model.id)
+
+    async def after_model_delete(self, model, request):
+        """Drop cached identity of the deleted user."""
+        await super().after_model_delete(model, request)
+        user_cache.invalidate(model.id)
+
 
 class CategoryAdmin(BaseAdmin, model=Category):
     name_plural = "Categories"
@@ -160,3 +201,56 @@ class ReviewAdmin(BaseAdmin, model=Review):
         Review.rating,
         Review.comment,
     ]
+
+
+class SalesRollupAdmin(ModelView):
+    """Read-only daily sales rollup; rows are rebuilt by the rollup job."""
+
+    category = "Analytics"
+    can_create = False
+    can_edit = False
+    can_delete = False
+    can_export = True
+    page_size = 50
+
+
+class SalesDailyProductAdmin(SalesRollupAdmin, model=SalesDailyProduct):
+    name = "Daily product sales"
+    name_plural = "Daily product sales"
+
+    column_list = [
+        SalesDailyProduct.day,
+        SalesDailyProduct.product_id,
+        SalesDailyProduct.units,
+        SalesDailyProduct.revenue,
+        SalesDailyProduct.order_count,
+        SalesDailyProduct.cancelled_orders,
+        SalesDailyProduct.cancelled_units,
+    ]
+    column_sortable_list = [
+        SalesDailyProduct.day,
+        SalesDailyProduct.units,
+        SalesDailyProduct.revenue,
+    ]
+    column_default_sort = [(SalesDailyProduct.day, True)]
+
+
+class SalesDailyCategoryAdmin(SalesRollupAdmin, model=SalesDailyCategory):
+    name = "Daily category sales"
+    name_plural = "Daily category sales"
+
+    column_list = [
+        SalesDailyCategory.day,
+        SalesDailyCategory.category_id,
+        SalesDailyCategory.units,
+        SalesDailyCategory.revenue,
+        SalesDailyCategory.order_count,
+        SalesDailyCategory.cancelled_orders,
+        SalesDailyCategory.cancelled_units,
+    ]
+    column_sortable_list = [
+        SalesDailyCategory.day,
+        SalesDailyCategory.units,
+        SalesDailyCategory.revenue,
+    ]
+    column_default_sort = [(SalesDailyCategory.day, True)]
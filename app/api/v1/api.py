@@ -2,16 +2,21 @@
 
 from fastapi import APIRouter
 
+from app.api.v1.endpoints.analytics import router as analytics_router
 from app.api.v1.endpoints.auth import router as auth_router
+from app.api.v1.endpoints.batch import router as batch_router
 from app.api.v1.endpoints.carts import router as cart_router
 from app.api.v1.endpoints.categories import router as categories_router
+from app.api.v1.endpoints.events import router as events_router
+from app.api.v1.endpoints.jwks import router as jwks_router
 from app.api.v1.endpoints.order_items import router as order_item_router
 from app.api.v1.endpoints.orders import router as order_router
 from app.api.v1.endpoints.products import router as products_router
 from app.api.v1.endpoints.reviews import router as review_router
 from app.api.v1.endpoints.users import router as users_router
+from app.api.v1.serialization import default_response_class
 
-router_v1 = APIRouter()
+router_v1 = APIRouter(default_response_class=default_response_class())
 
 router_v1.include_router(products_router, prefix="/products", tags=["products"])
 router_v1.include_router(categories_router, prefix="/categories", tags=["categories"])
@@ -21,3 +26,7 @@ router_v1.include_router(order_item_router, prefix="/order_items", tags=["order_
 router_v1.include_router(review_router, prefix="/reviews", tags=["reviews"])
 router_v1.include_router(auth_router, prefix="/auth", tags=["authentication"])
 router_v1.include_router(cart_router, prefix="/cart", tags=["cart"])
+router_v1.include_router(jwks_router, tags=["authentication"])
+router_v1.include_router(batch_router, tags=["batch"])
+router_v1.include_router(events_router, tags=["events"])
+router_v1.include_router(analytics_router, prefix="/analytics", tags=["analytics"])
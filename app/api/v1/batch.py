@@ -0,0 +1,228 @@
+"""In-process dispatch of batched API calls.
+
+Each call of ``POST /batch`` is sent straight to the application router with
+a copy of the batch request scope, so it shares authentication headers,
+cookies and the session but skips the network, proxy and middleware.
+Streaming routes are refused and every call runs under a timeout, so a
+batch always completes.
+"""
+
+import asyncio
+import inspect
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from urllib.parse import parse_qs, urlsplit
+
+from loguru import logger
+from pydantic_core import to_json
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope
+
+from app.core.replica import record_write
+from app.schemas import BatchRequestItem
+
+# Headers describing the batch body, replaced for each call's own body
+BODY_HEADERS = {b"content-length", b"content-type", b"content-encoding"}
+# Keys set while routing the batch request itself
+ROUTING_KEYS = {
+    "route",
+    "endpoint",
+    "path_params",
+    "fastapi_astack",
+    "fastapi_inner_astack",
+    "fastapi_function_astack",
+}
+# Paths answered with a response that only ends when the client leaves
+STREAMING_PATHS = ("/events",)
+
+
+@dataclass(slots=True)
+class CallResult:
+    """Status, headers and raw body of one call."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def to_json(self) -> bytes:
+        """Encode as a batch response item, embedding JSON bodies as is."""
+        if not self.body:
+            body = b"null"
+        elif self.headers.get("content-type", "").startswith("application/json"):
+            body = self.body
+        else:
+            body = to_json(self.body.decode(errors="replace"))
+        return b'{"status":%d,"headers":%s,"body":%s}' % (
+            self.status,
+            to_json(self.headers),
+            body,
+        )
+
+
+SERVER_ERROR = CallResult(
+    500, {"content-type": "application/json"}, b'{"detail":"Internal Server Error"}'
+)
+TIMED_OUT = CallResult(
+    504, {"content-type": "application/json"}, b'{"detail":"Batch call timed out"}'
+)
+
+
+def is_streaming(item: BatchRequestItem) -> bool:
+    """Whether the call would open a stream, which a batch cannot embed."""
+    url = urlsplit(item.path)
+    path = url.path.rstrip("/")
+    if any(path == p or path.startswith(p + "/") for p in STREAMING_PATHS):
+        return True
+    return "stream" in parse_qs(url.query, keep_blank_values=True)
+
+
+def call_scope(parent: Scope, item: BatchRequestItem) -> tuple[Scope, bytes]:
+    """ASGI scope and body of a call made on behalf of ``parent``."""
+    url = urlsplit(item.path)
+    body = b"" if item.body is None else to_json(item.body)
+    headers = [(k, v) for k, v in parent["headers"] if k not in BODY_HEADERS]
+    if body:
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+    path = parent.get("root_path", "") + url.path
+    scope = {k: v for k, v in parent.items() if k not in ROUTING_KEYS}
+    scope.update(
+        method=item.method,
+        path=path,
+        raw_path=path.encode(),
+        query_string=url.query.encode(),
+        headers=headers,
+    )
+    if "state" in parent:
+        scope["state"] = dict(parent["state"])
+    return scope, body
+
+
+def exception_handler(scope: Scope, exc: Exception) -> Callable | None:
+    """Handler the application registered for ``exc``, by status or class."""
+    handlers = getattr(scope.get("app"), "exception_handlers", {})
+    if isinstance(exc, HTTPException) and exc.status_code in handlers:
+        return handlers[exc.status_code]
+    for cls in type(exc).__mro__:
+        if cls in handlers:
+            return handlers[cls]
+    return None
+
+
+async def handle_exception(
+    scope: Scope, receive: Receive, exc: Exception
+) -> Response | None:
+    """Response of the application's handler for ``exc``, None without one."""
+    handler = exception_handler(scope, exc)
+    if handler is None:
+        return None
+    request = Request(scope, receive)
+    if inspect.iscoroutinefunction(handler):
+        return await handler(request, exc)
+    return await asyncio.to_thread(handler, request, exc)
+
+
+async def call(
+    app: ASGIApp, parent: Scope, item: BatchRequestItem, timeout: float
+) -> CallResult:
+    """Run one call through ``app`` and collect its response.
+
+    A call still running after ``timeout`` seconds is cancelled and answered
+    with 504.
+    """
+    scope, body = call_scope(parent, item)
+    start: Message = {}
+    chunks: list[bytes] = []
+    received = False
+
+    async def receive() -> Message:
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # The body was sent in full, nothing else will arrive
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        async with asyncio.timeout(timeout):
+            try:
+                await app(scope, receive, send)
+            except Exception as exc:
+                # The router raises 404/405 and validation errors; render them
+                # with the app's handlers as its exception middleware would
+                if start:
+                    raise
+                response = await handle_exception(scope, receive, exc)
+                if response is None:
+                    raise
+                await response(scope, receive, send)
+    except TimeoutError:
+        logger.warning(f"Batch call {item.method} {item.path} timed out")
+        return TIMED_OUT
+    except Exception:
+        logger.exception(f"Batch call {item.method} {item.path} failed")
+        return SERVER_ERROR
+    headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in start.get("headers", [])
+    }
+    headers.pop("content-length", None)
+    return CallResult(start.get("status", 500), headers, b"".join(chunks))
+
+
+async def run_batch(
+    app: ASGIApp,
+    parent: Scope,
+    items: Sequence[BatchRequestItem],
+    concurrency: int,
+    timeout: float,
+) -> list[CallResult]:
+    """Run calls in order, reads between writes concurrently.
+
+    A write waits for every earlier call and runs alone. Once one succeeds,
+    later calls read from the primary so they see its result, and the
+    response pins the client there; a batch of reads leaves it on the
+    replica. At most ``concurrency`` reads hold database sessions at once,
+    each for at most ``timeout`` seconds.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    results: list[CallResult] = [SERVER_ERROR] * len(items)
+
+    async def run(index: int) -> None:
+        async with semaphore:
+            results[index] = await call(app, parent, items[index], timeout)
+
+    async def run_reads(indexes: list[int]) -> None:
+        async with asyncio.TaskGroup() as group:
+            for index in indexes:
+                group.create_task(run(index))
+
+    # Calls copy the parent state, so a recorded write pins the later ones
+    record_write(parent, False)
+    reads: list[int] = []
+    for index, item in enumerate(items):
+        if item.method == "GET":
+            reads.append(index)
+            continue
+        await run_reads(reads)
+        reads = []
+        await run(index)
+        if results[index].status < 400:
+            record_write(parent)
+    await run_reads(reads)
+    return results
+
+
+def encode_results(results: Sequence[CallResult]) -> bytes:
+    """JSON of ``BatchResponse`` built from the raw bodies of the calls."""
+    return b'{"responses":[' + b",".join(r.to_json() for r in results) + b"]}"
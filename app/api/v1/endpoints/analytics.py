@@ -0,0 +1,156 @@
+"""Sales analytics API endpoints (admins only).
+
+Read only the daily rollup tables maintained by ``app.core.rollups``, never
+orders, so dashboards stay fast and leave the live tables alone.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.api.v1.serialization import serialize
+from app.core import ReadSessionDep
+from app.core.deps import SuperUser
+from app.crud.sales import get_daily, get_totals, get_watermark
+from app.models import SalesDailyCategory, SalesDailyProduct
+from app.schemas import (
+    CategorySalesTotal,
+    ProductSalesTotal,
+    RollupStatus,
+    SalesDailyCategoryRead,
+    SalesDailyProductRead,
+)
+
+router = APIRouter()
+
+MAX_DAYS = 366
+
+type SortBy = Literal[
+    "units", "revenue", "order_count", "cancelled_orders", "cancelled_units"
+]
+
+
+def _period(start: date | None, end: date | None) -> tuple[date, date]:
+    """Inclusive day range, the last 30 days by default."""
+    end = end or datetime.now(UTC).date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must not be after end",
+        )
+    if (end - start).days >= MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_DAYS} days per request",
+        )
+    return start, end
+
+
+StartQuery = Annotated[date | None, Query(description="First day, UTC")]
+EndQuery = Annotated[date | None, Query(description="Last day, UTC (default today)")]
+
+
+@router.get(
+    "/sales/daily/products",
+    name="Daily sales per product",
+    response_model=list[SalesDailyProductRead],
+    status_code=status.HTTP_200_OK,
+)
+async def get_daily_product_sales(
+    session: ReadSessionDep,
+    admin: SuperUser,
+    start: StartQuery = None,
+    end: EndQuery = None,
+    product_id: Annotated[
+        list[int] | None, Query(description="Only these products")
+    ] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10_000),
+):
+    """Units, revenue and cancellations per product and day (admins only)."""
+    start, end = _period(start, end)
+    rows = await get_daily(
+        session, SalesDailyProduct, start, end, product_id or (), offset, limit
+    )
+    return serialize(list[SalesDailyProductRead], rows)
+
+
+@router.get(
+    "/sales/daily/categories",
+    name="Daily sales per category",
+    response_model=list[SalesDailyCategoryRead],
+    status_code=status.HTTP_200_OK,
+)
+async def get_daily_category_sales(
+    session: ReadSessionDep,
+    admin: SuperUser,
+    start: StartQuery = None,
+    end: EndQuery = None,
+    category_id: Annotated[
+        list[int] | None, Query(description="Only these categories")
+    ] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10_000),
+):
+    """Units, revenue and cancellations per category and day (admins only)."""
+    start, end = _period(start, end)
+    rows = await get_daily(
+        session, SalesDailyCategory, start, end, category_id or (), offset, limit
+    )
+    return serialize(list[SalesDailyCategoryRead], rows)
+
+
+@router.get(
+    "/sales/products",
+    name="Top products by sales",
+    response_model=list[ProductSalesTotal],
+    status_code=status.HTTP_200_OK,
+)
+async def get_product_sales_totals(
+    session: ReadSessionDep,
+    admin: SuperUser,
+    start: StartQuery = None,
+    end: EndQuery = None,
+    sort_by: SortBy = "revenue",
+    limit: int = Query(25, ge=1, le=1000),
+):
+    """Products with the highest ``sort_by`` total over the period (admins only)."""
+    start, end = _period(start, end)
+    rows = await get_totals(session, SalesDailyProduct, start, end, sort_by, limit)
+    return serialize(list[ProductSalesTotal], rows)
+
+
+@router.get(
+    "/sales/categories",
+    name="Sales totals per category",
+    response_model=list[CategorySalesTotal],
+    status_code=status.HTTP_200_OK,
+)
+async def get_category_sales_totals(
+    session: ReadSessionDep,
+    admin: SuperUser,
+    start: StartQuery = None,
+    end: EndQuery = None,
+    sort_by: SortBy = "revenue",
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """Categories with the highest ``sort_by`` total over the period (admins only)."""
+    start, end = _period(start, end)
+    rows = await get_totals(session, SalesDailyCategory, start, end, sort_by, limit)
+    return serialize(list[CategorySalesTotal], rows)
+
+
+@router.get(
+    "/sales/status",
+    name="Sales rollup status",
+    response_model=RollupStatus,
+    status_code=status.HTTP_200_OK,
+)
+async def get_rollup_status(session: ReadSessionDep, admin: SuperUser):
+    """Orders changed up to ``watermark`` are included (admins only)."""
+    current = await get_watermark(session)
+    if current is None:
+        return RollupStatus(watermark=None, updated_at=None)
+    return serialize(RollupStatus, current)
@@ -0,0 +1,55 @@
+"""Batch API endpoint."""
+
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.api.v1.batch import encode_results, is_streaming, run_batch
+from app.core import settings
+from app.schemas import BatchRequest, BatchResponse
+
+router = APIRouter()
+
+
+@router.post(
+    "/batch",
+    name="Run several API calls",
+    response_model=BatchResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def batch(batch_in: BatchRequest, request: Request):
+    """Run API calls in one round trip.
+
+    Calls share the headers of this request, including ``Authorization``.
+    Reads between two writes run concurrently, writes run in order, and
+    reads after a successful write use the primary database. Each
+    result keeps its own status code, headers and body. Streams (``/events``
+    and ``?stream=`` lists) cannot be batched, and a call running longer
+    than ``API_BATCH_CALL_TIMEOUT`` seconds is answered with 504.
+    """
+    if len(batch_in.requests) > settings.api.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.api.BATCH_MAX_REQUESTS} calls per batch",
+        )
+    if any(
+        urlsplit(item.path).path.rstrip("/") == request.url.path.rstrip("/")
+        for item in batch_in.requests
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batches cannot be nested",
+        )
+    if any(is_streaming(item) for item in batch_in.requests):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Streaming responses cannot be batched",
+        )
+    results = await run_batch(
+        request.app.router,
+        request.scope,
+        batch_in.requests,
+        settings.api.BATCH_CONCURRENCY,
+        settings.api.BATCH_CALL_TIMEOUT,
+    )
+    return Response(content=encode_results(results), media_type="application/json")
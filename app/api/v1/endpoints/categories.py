@@ -3,7 +3,7 @@
 from fastapi import HTTPException, status
 
 from app.api.v1.router_factory import build_crud_router
-from app.core import SessionDep
+from app.core import ReadSessionDep
 from app.crud import category_crud
 from app.schemas import CategoryCreate, CategoryRead, CategoryUpdate
 
@@ -25,7 +25,7 @@ router = build_crud_router(
 )
 async def get_category_by_slug(
     slug: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get category by slug."""
     category = await category_crud.get_by_slug(session, slug)
@@ -44,7 +44,7 @@ async def get_category_by_slug(
 )
 async def get_category_with_products(
     category_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get category with all products (eager loading)."""
     category = await category_crud.get_with_products(session, category_id)
@@ -62,7 +62,7 @@ async def get_category_with_products(
     status_code=status.HTTP_200_OK,
 )
 async def get_categories_with_product_counts(
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get categories with active product counts."""
     return await category_crud.get_categories_with_product_count(session)
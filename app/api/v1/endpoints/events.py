@@ -0,0 +1,133 @@
+"""Server-Sent Events endpoint for live stock and order status updates."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core import async_session, settings
+from app.core.deps import get_current_token_payload
+from app.core.events import get_hub
+from app.core.security import optional_http_bearer
+from app.core.user_cache import UserIdentity, user_cache
+from app.crud import order_crud, product_crud
+from app.crud.events import order_event, stock_event
+
+router = APIRouter()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stop nginx from buffering the stream
+    "X-Accel-Buffering": "no",
+}
+
+
+async def _viewer(
+    request: Request, credentials: HTTPAuthorizationCredentials | None
+) -> UserIdentity | None:
+    """User of the bearer token, else of the cookie session, if any."""
+    if credentials is not None:
+        payload = await get_current_token_payload(credentials)
+        user_id = int(payload["sub"])
+    else:
+        session = request.scope.get("session")
+        user_id = session.get("user_id") if session is not None else None
+    if user_id is None:
+        return None
+    async with async_session() as session:
+        return await user_cache.load(session, user_id)
+
+
+@router.get(
+    "/events",
+    name="Live updates",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def events(
+    request: Request,
+    products: Annotated[
+        list[int] | None, Query(description="Product ids to watch stock of")
+    ] = None,
+    orders: Annotated[
+        list[int] | None, Query(description="Own order ids to watch status of")
+    ] = None,
+    credentials: HTTPAuthorizationCredentials | None = Depends(  # noqa: B008
+        optional_http_bearer
+    ),
+):
+    """Stream stock and order status changes instead of polling.
+
+    Repeat ``products`` and ``orders`` for several ids. The stream starts
+    with the current state of every id, then sends ``stock`` and ``order``
+    events as changes commit, merging bursts, with a ``: ping`` comment on
+    idle connections. Orders require a bearer token or a signed-in web
+    session and must belong to the user unless they are a superuser.
+    """
+    hub = get_hub()
+    if hub is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Live updates are disabled",
+        )
+    product_ids, order_ids = set(products or ()), set(orders or ())
+    if not product_ids and not order_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscribe to at least one product or order",
+        )
+    if len(product_ids) + len(order_ids) > settings.events.MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.events.MAX_IDS} ids per stream",
+        )
+
+    owner_id: int | None = None
+    if order_ids:
+        viewer = await _viewer(request, credentials)
+        if viewer is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Sign in to watch orders",
+            )
+        if not viewer.is_superuser:
+            owner_id = viewer.id
+
+    subscriber = hub.subscribe(
+        [("stock", product_id) for product_id in product_ids]
+        + [("order", order_id) for order_id in order_ids]
+    )
+    if subscriber is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open streams",
+        )
+
+    async def snapshot() -> list[dict]:
+        # Short-lived session: an open stream must not hold a pool connection
+        async with async_session() as session:
+            stock = await product_crud.get_stock_levels(session, product_ids)
+            statuses = await order_crud.get_statuses(session, order_ids, owner_id)
+        return [
+            *(stock_event(*row) for row in stock.items()),
+            *(order_event(*row) for row in statuses.items()),
+        ]
+
+    # Subscribed first, so changes committed meanwhile are not lost
+    try:
+        initial = await snapshot()
+        missing = order_ids - {e["id"] for e in initial if e["type"] == "order"}
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Orders not found: {sorted(missing)}",
+            )
+    except BaseException:
+        hub.unsubscribe(subscriber)
+        raise
+    return StreamingResponse(
+        hub.stream(subscriber, initial, snapshot),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
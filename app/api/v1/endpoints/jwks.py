@@ -0,0 +1,14 @@
+"""JSON Web Key Set endpoint."""
+
+from fastapi import APIRouter, Response
+
+from app.core.keys import key_manager
+
+router = APIRouter()
+
+
+@router.get("/.well-known/jwks.json", name="jwks")
+async def get_jwks(response: Response):
+    """Public keys for verifying issued JWT tokens."""
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return key_manager.jwks()
@@ -3,12 +3,43 @@
 from fastapi import HTTPException, Query, status
 
 from app.api.v1.router_factory import build_crud_router
-from app.api.v1.utils import get_or_404
-from app.core import SessionDep
+from app.api.v1.serialization import serialize
+from app.api.v1.utils import (
+    FIELDS_DESCRIPTION,
+    fields_response,
+    get_or_404,
+    parse_fields,
+    parse_include,
+)
+from app.core import CheckoutSessionDep, SessionDep
 from app.core.deps import CurrentUser, SuperUser
 from app.crud import order_crud
-from app.models import OrderStatus
-from app.schemas import OrderCreate, OrderItemCreate, OrderRead, OrderUpdate
+from app.crud.order import ORDER_INCLUDES
+from app.models import Order, OrderStatus
+from app.schemas import (
+    OrderCreate,
+    OrderItemCreate,
+    OrderListRead,
+    OrderRead,
+    OrderUpdate,
+)
+
+INCLUDE_DESCRIPTION = "Comma separated relations: items, items_summary"
+
+
+def _list_params(
+    include: str | None, fields: str | None
+) -> tuple[set[str], list[str] | None]:
+    """Parse include and fields of an order list, which exclude each other."""
+    includes = parse_include(include, ORDER_INCLUDES)
+    selected = parse_fields(fields, OrderListRead, Order)
+    if includes and selected:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="include cannot be combined with fields",
+        )
+    return includes, selected
+
 
 # Base CRUD routes
 router = build_crud_router(
@@ -17,14 +48,15 @@ router = build_crud_router(
     update_schema=OrderUpdate,
     read_schema=OrderRead,
     resource_name="order",
+    list_route=False,
 )
 
 
-# Override GET / for current user orders
+# GET / lists the current user's orders instead of all orders
 @router.get(
     "/",
     name="Get my orders",
-    response_model=list[OrderRead],
+    response_model=list[OrderListRead],
     status_code=status.HTTP_200_OK,
 )
 async def get_my_orders(
@@ -33,27 +65,35 @@ async def get_my_orders(
     status_filter: str | None = Query(None, description="Filter by order status"),
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get current user orders (from JWT token)."""
+    includes, selected = _list_params(include, fields)
     if status_filter:
         try:
             order_status = OrderStatus[status_filter]
-            return await order_crud.get_user_orders_by_status(
-                session, user.id, order_status, offset, limit
-            )
         except KeyError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid status. Available: {[s.value for s in OrderStatus]}",
             ) from None
-
-    return await order_crud.get_by_user_id(session, user.id, offset, limit)
+        orders = await order_crud.get_user_orders_by_status(
+            session, user.id, order_status, offset, limit, includes, selected
+        )
+    else:
+        orders = await order_crud.get_by_user_id(
+            session, user.id, offset, limit, includes, selected
+        )
+    if selected:
+        return fields_response(orders)
+    return serialize(list[OrderListRead], orders)
 
 
 @router.get(
     "/user/{user_id}",
     name="Get orders by user ID",
-    response_model=list[OrderRead],
+    response_model=list[OrderListRead],
     status_code=status.HTTP_200_OK,
 )
 async def get_user_orders(
@@ -62,21 +102,29 @@ async def get_user_orders(
     current_user: CurrentUser,
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get all user orders (own or admin)."""
+    includes, selected = _list_params(include, fields)
     # Check: user can only see their own orders
     if current_user.id != user_id and not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No access to another user's orders",
         ) from None
-    return await order_crud.get_by_user_id(session, user_id, offset, limit)
+    orders = await order_crud.get_by_user_id(
+        session, user_id, offset, limit, includes, selected
+    )
+    if selected:
+        return fields_response(orders)
+    return serialize(list[OrderListRead], orders)
 
 
 @router.get(
     "/status/{status_value}",
     name="Get orders by status",
-    response_model=list[OrderRead],
+    response_model=list[OrderListRead],
     status_code=status.HTTP_200_OK,
 )
 async def get_orders_by_status(
@@ -85,8 +133,11 @@ async def get_orders_by_status(
     admin: SuperUser,
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get orders by status (admins only)."""
+    includes, selected = _list_params(include, fields)
     try:
         order_status = OrderStatus[status_value]
     except KeyError:
@@ -95,7 +146,12 @@ async def get_orders_by_status(
             detail=f"Invalid status. Available: {[s.value for s in OrderStatus]}",
         ) from None
 
-    return await order_crud.get_by_status(session, order_status, offset, limit)
+    orders = await order_crud.get_by_status(
+        session, order_status, offset, limit, includes, selected
+    )
+    if selected:
+        return fields_response(orders)
+    return serialize(list[OrderListRead], orders)
 
 
 @router.get(
@@ -134,7 +190,7 @@ async def get_order_with_items(
 async def update_order_status(
     order_id: int,
     new_status: str = Query(..., description="New order status"),
-    session: SessionDep = ...,
+    session: CheckoutSessionDep = ...,
     current_user: CurrentUser = ...,
 ):
     """Update order status.
@@ -181,7 +237,7 @@ async def update_order_status(
 async def create_order_with_items(
     order_in: OrderCreate,
     items_in: list[OrderItemCreate],
-    session: SessionDep,
+    session: CheckoutSessionDep,
     user: CurrentUser,
 ):
     """Create order with all items atomically (alternative to checkout)."""
@@ -1,12 +1,22 @@
 """Product API endpoints."""
 
+from decimal import Decimal
+from typing import Annotated
+
 from fastapi import HTTPException, Query, status
 
 from app.api.v1.router_factory import build_crud_router
-from app.api.v1.utils import get_or_404
-from app.core import SessionDep
+from app.api.v1.serialization import serialize
+from app.api.v1.utils import (
+    FIELDS_DESCRIPTION,
+    fields_response,
+    get_or_404,
+    parse_fields,
+)
+from app.core import ReadSessionDep, SessionDep
 from app.core.deps import CurrentUser, SuperUser
 from app.crud import product_crud, review_crud
+from app.models import Product
 from app.schemas import (
     ProductCreate,
     ProductRead,
@@ -22,10 +32,11 @@ router = build_crud_router(
     update_schema=ProductUpdate,
     read_schema=ProductRead,
     resource_name="product",
+    list_route=False,
 )
 
 
-# Override GET / for filter support
+# GET / with filter support replaces the generic listing
 @router.get(
     "/",
     name="Get products with filters",
@@ -33,11 +44,15 @@ router = build_crud_router(
     status_code=status.HTTP_200_OK,
 )
 async def get_products_with_filters(
-    session: SessionDep,
+    session: ReadSessionDep,
     search: str | None = Query(None, description="Search by name or description"),
     category_id: int | None = Query(None, description="Filter by category"),
-    min_price: float | None = Query(None, ge=0, description="Minimum price"),
-    max_price: float | None = Query(None, ge=0, description="Maximum price"),
+    min_price: Annotated[
+        Decimal | None, Query(ge=0, description="Minimum price")
+    ] = None,
+    max_price: Annotated[
+        Decimal | None, Query(ge=0, description="Maximum price")
+    ] = None,
     only_active: bool = Query(True, description="Only active products"),
     sort: str = Query(
         "newest",
@@ -45,6 +60,7 @@ async def get_products_with_filters(
     ),
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
 ):
     """Get product list with filtering, search, and sorting.
 
@@ -57,8 +73,10 @@ async def get_products_with_filters(
     - sort: sorting (price_asc, price_desc, newest, oldest, name_asc, name_desc)
     - offset: pagination offset
     - limit: results limit (max 100)
+    - fields: return only these fields, e.g. id,name,price,image
     """
-    return await product_crud.search_products(
+    selected = parse_fields(fields, ProductRead, Product)
+    products = await product_crud.search_products(
         session=session,
         search_query=search,
         category_id=category_id,
@@ -68,7 +86,11 @@ async def get_products_with_filters(
         sort_by=sort,
         offset=offset,
         limit=limit,
+        fields=selected,
     )
+    if selected:
+        return fields_response(products)
+    return serialize(list[ProductRead], products)
 
 
 @router.get(
@@ -79,7 +101,7 @@ async def get_products_with_filters(
 )
 async def get_product_by_slug(
     slug: str,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get product by slug."""
     product = await product_crud.get_by_slug(session, slug)
@@ -87,7 +109,7 @@ async def get_product_by_slug(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Product not found"
         )
-    return product
+    return serialize(ProductRead, product)
 
 
 @router.get(
@@ -98,15 +120,16 @@ async def get_product_by_slug(
 )
 async def get_products_by_category(
     category_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
     only_active: bool = Query(True),
 ):
     """Get products by category."""
-    return await product_crud.get_by_category(
+    products = await product_crud.get_by_category(
         session, category_id, offset, limit, only_active
     )
+    return serialize(list[ProductRead], products)
 
 
 @router.get(
@@ -116,12 +139,13 @@ async def get_products_by_category(
     status_code=status.HTTP_200_OK,
 )
 async def get_active_products(
-    session: SessionDep,
+    session: ReadSessionDep,
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
 ):
     """Get only active products."""
-    return await product_crud.get_active_products(session, offset, limit)
+    products = await product_crud.get_active_products(session, offset, limit)
+    return serialize(list[ProductRead], products)
 
 
 @router.get(
@@ -131,7 +155,7 @@ async def get_active_products(
     status_code=status.HTTP_200_OK,
 )
 async def get_low_stock_products(
-    session: SessionDep,
+    session: ReadSessionDep,
     admin: SuperUser,
     threshold: int = Query(10, ge=0, description="Stock threshold"),
     offset: int = Query(0, ge=0),
@@ -173,7 +197,7 @@ async def update_product_stock(
 )
 async def get_product_reviews(
     product_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     offset: int = Query(0, ge=0),
     limit: int = Query(25, ge=1, le=100),
 ):
@@ -181,7 +205,8 @@ async def get_product_reviews(
     # Check product exists
     await get_or_404(product_crud, session, product_id)
 
-    return await review_crud.get_by_product_id(session, product_id, offset, limit)
+    reviews = await review_crud.get_by_product_id(session, product_id, offset, limit)
+    return serialize(list[ReviewRead], reviews)
 
 
 @router.post(
@@ -230,7 +255,7 @@ async def create_product_review(
 )
 async def get_product_rating_stats(
     product_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get product rating statistics."""
     # Check product exists
@@ -3,7 +3,8 @@
 from fastapi import HTTPException, status
 
 from app.api.v1.router_factory import build_crud_router
-from app.core import SessionDep
+from app.api.v1.serialization import serialize
+from app.core import ReadSessionDep, SessionDep
 from app.core.deps import ActiveUser, CurrentUser
 from app.crud import review_crud
 from app.schemas import ReviewCreate, ReviewRead, ReviewUpdate
@@ -25,12 +26,13 @@ router = build_crud_router(
 )
 async def get_product_reviews(
     product_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     offset: int = 0,
     limit: int = 25,
 ):
     """Get all reviews for product."""
-    return await review_crud.get_by_product_id(session, product_id, offset, limit)
+    reviews = await review_crud.get_by_product_id(session, product_id, offset, limit)
+    return serialize(list[ReviewRead], reviews)
 
 
 @router.get(
@@ -41,7 +43,7 @@ async def get_product_reviews(
 )
 async def get_user_reviews(
     user_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     current_user: CurrentUser,
     offset: int = 0,
     limit: int = 25,
@@ -52,7 +54,8 @@ async def get_user_reviews(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="No access to another user's reviews",
         )
-    return await review_crud.get_by_user_id(session, user_id, offset, limit)
+    reviews = await review_crud.get_by_user_id(session, user_id, offset, limit)
+    return serialize(list[ReviewRead], reviews)
 
 
 @router.get(
@@ -62,13 +65,14 @@ async def get_user_reviews(
     status_code=status.HTTP_200_OK,
 )
 async def get_my_reviews(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: ActiveUser,
     offset: int = 0,
     limit: int = 25,
 ):
     """Get current user reviews."""
-    return await review_crud.get_by_user_id(session, user.id, offset, limit)
+    reviews = await review_crud.get_by_user_id(session, user.id, offset, limit)
+    return serialize(list[ReviewRead], reviews)
 
 
 @router.get(
@@ -80,7 +84,7 @@ async def get_my_reviews(
 async def get_user_product_review(
     product_id: int,
     user_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
     current_user: CurrentUser,
 ):
     """Check if user has reviewed product."""
@@ -126,7 +130,7 @@ async def create_review_validated(
 )
 async def get_product_rating(
     product_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get product average rating."""
     avg_rating = await review_crud.get_average_rating(session, product_id)
@@ -144,7 +148,7 @@ async def get_product_rating(
 )
 async def get_product_rating_stats(
     product_id: int,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Get detailed product rating statistics."""
     avg_rating = await review_crud.get_average_rating(session, product_id)
@@ -3,9 +3,12 @@
 from fastapi import HTTPException, status
 
 from app.api.v1.router_factory import build_crud_router
+from app.api.v1.serialization import serialize
 from app.api.v1.utils import get_or_404
 from app.core import SessionDep
 from app.core.deps import ActiveUser, CurrentUser, SuperUser
+from app.core.security import password_executor
+from app.core.user_cache import user_cache
 from app.crud import user_crud
 from app.schemas import UserCreate, UserRead, UserUpdate
 from app.schemas.auth import PasswordUpdate
@@ -52,7 +55,8 @@ async def get_active_users(
     limit: int = 25,
 ):
     """Get active users (admins only)."""
-    return await user_crud.get_active_users(session, offset, limit)
+    users = await user_crud.get_active_users(session, offset, limit)
+    return serialize(list[UserRead], users)
 
 
 @router.patch(
@@ -85,14 +89,15 @@ async def change_my_password(
     """Change current user password."""
     from app.core.security import AuthUtils
 
-    if not AuthUtils.verify_password(
-        password_data.current_password, user.hashed_password
+    db_user = await get_or_404(user_crud, session, user.id)
+    if not await AuthUtils.verify_password_async(
+        password_data.current_password, db_user.hashed_password
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect current password"
         )
 
-    await user_crud.update_password(session, user, password_data.new_password)
+    await user_crud.update_password(session, db_user, password_data.new_password)
     return {"message": "Password successfully changed"}
 
 
@@ -129,3 +134,25 @@ async def get_my_statistics(
 ):
     """Get current user statistics."""
     return await user_crud.get_user_statistics(session, user.id)
+
+
+@router.get(
+    "/cache/stats",
+    name="Get user cache statistics",
+    response_model=dict,
+    status_code=status.HTTP_200_OK,
+)
+async def get_user_cache_stats(admin: SuperUser):
+    """Get user identity cache hit ratio (admins only)."""
+    return user_cache.stats()
+
+
+@router.get(
+    "/hashing/stats",
+    name="Get password hashing pool statistics",
+    response_model=dict,
+    status_code=status.HTTP_200_OK,
+)
+async def get_password_hashing_stats(admin: SuperUser):
+    """Get password hashing queue depth and rejections (admins only)."""
+    return password_executor.stats()
@@ -1,10 +1,22 @@
 """CRUD router factory."""
 
-from fastapi import APIRouter, status
+from typing import Literal
+
+from fastapi import APIRouter, Query, status
 from pydantic import BaseModel
 
-from app.api.v1.utils import get_or_404
-from app.core import SessionDep
+from app.api.v1.serialization import (
+    STREAM_DESCRIPTION,
+    serialize,
+    streaming_response,
+)
+from app.api.v1.utils import (
+    FIELDS_DESCRIPTION,
+    fields_response,
+    get_or_404,
+    parse_fields,
+)
+from app.core import ReadSessionDep, SessionDep, settings
 
 
 def get_plural_name(name: str) -> str:
@@ -22,8 +34,13 @@ def build_crud_router(
     update_schema: type[BaseModel],
     read_schema: type[BaseModel],
     resource_name: str,
+    list_route: bool = True,
 ) -> APIRouter:
-    """Build standard CRUD router for resource."""
+    """Build standard CRUD router for resource.
+
+    Pass ``list_route=False`` when the resource defines its own ``GET /``,
+    which would otherwise be shadowed by the generic listing.
+    """
     router = APIRouter()
 
     resource_plural = get_plural_name(resource_name)
@@ -43,17 +60,44 @@ def build_crud_router(
         response_model=read_schema,
         status_code=status.HTTP_200_OK,
     )
-    async def get_item(item_id: int, session: SessionDep):
-        return await get_or_404(crud, session, item_id)
+    async def get_item(item_id: int, session: ReadSessionDep):
+        return serialize(read_schema, await get_or_404(crud, session, item_id))
 
-    @router.get(
-        "/",
-        name=f"Get all {resource_plural}",
-        response_model=list[read_schema],
-        status_code=status.HTTP_200_OK,
-    )
-    async def get_items(session: SessionDep, offset: int = 0, limit: int = 20):
-        return await crud.get_multi(session, offset, limit)
+    if list_route:
+
+        @router.get(
+            "/",
+            name=f"Get all {resource_plural}",
+            response_model=list[read_schema],
+            status_code=status.HTTP_200_OK,
+        )
+        async def get_items(
+            session: ReadSessionDep,
+            offset: int = 0,
+            limit: int = 20,
+            fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+            stream: Literal["json", "ndjson"] | None = Query(
+                None, description=STREAM_DESCRIPTION
+            ),
+        ):
+            selected = parse_fields(fields, read_schema, crud.model)
+            if stream:
+                chunks = crud.stream_multi(
+                    session,
+                    offset,
+                    limit,
+                    fields=selected,
+                    chunk_size=settings.api.STREAM_CHUNK_SIZE,
+                )
+                schema = None if selected else read_schema
+                return await streaming_response(schema, chunks, stream)
+            if selected:
+                return fields_response(
+                    await crud.get_multi(session, offset, limit, fields=selected)
+                )
+            return serialize(
+                list[read_schema], await crud.get_multi(session, offset, limit)
+            )
 
     @router.patch(
         "/{item_id}",
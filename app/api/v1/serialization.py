@@ -0,0 +1,145 @@
+"""Direct JSON serialization of API responses.
+
+FastAPI validates a returned value against ``response_model``, dumps it to
+Python dicts and encodes those with ``json.dumps``. With ``API_FAST_JSON``
+endpoints return :func:`serialize` instead: one validation pass with a cached
+``TypeAdapter`` reads the ORM attributes and ``dump_json`` writes bytes.
+:func:`streaming_response` encodes large lists chunk by chunk the same way.
+"""
+
+import operator
+from collections.abc import AsyncIterator, Callable
+from functools import cache, partial, reduce
+from types import UnionType
+from typing import Any, get_args, get_origin
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, EmailStr, TypeAdapter, create_model
+from pydantic_core import PydanticUndefined, to_json
+
+from app.core import settings
+
+# Types checked in Python on every validation. Stored values were validated
+# on write, so rows read back from the database are encoded as plain strings.
+TRUSTED_TYPES: dict[Any, type] = {EmailStr: str}
+
+STREAM_FORMATS = {"json": "application/json", "ndjson": "application/x-ndjson"}
+STREAM_DESCRIPTION = (
+    "Stream the list in chunks: json (one array) or ndjson (a row per line)"
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core, passing bytes through as is."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+def _trusted_annotation(annotation: Any) -> Any:
+    if annotation in TRUSTED_TYPES:
+        return TRUSTED_TYPES[annotation]
+    if isinstance(annotation, UnionType):
+        return reduce(operator.or_, map(_trusted_annotation, get_args(annotation)))
+    return annotation
+
+
+@cache
+def trusted_schema[S: BaseModel](schema: type[S]) -> type[S]:
+    """``schema`` without validation that only guards user input.
+
+    Fields of :data:`TRUSTED_TYPES` become plain strings; model validators and
+    field order are inherited, so the JSON is the same as for ``schema``.
+    """
+    overrides = {}
+    for name, info in schema.model_fields.items():
+        annotation = _trusted_annotation(info.annotation)
+        if annotation != info.annotation:
+            default = ... if info.default is PydanticUndefined else info.default
+            overrides[name] = (annotation, default)
+    if not overrides:
+        return schema
+    return create_model(schema.__name__, __base__=schema, **overrides)
+
+
+@cache
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Cached adapter for a read schema or ``list`` of one."""
+    if get_origin(tp) is list:
+        (schema,) = get_args(tp)
+        return TypeAdapter(list[trusted_schema(schema)])
+    return TypeAdapter(trusted_schema(tp))
+
+
+def dump_json(tp: Any, content: Any) -> bytes:
+    """Encode ORM objects or dicts as ``tp`` in a single validation pass."""
+    adapter = type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
+def serialize(tp: Any, content: Any) -> Any:
+    """Response body for an endpoint declaring ``response_model=tp``.
+
+    Returns ``content`` unchanged for FastAPI to handle unless
+    ``API_FAST_JSON`` is enabled.
+    """
+    if not settings.api.FAST_JSON or isinstance(content, Response):
+        return content
+    return FastJSONResponse(dump_json(tp, content))
+
+
+def default_response_class() -> type[JSONResponse]:
+    """Response class for routes whose result FastAPI still encodes."""
+    return FastJSONResponse if settings.api.FAST_JSON else JSONResponse
+
+
+async def _chain(first: list, rest: AsyncIterator[list]) -> AsyncIterator[list]:
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+
+async def _array(
+    chunks: AsyncIterator[list], encode: Callable[[list], bytes]
+) -> AsyncIterator[bytes]:
+    yield b"["
+    separator = b""
+    async for chunk in chunks:
+        if chunk:
+            # Drop the brackets of each encoded chunk to join one array
+            yield separator + encode(chunk)[1:-1]
+            separator = b","
+    yield b"]"
+
+
+async def _lines(
+    chunks: AsyncIterator[list], encode: Callable[[Any], bytes]
+) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        if chunk:
+            yield b"".join(encode(row) + b"\n" for row in chunk)
+
+
+async def streaming_response(
+    schema: type[BaseModel] | None,
+    chunks: AsyncIterator[list],
+    stream_format: str = "json",
+) -> StreamingResponse:
+    """Encode rows as they are fetched, one chunk in memory at a time.
+
+    ``schema`` is the read schema of ORM rows; None for dicts of ``?fields=``
+    projections, which are encoded as they are. The first chunk is fetched
+    before responding so query errors still get an error status; later ones
+    can only abort the response.
+    """
+    chunks = _chain(await anext(chunks, []), chunks)
+    if stream_format == "ndjson":
+        encode = to_json if schema is None else partial(dump_json, schema)
+        body = _lines(chunks, encode)
+    else:
+        encode = to_json if schema is None else partial(dump_json, list[schema])
+        body = _array(chunks, encode)
+    return StreamingResponse(body, media_type=STREAM_FORMATS[stream_format])
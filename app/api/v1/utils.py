@@ -1,6 +1,16 @@
 """API utility functions."""
 
-from fastapi import HTTPException, status
+from collections.abc import Collection
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import inspect
+
+FIELDS_DESCRIPTION = (
+    "Comma separated fields to return, e.g. id,name,price. "
+    "Only those columns are read from the database."
+)
 
 
 async def get_or_404(crud, session, obj_id):
@@ -9,3 +19,43 @@ async def get_or_404(crud, session, obj_id):
     if obj is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return obj
+
+
+def parse_include(value: str | None, allowed: Collection[str]) -> set[str]:
+    """Split comma separated ``include`` parameter, rejecting unknown names."""
+    include = {name.strip() for name in (value or "").split(",") if name.strip()}
+    unknown = include - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {sorted(unknown)}. Available: {sorted(allowed)}",
+        )
+    return include
+
+
+def parse_fields(
+    value: str | None,
+    schema: type[BaseModel],
+    model: type,
+) -> list[str] | None:
+    """Validate ``fields`` parameter against response schema and model columns.
+
+    Returns None when the parameter is absent, so callers load full objects.
+    """
+    if not value:
+        return None
+    fields = list(dict.fromkeys(name.strip() for name in value.split(",")))
+    fields = [name for name in fields if name]
+    allowed = schema.model_fields.keys() & inspect(model).column_attrs.keys()
+    unknown = set(fields) - allowed
+    if unknown or not fields:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {sorted(unknown)}. Available: {sorted(allowed)}",
+        )
+    return fields
+
+
+def fields_response(rows: list[dict]) -> Response:
+    """Serialize projected rows directly, skipping response model validation."""
+    return Response(content=to_json(rows), media_type="application/json")
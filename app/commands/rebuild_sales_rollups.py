@@ -0,0 +1,61 @@
+"""Rebuild the daily sales rollup tables from orders.
+
+Usage:
+    python -m app.commands.rebuild_sales_rollups [--since 2026-01-01]
+        [--until 2026-01-31] [--days 7]
+
+Recomputes rollup rows for ``--days`` consecutive days per transaction, from
+the first order (or ``--since``) to today (or ``--until``), so it can run
+against a live database. Needed after deleting orders or writing them with
+raw SQL; the background job only sees changes through ``updated_at``.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, date, datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import func, select
+
+from app.core import background_session
+from app.crud.sales import rebuild_days
+from app.models import Order
+
+
+async def rebuild(since: date | None, until: date | None, days: int) -> None:
+    if since is None:
+        async with background_session() as session:
+            first = await session.scalar(select(func.min(Order.created_at)))
+        if first is None:
+            logger.info("No orders, nothing to rebuild")
+            return
+        since = first.date()
+    until = until or datetime.now(UTC).date()
+
+    start = time.perf_counter()
+    day = since
+    while day <= until:
+        last = min(day + timedelta(days=days - 1), until)
+        async with background_session() as session:
+            await rebuild_days(
+                session, [day + timedelta(days=n) for n in range((last - day).days + 1)]
+            )
+            await session.commit()
+        logger.info(f"Rebuilt {day} - {last}")
+        day = last + timedelta(days=1)
+
+    logger.info(f"Rebuilt sales rollups in {time.perf_counter() - start:.1f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--since", type=date.fromisoformat, help="first day")
+    parser.add_argument("--until", type=date.fromisoformat, help="last day")
+    parser.add_argument("--days", type=int, default=7, help="days per txn")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(rebuild(args.since, args.until, args.days))
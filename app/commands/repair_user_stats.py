@@ -0,0 +1,52 @@
+"""Rebuild the user_stats summary table from orders and reviews.
+
+Usage:
+    python -m app.commands.repair_user_stats [--batch 10000] [--start-id 1]
+
+Recomputes summary rows for consecutive user id ranges of ``--batch``, one
+transaction per range, so it can run against a live database and resume
+from ``--start-id`` after an interruption.
+"""
+
+import argparse
+import asyncio
+import time
+
+from loguru import logger
+from sqlalchemy import func, select
+
+from app.core import background_session
+from app.crud import recompute_user_stats
+from app.models import User
+
+
+async def repair(batch: int, start_id: int) -> None:
+    async with background_session() as session:
+        max_id = await session.scalar(select(func.max(User.id)))
+    if max_id is None:
+        logger.info("No users, nothing to repair")
+        return
+
+    start = time.perf_counter()
+    rows = 0
+    for first_id in range(start_id, max_id + 1, batch):
+        last_id = min(first_id + batch - 1, max_id)
+        async with background_session() as session:
+            result = await session.execute(recompute_user_stats(first_id, last_id))
+            await session.commit()
+        rows += result.rowcount
+        logger.info(f"Users {first_id}-{last_id}: {result.rowcount} rows")
+
+    logger.info(f"Rebuilt {rows} user_stats rows in {time.perf_counter() - start:.1f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=10_000, help="users per txn")
+    parser.add_argument("--start-id", type=int, default=1)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    asyncio.run(repair(args.batch, args.start_id))
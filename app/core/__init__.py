@@ -1,8 +1,17 @@
 """Core application components."""
 
 from app.core.config import settings
-from app.core.database import async_engine, async_session, get_async_session
-from app.core.deps import SessionDep
+from app.core.database import (
+    async_engine,
+    async_session,
+    background_session,
+    engines,
+    get_async_read_session,
+    get_async_session,
+    get_checkout_session,
+    replica_engine,
+)
+from app.core.deps import CheckoutSessionDep, ReadSessionDep, SessionDep
 from app.core.handlers import register_exception_handlers
 from app.core.security import AuthUtils
 from app.core.templates import templates
@@ -13,7 +22,14 @@ __all__ = [
     "async_engine",
     "async_session",
     "get_async_session",
+    "get_async_read_session",
+    "get_checkout_session",
+    "background_session",
+    "engines",
+    "replica_engine",
     "SessionDep",
+    "ReadSessionDep",
+    "CheckoutSessionDep",
     "register_exception_handlers",
     "AuthUtils",
 ]
@@ -23,7 +23,7 @@ async def authenticate_user(
             detail="Incorrect username or password",
         )
 
-    if not AuthUtils.verify_password(
+    if not await AuthUtils.verify_password_async(
         password,
         user.hashed_password,
     ):
@@ -1,8 +1,9 @@
 """Application configuration settings."""
 
 from pathlib import Path
+from typing import Literal
 
-from pydantic import computed_field
+from pydantic import BaseModel, computed_field, model_validator
 from pydantic_settings import BaseSettings
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -26,6 +27,19 @@ class DatabaseSettings(BaseSettings):
     AUTOFLUSH: bool
     EXPIRE_ON_COMMIT: bool
 
+    QUERY_STATS: bool = True
+    QUERY_DEBUG: bool = False
+    N_PLUS_ONE_THRESHOLD: int = 5
+
+    # Slow query recorder, disabled when 0
+    SLOW_QUERY_MS: float = 0
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_REDACT: bool = True
+    SLOW_QUERY_BUFFER: int = 100
+
+    # Maintain the user_stats summary table and read account stats from it
+    USER_STATS: bool = False
+
     @computed_field
     @property
     def DATABASE_URL(self) -> str:
@@ -43,6 +57,86 @@ class DatabaseSettings(BaseSettings):
     }
 
 
+class PoolSettings(BaseModel):
+    """Limits of one named connection pool."""
+
+    SIZE: int
+    MAX_OVERFLOW: int = 0
+    # Seconds to wait for a free connection before failing
+    TIMEOUT: float = 30.0
+    # Server side statement_timeout, 0 disables it
+    STATEMENT_TIMEOUT_MS: int = 0
+
+
+class PoolsSettings(BaseSettings):
+    """Connection pools per workload.
+
+    The storefront pool is the default engine sized by ``DB_POOL_SIZE`` and
+    ``DB_MAX_OVERFLOW``. Checkout, admin and background work get their own
+    pools, so a slow admin export cannot take connections from checkout.
+    Nested values are set as ``DB_POOLS_CHECKOUT__SIZE=5``. When disabled
+    every workload shares the storefront pool.
+    """
+
+    ENABLED: bool = True
+    STOREFRONT_STATEMENT_TIMEOUT_MS: int = 10_000
+    CHECKOUT: PoolSettings = PoolSettings(
+        SIZE=5, MAX_OVERFLOW=5, TIMEOUT=5.0, STATEMENT_TIMEOUT_MS=5_000
+    )
+    ADMIN: PoolSettings = PoolSettings(
+        SIZE=2, MAX_OVERFLOW=1, STATEMENT_TIMEOUT_MS=60_000
+    )
+    BACKGROUND: PoolSettings = PoolSettings(SIZE=2)
+
+    model_config = {
+        "env_prefix": "DB_POOLS_",
+        "env_nested_delimiter": "__",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class ReplicaSettings(BaseSettings):
+    """Read replica configuration, disabled while ``HOST`` is empty.
+
+    Connection fields left empty fall back to the primary database values.
+    """
+
+    HOST: str = ""
+    PORT: int | None = None
+    USER: str = ""
+    PASSWORD: str = ""
+    NAME: str = ""
+
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    CONNECT_TIMEOUT: float = 2.0
+
+    # Reads of a client go to the primary for this long after it writes
+    STICKY_SECONDS: float = 5.0
+    # After a failed connect the replica is skipped for this long
+    RETRY_INTERVAL: float = 30.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a replica is configured."""
+        return bool(self.HOST)
+
+    def database_url(self, primary: DatabaseSettings) -> str:
+        """Construct replica URL, filling gaps from primary settings."""
+        return (
+            f"postgresql+asyncpg://"
+            f"{self.USER or primary.USER}:{self.PASSWORD or primary.PASSWORD}"
+            f"@{self.HOST}:{self.PORT or primary.PORT}/{self.NAME or primary.NAME}"
+        )
+
+    model_config = {
+        "env_prefix": "DB_REPLICA_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
 class AdminSettings(BaseSettings):
     """Admin panel configuration."""
 
@@ -65,9 +159,16 @@ class AuthJWTSettings(BaseSettings):
 
     private_key_path: Path = CERTS_DIR / "jwt-private.pem"
     public_key_path: Path = CERTS_DIR / "jwt-public.pem"
+    # Public keys of retired signing keys, accepted until their tokens expire
+    previous_public_key_paths: list[Path] = []
     algorithm: str = "RS256"
     access_token_expire_minutes: int
     refresh_token_expire_days: int
+    verified_token_cache_size: int = 4096
+    user_cache_ttl: float = 30
+    user_cache_size: int = 10000
+    password_hash_workers: int = 2
+    password_hash_queue: int = 32
 
     @property
     def private_key(self) -> str:
@@ -90,12 +191,223 @@ class AuthJWTSettings(BaseSettings):
     }
 
 
+class CacheSettings(BaseSettings):
+    """HTTP caching headers and edge cache purge configuration."""
+
+    ENABLED: bool = True
+
+    BROWSER_MAX_AGE: int = 0
+    HOME_TTL: int = 60
+    CATALOG_TTL: int = 60
+    PRODUCT_TTL: int = 300
+    STALE_WHILE_REVALIDATE: int = 300
+    STALE_IF_ERROR: int = 86400
+
+    PURGER: Literal["noop", "nginx", "http"] = "noop"
+    PURGE_URL: str = ""
+    PURGE_METHOD: str = "POST"
+    PURGE_TOKEN: str = ""
+    PURGE_TIMEOUT: float = 2.0
+
+    model_config = {
+        "env_prefix": "CACHE_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class MetricsSettings(BaseSettings):
+    """Prometheus metrics endpoint configuration."""
+
+    ENABLED: bool = True
+    TOKEN: str = ""
+
+    # Shared directory for per-worker snapshots when running several workers
+    MULTIPROC_DIR: Path | None = None
+    SNAPSHOT_INTERVAL: float = 5.0
+    LOOP_LAG_INTERVAL: float = 0.5
+
+    model_config = {
+        "env_prefix": "METRICS_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class ServerSettings(BaseSettings):
+    """Production server process configuration."""
+
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    # 0 derives worker count from available CPUs
+    WORKERS: int = 0
+
+    # Restart a worker after this many requests or this much RSS, 0 disables
+    MAX_REQUESTS: int = 0
+    MAX_MEMORY_MB: int = 0
+    MEMORY_CHECK_INTERVAL: float = 10.0
+    GRACEFUL_TIMEOUT: int = 30
+
+    # Connections all workers of all app instances may open in total
+    DB_MAX_CONNECTIONS: int = 100
+    # Kept free for migrations, admin shells and superuser slots
+    DB_RESERVED_CONNECTIONS: int = 10
+    # App containers sharing the database
+    INSTANCES: int = 1
+
+    model_config = {
+        "env_prefix": "SERVER_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class WarmupSettings(BaseSettings):
+    """Startup warm-up run before the app reports ready."""
+
+    ENABLED: bool = True
+    # Connections opened in advance in each pool (capped by pool size)
+    CONNECTIONS: int = 2
+    # Pages requested in-process to fill caches, e.g. ["/", "/catalog"]
+    PAGES: list[str] = []
+    TIMEOUT: float = 30.0
+
+    model_config = {
+        "env_prefix": "WARMUP_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class ApiSettings(BaseSettings):
+    """JSON API response handling."""
+
+    # Encode list and detail responses to bytes with cached TypeAdapters
+    # instead of FastAPI's validate, dump to dict and json.dumps round trip
+    FAST_JSON: bool = False
+    # Rows fetched from the server-side cursor per chunk of ?stream= lists
+    STREAM_CHUNK_SIZE: int = 500
+    # POST /batch: calls per batch, reads run at the same time and seconds
+    # one call may take before it is cancelled with 504
+    BATCH_MAX_REQUESTS: int = 20
+    BATCH_CONCURRENCY: int = 4
+    BATCH_CALL_TIMEOUT: float = 10.0
+
+    model_config = {
+        "env_prefix": "API_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class OutboxSettings(BaseSettings):
+    """Outbox dispatcher delivering order events to external sinks."""
+
+    ENABLED: bool = True
+    # Sinks receiving each topic: log, email, webhook
+    ROUTES: dict[str, list[str]] = {
+        "order.created": ["log"],
+        "order.status_changed": ["log"],
+    }
+    POLL_INTERVAL: float = 2.0
+    BATCH_SIZE: int = 50
+    # Deliveries in flight per sink
+    CONCURRENCY: int = 4
+    MAX_ATTEMPTS: int = 8
+    # Retry delay doubles from BACKOFF_BASE up to BACKOFF_MAX seconds
+    BACKOFF_BASE: float = 5.0
+    BACKOFF_MAX: float = 3600.0
+    # Claimed messages are retried after this if their dispatcher died;
+    # batches are cut so every send ends within it
+    LEASE: float = 60.0
+    SEND_TIMEOUT: float = 15.0
+    RETENTION_DAYS: int = 7
+
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 1025
+    SMTP_USERNAME: str = ""
+    SMTP_PASSWORD: str = ""
+    SMTP_STARTTLS: bool = False
+    SMTP_SENDER: str = "shop@localhost"
+
+    WEBHOOK_URL: str = ""
+    # Signs bodies with HMAC-SHA256 in X-Signature when set
+    WEBHOOK_SECRET: str = ""
+
+    @model_validator(mode="after")
+    def check_lease(self) -> OutboxSettings:
+        if self.LEASE < 2 * self.SEND_TIMEOUT:
+            raise ValueError("OUTBOX_LEASE must be at least twice OUTBOX_SEND_TIMEOUT")
+        return self
+
+    model_config = {
+        "env_prefix": "OUTBOX_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class EventsSettings(BaseSettings):
+    """Server-Sent Events stream of stock and order status changes."""
+
+    # Listen for NOTIFY on a dedicated connection in every worker
+    ENABLED: bool = True
+    # Changes of one product or order within this many seconds are merged
+    COALESCE: float = 0.5
+    # Comment sent on idle streams so proxies keep them open, also the
+    # keepalive query interval of the listening connection
+    HEARTBEAT: float = 15.0
+    # Products plus orders one stream may subscribe to
+    MAX_IDS: int = 100
+    # Open streams per worker, further clients get 503
+    MAX_STREAMS: int = 1000
+    # Reconnect delay suggested to clients
+    RETRY_MS: int = 3000
+    # Product pages subscribe to live stock. Off by default: the page is
+    # edge-cached and cheap, but every view would hold a stream open
+    PRODUCT_PAGE: bool = False
+
+    model_config = {
+        "env_prefix": "EVENTS_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
+class RollupSettings(BaseSettings):
+    """Background job maintaining the daily sales rollup tables."""
+
+    ENABLED: bool = True
+    INTERVAL: float = 60.0
+    # Changes younger than this are left for the next run, so transactions
+    # committing late with an older updated_at are not skipped
+    LAG: float = 30.0
+    # Changed orders per run; a full batch runs again right away
+    BATCH_SIZE: int = 5000
+
+    model_config = {
+        "env_prefix": "ROLLUP_",
+        "env_file": BASE_DIR / ".env",
+        "extra": "ignore",
+    }
+
+
 class Settings(BaseSettings):
     """Application settings container."""
 
     db: DatabaseSettings = DatabaseSettings()  # type: ignore
+    pools: PoolsSettings = PoolsSettings()
+    replica: ReplicaSettings = ReplicaSettings()
     admin: AdminSettings = AdminSettings()  # type: ignore
     auth_jwt: AuthJWTSettings = AuthJWTSettings()
+    cache: CacheSettings = CacheSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    server: ServerSettings = ServerSettings()
+    warmup: WarmupSettings = WarmupSettings()
+    api: ApiSettings = ApiSettings()
+    outbox: OutboxSettings = OutboxSettings()
+    events: EventsSettings = EventsSettings()
+    rollup: RollupSettings = RollupSettings()
 
 
 settings = Settings()
@@ -1,33 +1,198 @@
 """Database engine and session configuration."""
 
 from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
 from app.core import settings
+from app.core.config import PoolSettings
+from app.core.replica import ReplicaHealth, sticky_to_primary
+from app.monitoring.pool import named_pool_class
 
-async_engine = create_async_engine(
-    url=settings.db.DATABASE_URL,
-    echo=settings.db.ECHO,
-    pool_size=settings.db.POOL_SIZE,
-    max_overflow=settings.db.MAX_OVERFLOW,
-    pool_pre_ping=settings.db.POOL_PRE_PING,
-    pool_recycle=settings.db.POOL_RECYCLE,
-)
+
+def _create_engine(
+    name: str,
+    url: str,
+    pool: PoolSettings,
+    connect_args: dict | None = None,
+) -> AsyncEngine:
+    """Create engine whose pool metrics are labelled with ``name``."""
+    connect_args = dict(connect_args or {})
+    if pool.STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {
+            "statement_timeout": str(pool.STATEMENT_TIMEOUT_MS)
+        }
+    engine = create_async_engine(
+        url=url,
+        echo=settings.db.ECHO,
+        pool_size=pool.SIZE,
+        max_overflow=pool.MAX_OVERFLOW,
+        pool_timeout=pool.TIMEOUT,
+        pool_pre_ping=settings.db.POOL_PRE_PING,
+        pool_recycle=settings.db.POOL_RECYCLE,
+        poolclass=named_pool_class(name),
+        connect_args=connect_args,
+    )
+    _connect_args[engine] = connect_args
+    return engine
+
+
+_connect_args: dict[AsyncEngine, dict] = {}
+
+
+def unpooled_engine(engine: AsyncEngine) -> AsyncEngine:
+    """Engine connecting like ``engine`` without a pool.
+
+    For dedicated connections outside the pools, like EXPLAIN of slow
+    queries; every ``connect()`` opens a new connection.
+    """
+    return create_async_engine(
+        engine.url,
+        echo=settings.db.ECHO,
+        poolclass=NullPool,
+        connect_args=_connect_args.get(engine, {}),
+    )
+
+
+def _sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=settings.db.AUTOFLUSH,
+        expire_on_commit=settings.db.EXPIRE_ON_COMMIT,
+    )
 
 
-async_session = async_sessionmaker(
-    bind=async_engine,
-    autoflush=settings.db.AUTOFLUSH,
-    expire_on_commit=settings.db.EXPIRE_ON_COMMIT,
+async_engine = _create_engine(
+    "storefront",
+    settings.db.DATABASE_URL,
+    PoolSettings(
+        SIZE=settings.db.POOL_SIZE,
+        MAX_OVERFLOW=settings.db.MAX_OVERFLOW,
+        STATEMENT_TIMEOUT_MS=settings.pools.STOREFRONT_STATEMENT_TIMEOUT_MS,
+    ),
 )
 
+# Engines by pool name; without isolation all names share the storefront pool
+engines: dict[str, AsyncEngine] = {"storefront": async_engine}
+for _name, _pool in (
+    ("checkout", settings.pools.CHECKOUT),
+    ("admin", settings.pools.ADMIN),
+    ("background", settings.pools.BACKGROUND),
+):
+    engines[_name] = (
+        _create_engine(_name, settings.db.DATABASE_URL, _pool)
+        if settings.pools.ENABLED
+        else async_engine
+    )
 
-async def get_async_session() -> AsyncGenerator[AsyncSession]:
-    """Provide database session with automatic rollback on error."""
-    async with async_session() as session:
+async_session = _sessionmaker(async_engine)
+checkout_session = _sessionmaker(engines["checkout"])
+admin_session = _sessionmaker(engines["admin"])
+background_session = _sessionmaker(engines["background"])
+
+
+@asynccontextmanager
+async def _scoped(session: AsyncSession) -> AsyncGenerator[AsyncSession]:
+    """Close session afterwards, rolling back on error."""
+    async with session:
         try:
             yield session
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession]:
+    """Provide database session with automatic rollback on error."""
+    async with _scoped(async_session()) as session:
+        yield session
+
+
+async def get_checkout_session() -> AsyncGenerator[AsyncSession]:
+    """Provide session from the checkout pool."""
+    async with _scoped(checkout_session()) as session:
+        yield session
+
+
+async def get_admin_session() -> AsyncGenerator[AsyncSession]:
+    """Provide session from the admin pool."""
+    async with _scoped(admin_session()) as session:
+        yield session
+
+
+replica_engine = (
+    _create_engine(
+        "replica",
+        settings.replica.database_url(settings.db),
+        PoolSettings(
+            SIZE=settings.replica.POOL_SIZE,
+            MAX_OVERFLOW=settings.replica.MAX_OVERFLOW,
+            STATEMENT_TIMEOUT_MS=settings.pools.STOREFRONT_STATEMENT_TIMEOUT_MS,
+        ),
+        connect_args={"timeout": settings.replica.CONNECT_TIMEOUT},
+    )
+    if settings.replica.enabled
+    else None
+)
+
+async_replica_session = (
+    _sessionmaker(replica_engine) if replica_engine is not None else None
+)
+
+replica_health = ReplicaHealth(settings.replica.RETRY_INTERVAL)
+
+
+async def _replica_session(request: Request) -> AsyncSession | None:
+    """Connected replica session, or None when reads must use the primary."""
+    if (
+        async_replica_session is None
+        or not replica_health.available
+        or sticky_to_primary(request.scope)
+    ):
+        return None
+
+    session = async_replica_session()
+    try:
+        # Connect eagerly so an unreachable replica falls back before any query
+        await session.connection()
+    except Exception as exc:
+        await session.close()
+        replica_health.mark_down(exc)
+        return None
+    return session
+
+
+async def get_async_read_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Provide session for read-only handlers.
+
+    Uses the replica when configured and reachable, unless the client wrote
+    within the last ``DB_REPLICA_STICKY_SECONDS``; otherwise the primary.
+    """
+    session = await _replica_session(request) or async_session()
+    async with _scoped(session):
+        yield session
+
+
+def all_engines() -> dict[str, AsyncEngine]:
+    """Distinct engines by pool name, including the replica."""
+    distinct: dict[str, AsyncEngine] = {}
+    for name, engine in engines.items():
+        if engine not in distinct.values():
+            distinct[name] = engine
+    if replica_engine is not None:
+        distinct["replica"] = replica_engine
+    return distinct
+
+
+async def dispose_engines() -> None:
+    """Close pooled connections of every engine."""
+    for engine in all_engines().values():
+        await engine.dispose()
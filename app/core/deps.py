@@ -8,12 +8,18 @@ from jwt import InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.core import get_async_session
+from app.core import (
+    get_async_read_session,
+    get_async_session,
+    get_checkout_session,
+)
 from app.core.security import AuthUtils, http_bearer
-from app.crud import user_crud
-from app.models import User
+from app.core.token_cache import token_cache
+from app.core.user_cache import UserIdentity, user_cache
 
 SessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_async_read_session)]
+CheckoutSessionDep = Annotated[AsyncSession, Depends(get_checkout_session)]
 
 
 async def get_current_token_payload(
@@ -22,9 +28,7 @@ async def get_current_token_payload(
     """Extract and validate JWT token payload."""
     token = credentials.credentials
     try:
-        payload = AuthUtils.decode_jwt(
-            token=token,
-        )
+        payload = token_cache.decode(token)
     except InvalidTokenError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -38,10 +42,10 @@ async def get_current_token_payload(
 async def get_current_user(
     session: SessionDep,
     payload: dict = Depends(get_current_token_payload),  # noqa: B008
-) -> User:
-    """Get current user from JWT payload."""
+) -> UserIdentity:
+    """Get current user identity from JWT payload."""
     user_id: int = int(payload.get("sub"))
-    user = await user_crud.get(session, user_id)
+    user = await user_cache.load(session, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -50,7 +54,9 @@ async def get_current_user(
     return user
 
 
-async def get_active_user(user: User = Depends(get_current_user)):  # noqa: B008
+async def get_active_user(
+    user: UserIdentity = Depends(get_current_user),  # noqa: B008
+) -> UserIdentity:
     """Get current active user."""
     if user.is_active:
         return user
@@ -60,13 +66,15 @@ async def get_active_user(user: User = Depends(get_current_user)):  # noqa: B008
     )
 
 
-async def get_superuser(user: User = Depends(get_active_user)) -> User:  # noqa: B008
+async def get_superuser(
+    user: UserIdentity = Depends(get_active_user),  # noqa: B008
+) -> UserIdentity:
     """Get current superuser."""
     if not user.is_superuser:
         raise HTTPException(403, "Insufficient permissions")
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
-ActiveUser = Annotated[User, Depends(get_active_user)]
-SuperUser = Annotated[User, Depends(get_superuser)]
+CurrentUser = Annotated[UserIdentity, Depends(get_current_user)]
+ActiveUser = Annotated[UserIdentity, Depends(get_active_user)]
+SuperUser = Annotated[UserIdentity, Depends(get_superuser)]
@@ -0,0 +1,218 @@
+"""Fan-out of live updates to Server-Sent Events streams.
+
+Every worker keeps one connection listening on the channel that
+``app.crud.events`` notifies, so a commit in any worker reaches the streams
+of all of them. Each stream collects the latest event per product or order
+and flushes after ``EVENTS_COALESCE`` seconds, so a burst of stock changes
+becomes a single message.
+"""
+
+import asyncio
+import contextlib
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection
+from typing import Any
+
+import asyncpg
+from loguru import logger
+from sqlalchemy.exc import DBAPIError
+
+from app.core import async_engine, settings
+from app.core.config import EventsSettings
+from app.core.database import unpooled_engine
+from app.crud.events import CHANNEL
+
+type EventKey = tuple[str, int]
+type Snapshot = Callable[[], Awaitable[list[dict[str, Any]]]]
+
+RECONNECT_MAX = 30.0
+
+
+def format_event(event: dict[str, Any]) -> str:
+    """SSE message named after the event type."""
+    data = json.dumps(event, separators=(",", ":"))
+    return f"event: {event['type']}\ndata: {data}\n\n"
+
+
+class Subscriber:
+    """Pending events of one stream, the latest per key."""
+
+    def __init__(self, keys: Collection[EventKey]) -> None:
+        self.keys = frozenset(keys)
+        self.pending: dict[EventKey, dict[str, Any]] = {}
+        self.ready = asyncio.Event()
+        # Set when notifications may have been missed, e.g. on reconnect
+        self.stale = False
+
+    def push(self, key: EventKey, event: dict[str, Any]) -> None:
+        self.pending[key] = event
+        self.ready.set()
+
+    def mark_stale(self) -> None:
+        self.stale = True
+        self.ready.set()
+
+    def take(self) -> list[dict[str, Any]]:
+        """Pending events, clearing them."""
+        events = list(self.pending.values())
+        self.pending.clear()
+        self.ready.clear()
+        return events
+
+
+class EventHub:
+    """Listens for notifications and routes them to subscribed streams."""
+
+    def __init__(self, cfg: EventsSettings) -> None:
+        self.cfg = cfg
+        self.subscribers: dict[EventKey, set[Subscriber]] = defaultdict(set)
+        self.streams = 0
+
+    def subscribe(self, keys: Collection[EventKey]) -> Subscriber | None:
+        """Register a stream, None when the worker is at ``MAX_STREAMS``."""
+        if self.streams >= self.cfg.MAX_STREAMS:
+            return None
+        subscriber = Subscriber(keys)
+        for key in subscriber.keys:
+            self.subscribers[key].add(subscriber)
+        self.streams += 1
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        for key in subscriber.keys:
+            streams = self.subscribers.get(key)
+            if streams is None:
+                continue
+            streams.discard(subscriber)
+            if not streams:
+                del self.subscribers[key]
+        self.streams -= 1
+
+    def dispatch(self, events: list[dict[str, Any]]) -> None:
+        for event in events:
+            key = (event["type"], event["id"])
+            for subscriber in self.subscribers.get(key, ()):
+                subscriber.push(key, event)
+
+    def resync(self) -> None:
+        """Have every stream reload its state after a listener outage."""
+        for subscriber in {s for streams in self.subscribers.values() for s in streams}:
+            subscriber.mark_stale()
+
+    async def stream(
+        self,
+        subscriber: Subscriber,
+        initial: list[dict[str, Any]],
+        snapshot: Snapshot,
+    ) -> AsyncIterator[str]:
+        """SSE body: ``initial`` state, then coalesced changes and heartbeats.
+
+        ``snapshot`` reloads the state of the subscribed ids and replaces the
+        pending events whenever the stream may have missed notifications.
+        Unsubscribes when the client disconnects.
+        """
+        try:
+            yield f"retry: {self.cfg.RETRY_MS}\n\n"
+            for event in initial:
+                yield format_event(event)
+            while True:
+                try:
+                    async with asyncio.timeout(self.cfg.HEARTBEAT):
+                        await subscriber.ready.wait()
+                except TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                await asyncio.sleep(self.cfg.COALESCE)
+                events = subscriber.take()
+                if subscriber.stale:
+                    subscriber.stale = False
+                    events = await snapshot()
+                for event in events:
+                    yield format_event(event)
+        finally:
+            self.unsubscribe(subscriber)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            self.dispatch(json.loads(payload))
+        except ValueError, KeyError, TypeError:
+            logger.warning(f"Ignoring malformed {channel} notification: {payload!r}")
+
+    async def _keepalive(self, connection: asyncpg.Connection) -> None:
+        # Notifications arrive in callbacks; the query only detects a dead
+        # connection
+        while True:
+            await asyncio.sleep(self.cfg.HEARTBEAT)
+            await connection.fetchval("SELECT 1")
+
+    async def run(self) -> None:
+        """Listen until cancelled, reconnecting with backoff.
+
+        Connects like the primary engine (same URL and connect arguments),
+        outside its pool so the listener never takes a request connection.
+        """
+        engine = unpooled_engine(async_engine)
+        delay = 1.0
+        connected_before = False
+        try:
+            while True:
+                try:
+                    async with engine.connect() as conn:
+                        raw = await conn.get_raw_connection()
+                        connection: asyncpg.Connection = raw.driver_connection
+                        try:
+                            await connection.add_listener(CHANNEL, self._on_notify)
+                            if connected_before:
+                                self.resync()
+                            connected_before = True
+                            delay = 1.0
+                            await self._keepalive(connection)
+                        finally:
+                            # Terminate, a graceful close waits on a dead socket
+                            await conn.invalidate()
+                except (
+                    OSError,
+                    TimeoutError,
+                    DBAPIError,
+                    asyncpg.PostgresError,
+                    asyncpg.InterfaceError,
+                ) as exc:
+                    logger.warning(
+                        f"Events listener lost its connection: {exc!r}, "
+                        f"reconnecting in {delay:.0f}s"
+                    )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX)
+        finally:
+            await engine.dispose()
+
+
+_hub: EventHub | None = None
+_task: asyncio.Task | None = None
+
+
+def get_hub() -> EventHub | None:
+    """Hub of this worker, None unless ``EVENTS_ENABLED``."""
+    return _hub
+
+
+def start_events() -> None:
+    """Listen for notifications in the background when ``EVENTS_ENABLED``."""
+    global _hub, _task
+    cfg = settings.events
+    if not cfg.ENABLED or _task is not None:
+        return
+    _hub = EventHub(cfg)
+    _task = asyncio.create_task(_hub.run())
+
+
+async def stop_events() -> None:
+    """Stop listening; open streams end when the server closes them."""
+    global _hub, _task
+    if _task is None:
+        return
+    _task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _task
+    _hub = _task = None
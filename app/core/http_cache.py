@@ -0,0 +1,292 @@
+"""HTTP caching headers and edge cache purging."""
+
+import asyncio
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy import inspect, select
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core import settings
+from app.core.database import async_session
+from app.models import Category, Product, Review
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+PRODUCT_LIST_KEY = "product-list"
+CATEGORY_LIST_KEY = "category-list"
+
+# Product fields that change which listing pages a product appears on;
+# the admin form sets the ``category`` relationship instead of the id
+LISTING_FIELDS = frozenset({"is_active", "category_id", "category"})
+
+LISTING_PATHS = frozenset({"/", "/catalog/*"})
+
+
+def product_key(product_id: int) -> str:
+    """Surrogate key for a single product."""
+    return f"product-{product_id}"
+
+
+def category_key(category_id: int) -> str:
+    """Surrogate key for a single category."""
+    return f"category-{category_id}"
+
+
+def product_path(slug: str) -> str:
+    """URL path of a product page."""
+    return f"/product/{slug}"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Shared cache policy for a public HTML page."""
+
+    s_maxage: int
+    max_age: int = settings.cache.BROWSER_MAX_AGE
+    stale_while_revalidate: int = settings.cache.STALE_WHILE_REVALIDATE
+    stale_if_error: int = settings.cache.STALE_IF_ERROR
+
+    @property
+    def cache_control(self) -> str:
+        """Render Cache-Control header value."""
+        return (
+            f"public, max-age={self.max_age}, s-maxage={self.s_maxage}, "
+            f"stale-while-revalidate={self.stale_while_revalidate}, "
+            f"stale-if-error={self.stale_if_error}"
+        )
+
+
+# Keyed by route name
+CACHE_POLICIES: dict[str, CachePolicy] = {
+    "home": CachePolicy(s_maxage=settings.cache.HOME_TTL),
+    "catalog": CachePolicy(s_maxage=settings.cache.CATALOG_TTL),
+    "product_detail": CachePolicy(s_maxage=settings.cache.PRODUCT_TTL),
+}
+
+
+def apply_cache_headers(
+    request: Request,
+    response: Response,
+    keys: Iterable[str],
+) -> Response:
+    """Set Cache-Control and Surrogate-Key headers for the matched route.
+
+    Pages are only shared-cacheable for visitors without session state;
+    anything rendered for a logged-in user, a cart or a flash message
+    stays private.
+    """
+    route = request.scope.get("route")
+    policy = CACHE_POLICIES.get(getattr(route, "name", ""))
+
+    response.headers.append("Vary", "Cookie")
+    if not settings.cache.ENABLED or policy is None or request.session:
+        response.headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+        return response
+
+    response.headers["Cache-Control"] = policy.cache_control
+    response.headers["Surrogate-Key"] = " ".join(sorted(set(keys)))
+    return response
+
+
+@dataclass(frozen=True)
+class PurgeEvent:
+    """Surrogate keys and URL paths invalidated by a write."""
+
+    keys: frozenset[str] = field(default_factory=frozenset)
+    paths: frozenset[str] = field(default_factory=frozenset)
+    # Products whose page path is looked up before purging
+    product_ids: frozenset[int] = field(default_factory=frozenset)
+
+    def __bool__(self) -> bool:
+        return bool(self.keys or self.paths or self.product_ids)
+
+    def __or__(self, other: PurgeEvent) -> PurgeEvent:
+        return PurgeEvent(
+            self.keys | other.keys,
+            self.paths | other.paths,
+            self.product_ids | other.product_ids,
+        )
+
+
+def _with_previous(obj: object, attr: str) -> set:
+    """Current value of ``attr`` and the one replaced by a pending change.
+
+    History is only there until the session flushes, so collect events
+    before commit.
+    """
+    values = {getattr(obj, attr), *inspect(obj).attrs[attr].history.deleted}
+    values.discard(None)
+    return values
+
+
+def purge_event_for(obj: object, changed: Iterable[str] | None = None) -> PurgeEvent:
+    """Build purge event for a written object.
+
+    Args:
+        obj: Created, updated or deleted model instance.
+        changed: Updated field names, ``None`` for create and delete.
+    """
+    keys: set[str] = set()
+    paths: set[str] = set()
+    product_ids: set[int] = set()
+
+    if isinstance(obj, Product):
+        keys.add(product_key(obj.id))
+        paths |= {product_path(slug) for slug in _with_previous(obj, "slug")}
+        if changed is None or LISTING_FIELDS & set(changed):
+            keys.add(PRODUCT_LIST_KEY)
+            keys |= {category_key(c) for c in _with_previous(obj, "category_id")}
+            paths |= LISTING_PATHS
+    elif isinstance(obj, Category):
+        keys.add(category_key(obj.id))
+        if changed is None:
+            keys.add(CATEGORY_LIST_KEY)
+        paths |= LISTING_PATHS
+    elif isinstance(obj, Review):
+        product_ids = _with_previous(obj, "product_id")
+        keys |= {product_key(product_id) for product_id in product_ids}
+
+    return PurgeEvent(frozenset(keys), frozenset(paths), frozenset(product_ids))
+
+
+async def resolve_paths(event: PurgeEvent) -> PurgeEvent:
+    """Add the page paths of ``event.product_ids``, loading their slugs."""
+    if not event.product_ids:
+        return event
+    async with async_session() as session:
+        slugs = await session.scalars(
+            select(Product.slug).where(
+                Product.id.in_(sorted(event.product_ids)), Product.slug.is_not(None)
+            )
+        )
+        paths = {product_path(slug) for slug in slugs}
+    return PurgeEvent(event.keys, event.paths | paths)
+
+
+class CachePurger(ABC):
+    """Base edge cache purger."""
+
+    @abstractmethod
+    async def purge(self, event: PurgeEvent) -> None:
+        """Invalidate cached pages for event."""
+
+
+class NoopPurger(CachePurger):
+    """Local development purger that only logs events."""
+
+    async def purge(self, event: PurgeEvent) -> None:
+        logger.debug(f"Cache purge skipped: keys={sorted(event.keys)}")
+
+
+class HTTPPurger(CachePurger):
+    """Purge by surrogate key through an HTTP endpoint (CDN or Varnish xkey)."""
+
+    def __init__(self, url: str, method: str, token: str, timeout: float) -> None:
+        self.url = url
+        self.method = method
+        self.token = token
+        self.timeout = timeout
+
+    def _send(self, keys: str) -> None:
+        request = urllib.request.Request(self.url, method=self.method)
+        request.add_header("Surrogate-Key", keys)
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    async def purge(self, event: PurgeEvent) -> None:
+        if event.keys:
+            await asyncio.to_thread(self._send, " ".join(sorted(event.keys)))
+
+
+class NginxPurger(CachePurger):
+    """Purge by URL through nginx ``proxy_cache_purge``.
+
+    nginx has no tag based purging, so listing pages that merely contain
+    an updated product expire by TTL unless the write changes listings.
+    """
+
+    def __init__(self, base_url: str, timeout: float) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _send(self, path: str) -> None:
+        request = urllib.request.Request(f"{self.base_url}{path}", method="PURGE")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except urllib.error.HTTPError as exc:
+            # 404 means the page was not cached
+            if exc.code != 404:
+                raise
+
+    async def purge(self, event: PurgeEvent) -> None:
+        for path in sorted(event.paths):
+            await asyncio.to_thread(self._send, path)
+
+
+def build_purger() -> CachePurger:
+    """Create purger configured in settings."""
+    cfg = settings.cache
+    if cfg.PURGER == "http" and cfg.PURGE_URL:
+        return HTTPPurger(
+            cfg.PURGE_URL, cfg.PURGE_METHOD, cfg.PURGE_TOKEN, cfg.PURGE_TIMEOUT
+        )
+    if cfg.PURGER == "nginx" and cfg.PURGE_URL:
+        return NginxPurger(cfg.PURGE_URL, cfg.PURGE_TIMEOUT)
+    return NoopPurger()
+
+
+cache_purger = build_purger()
+
+_pending: set[asyncio.Task] = set()
+
+
+async def _run_purge(event: PurgeEvent) -> None:
+    try:
+        await cache_purger.purge(await resolve_paths(event))
+    except Exception as exc:
+        logger.warning(f"Cache purge failed for {sorted(event.keys)}: {exc}")
+
+
+def collect_purge(
+    objects: Iterable[object],
+    changed: Iterable[str] | None = None,
+) -> PurgeEvent:
+    """Merge purge events for several written objects.
+
+    Call before commit when objects may be expired afterwards.
+    """
+    if changed is not None:
+        changed = frozenset(changed)
+
+    event = PurgeEvent()
+    for obj in objects:
+        event |= purge_event_for(obj, changed)
+    return event
+
+
+def schedule_purge(event: PurgeEvent) -> None:
+    """Send purge event in background without blocking the caller."""
+    if not settings.cache.ENABLED or not event:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(_run_purge(event))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+def purge_objects(*objects: object, changed: Iterable[str] | None = None) -> None:
+    """Schedule edge purge for written objects."""
+    schedule_purge(collect_purge(objects, changed))
@@ -0,0 +1,153 @@
+"""JWT signing key management."""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    load_pem_private_key,
+    load_pem_public_key,
+)
+from jwt.algorithms import get_default_algorithms
+
+from app.core.config import AuthJWTSettings, settings
+
+# Default algorithm per key type, used for verification-only keys
+DEFAULT_ALGORITHMS = {
+    rsa.RSAPublicKey: "RS256",
+    ec.EllipticCurvePublicKey: "ES256",
+    ed25519.Ed25519PublicKey: "EdDSA",
+}
+
+# Members of each JWK type that enter the RFC 7638 thumbprint
+THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+
+def _default_algorithm(public_key: object) -> str:
+    for key_type, algorithm in DEFAULT_ALGORITHMS.items():
+        if isinstance(public_key, key_type):
+            return algorithm
+    raise ValueError(f"Unsupported JWT key type: {type(public_key).__name__}")
+
+
+def _thumbprint(jwk: dict) -> str:
+    """Compute RFC 7638 JWK thumbprint."""
+    members = {name: jwk[name] for name in THUMBPRINT_MEMBERS[jwk["kty"]]}
+    canonical = json.dumps(members, separators=(",", ":"), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True, slots=True)
+class JWTKey:
+    """Parsed public key with optional private part."""
+
+    kid: str
+    algorithm: str
+    public_key: object
+    private_key: object | None
+    jwk: dict
+
+    @classmethod
+    def from_public(
+        cls,
+        public_key: object,
+        algorithm: str | None = None,
+        private_key: object | None = None,
+    ) -> JWTKey:
+        """Build key from cryptography key objects."""
+        algorithm = algorithm or _default_algorithm(public_key)
+        jwk = get_default_algorithms()[algorithm].to_jwk(public_key, as_dict=True)
+        kid = _thumbprint(jwk)
+        jwk.update(kid=kid, alg=algorithm, use="sig")
+        return cls(kid, algorithm, public_key, private_key, jwk)
+
+    @classmethod
+    def from_pem(
+        cls,
+        public_pem: str | bytes,
+        private_pem: str | bytes | None = None,
+        algorithm: str | None = None,
+    ) -> JWTKey:
+        """Build key from PEM encoded keys."""
+        if isinstance(public_pem, str):
+            public_pem = public_pem.encode()
+        if isinstance(private_pem, str):
+            private_pem = private_pem.encode()
+
+        private_key = load_pem_private_key(private_pem, None) if private_pem else None
+        return cls.from_public(load_pem_public_key(public_pem), algorithm, private_key)
+
+
+class KeyManager:
+    """Holds the active signing key and keys accepted for verification.
+
+    Keys are parsed once, so signing and verification skip PEM parsing.
+    Tokens carry the key id in the ``kid`` header; rotating keys means
+    making a new key active while the previous public key stays in
+    ``verification_keys`` until tokens signed with it expire.
+    """
+
+    def __init__(
+        self,
+        signing_key: JWTKey,
+        verification_keys: list[JWTKey] | None = None,
+    ) -> None:
+        if signing_key.private_key is None:
+            raise ValueError("Signing key requires a private key")
+
+        self.signing_key = signing_key
+        self.keys = {signing_key.kid: signing_key}
+        for key in verification_keys or []:
+            self.keys.setdefault(key.kid, key)
+
+    @classmethod
+    def from_settings(cls, cfg: AuthJWTSettings) -> KeyManager:
+        """Load keys configured in settings."""
+        signing_key = JWTKey.from_pem(cfg.public_key, cfg.private_key, cfg.algorithm)
+        verification_keys = [
+            JWTKey.from_pem(Path(path).read_bytes())
+            for path in cfg.previous_public_key_paths
+        ]
+        return cls(signing_key, verification_keys)
+
+    def sign(self, payload: dict) -> str:
+        """Sign payload with the active key."""
+        key = self.signing_key
+        return jwt.encode(
+            payload,
+            key.private_key,
+            key.algorithm,
+            headers={"kid": key.kid},
+        )
+
+    def verify(self, token: str | bytes) -> dict:
+        """Verify token with the key named by its ``kid`` header.
+
+        Tokens without ``kid`` are checked against the active key.
+
+        Raises:
+            jwt.InvalidTokenError: If token is invalid, expired or the key
+                is unknown.
+        """
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self.signing_key if kid is None else self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown key id: {kid}")
+
+        return jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+
+    def jwks(self) -> dict:
+        """Public keys as a JSON Web Key Set."""
+        return {"keys": [key.jwk for key in self.keys.values()]}
+
+
+key_manager = KeyManager.from_settings(settings.auth_jwt)
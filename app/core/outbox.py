@@ -0,0 +1,319 @@
+"""Outbox dispatcher delivering events to external sinks.
+
+Requests only add ``outbox`` rows to their transaction (see
+``app.crud.outbox``); a background task in every worker claims due messages,
+sends them outside any transaction and records the result. Failed sends are
+retried with exponential backoff, so requests never wait on SMTP or webhooks.
+Delivery is at least once: receivers should deduplicate by message id.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import random
+import smtplib
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from email.message import EmailMessage
+
+from loguru import logger
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core import background_session, settings
+from app.core.config import OutboxSettings
+from app.crud.outbox import (
+    OUTBOX_FLAG,
+    Delivery,
+    claim,
+    delete_sent,
+    mark_failed,
+    mark_sent,
+)
+from app.models import User
+
+CLEANUP_INTERVAL = 3600.0
+
+
+class OutboxSink(ABC):
+    """Base delivery target."""
+
+    @abstractmethod
+    async def send(self, delivery: Delivery) -> None:
+        """Deliver message, raising on failure to retry it later."""
+
+
+class LogSink(OutboxSink):
+    """Development sink that only logs events."""
+
+    async def send(self, delivery: Delivery) -> None:
+        logger.info(f"Outbox {delivery.topic} #{delivery.id}: {delivery.payload}")
+
+
+class WebhookSink(OutboxSink):
+    """POST events as JSON, optionally signed with HMAC-SHA256."""
+
+    def __init__(self, url: str, secret: str, timeout: float) -> None:
+        self.url = url
+        self.secret = secret.encode()
+        self.timeout = timeout
+
+    def _send(self, delivery: Delivery) -> None:
+        body = json.dumps(
+            {"id": delivery.id, "topic": delivery.topic, "payload": delivery.payload}
+        ).encode()
+        request = urllib.request.Request(self.url, data=body, method="POST")
+        request.add_header("Content-Type", "application/json")
+        request.add_header("X-Outbox-Id", str(delivery.id))
+        request.add_header("X-Outbox-Topic", delivery.topic)
+        if self.secret:
+            digest = hmac.new(self.secret, body, hashlib.sha256).hexdigest()
+            request.add_header("X-Signature", f"sha256={digest}")
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    async def send(self, delivery: Delivery) -> None:
+        await asyncio.to_thread(self._send, delivery)
+
+
+class EmailSink(OutboxSink):
+    """Order emails to the customer over SMTP.
+
+    Any SMTP server works; locally a debug server such as Mailpit on port
+    1025 shows the messages instead of sending them.
+    """
+
+    # Subject and first line by topic; other topics are not emailed
+    TEMPLATES = {
+        "order.created": (
+            "Order #{order_id} received",
+            "we received your order #{order_id} for {total_price}.",
+        ),
+        "order.status_changed": (
+            "Order #{order_id} is {status}",
+            "your order #{order_id} is now {status}.",
+        ),
+    }
+
+    def __init__(self, cfg: OutboxSettings) -> None:
+        self.cfg = cfg
+
+    async def _recipient(self, user_id: int) -> tuple[str, str] | None:
+        async with background_session() as session:
+            result = await session.execute(
+                select(User.email, User.username).where(User.id == user_id)
+            )
+            row = result.first()
+        return (row.email, row.username) if row else None
+
+    def message(self, delivery: Delivery, email: str, username: str) -> EmailMessage:
+        """Email for a delivery of a templated topic."""
+        subject, line = self.TEMPLATES[delivery.topic]
+        message = EmailMessage()
+        message["From"] = self.cfg.SMTP_SENDER
+        message["To"] = email
+        message["Subject"] = subject.format(**delivery.payload)
+        # Stable id lets mail clients collapse duplicates of a retried send
+        domain = self.cfg.SMTP_SENDER.rpartition("@")[2] or "localhost"
+        message["Message-ID"] = f"<outbox-{delivery.id}@{domain}>"
+        message.set_content(f"Hello {username},\n\n{line.format(**delivery.payload)}\n")
+        return message
+
+    def _send(self, message: EmailMessage) -> None:
+        cfg = self.cfg
+        with smtplib.SMTP(
+            cfg.SMTP_HOST, cfg.SMTP_PORT, timeout=cfg.SEND_TIMEOUT
+        ) as smtp:
+            if cfg.SMTP_STARTTLS:
+                smtp.starttls()
+            if cfg.SMTP_USERNAME:
+                smtp.login(cfg.SMTP_USERNAME, cfg.SMTP_PASSWORD)
+            smtp.send_message(message)
+
+    async def send(self, delivery: Delivery) -> None:
+        if delivery.topic not in self.TEMPLATES:
+            return
+        recipient = await self._recipient(delivery.payload["user_id"])
+        if recipient is None:
+            logger.warning(f"Outbox #{delivery.id}: user no longer exists")
+            return
+        await asyncio.to_thread(self._send, self.message(delivery, *recipient))
+
+
+def build_sinks(cfg: OutboxSettings) -> dict[str, OutboxSink]:
+    """Sinks by name as referenced in ``OUTBOX_ROUTES``."""
+    sinks: dict[str, OutboxSink] = {
+        "log": LogSink(),
+        "email": EmailSink(cfg),
+    }
+    if cfg.WEBHOOK_URL:
+        sinks["webhook"] = WebhookSink(
+            cfg.WEBHOOK_URL, cfg.WEBHOOK_SECRET, cfg.SEND_TIMEOUT
+        )
+    return sinks
+
+
+class OutboxDispatcher:
+    """Claims due messages in batches and delivers them concurrently.
+
+    Every batch is delivered within its lease: the claim is cut to what
+    ``CONCURRENCY`` sends per sink finish in time, and sends still waiting
+    for a slot at the deadline are retried later. A timed out send in a
+    thread cannot be stopped, so it keeps its slot until the thread ends;
+    should it succeed after all, the retry is a duplicate.
+    """
+
+    def __init__(self, sinks: dict[str, OutboxSink], cfg: OutboxSettings) -> None:
+        self.sinks = sinks
+        self.cfg = cfg
+        self.limits = {name: asyncio.Semaphore(cfg.CONCURRENCY) for name in sinks}
+        self.wakeup = asyncio.Event()
+        self._cleaned_at = 0.0
+
+    @property
+    def batch_size(self) -> int:
+        """Messages claimed at once, all sendable within the lease.
+
+        One ``SEND_TIMEOUT`` of the lease is left for recipient lookups and
+        recording the results.
+        """
+        rounds = int(self.cfg.LEASE // self.cfg.SEND_TIMEOUT) - 1
+        return max(1, min(self.cfg.BATCH_SIZE, rounds * self.cfg.CONCURRENCY))
+
+    def retry_delay(self, attempts: int) -> float | None:
+        """Jittered exponential backoff, None once attempts are used up."""
+        if attempts >= self.cfg.MAX_ATTEMPTS:
+            return None
+        delay = min(self.cfg.BACKOFF_BASE * 2 ** (attempts - 1), self.cfg.BACKOFF_MAX)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def deliver(self, delivery: Delivery, deadline: float) -> str | None:
+        """Send one message; returns the error or None on success.
+
+        Waiting for a free slot stops at ``deadline`` (event loop time).
+        """
+        sink = self.sinks.get(delivery.sink)
+        if sink is None:
+            return f"Sink {delivery.sink!r} is not configured"
+        limit = self.limits[delivery.sink]
+        try:
+            async with asyncio.timeout_at(deadline):
+                await limit.acquire()
+        except TimeoutError:
+            return "No free send slot within the lease"
+
+        send = asyncio.ensure_future(sink.send(delivery))
+        send.add_done_callback(lambda task: _release(limit, task))
+        try:
+            async with asyncio.timeout(self.cfg.SEND_TIMEOUT):
+                await asyncio.shield(send)
+        except Exception as exc:
+            return repr(exc)
+        return None
+
+    async def dispatch_batch(self) -> int:
+        """Deliver one batch of due messages, returning how many were claimed."""
+        async with background_session() as session:
+            deliveries = await claim(session, self.batch_size, self.cfg.LEASE)
+            await session.commit()
+        if not deliveries:
+            return 0
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.cfg.LEASE - 2 * self.cfg.SEND_TIMEOUT
+        errors = await asyncio.gather(
+            *(self.deliver(delivery, deadline) for delivery in deliveries)
+        )
+        async with background_session() as session:
+            results = list(zip(deliveries, errors, strict=True))
+            sent = [delivery for delivery, error in results if error is None]
+            if sent and await mark_sent(session, sent) < len(sent):
+                logger.warning("Outbox lease ran out before results were recorded")
+            for delivery, error in results:
+                if error is None:
+                    continue
+                retry_in = self.retry_delay(delivery.attempts)
+                logger.warning(
+                    f"Outbox #{delivery.id} to {delivery.sink} failed "
+                    f"(attempt {delivery.attempts}): {error}"
+                    + ("" if retry_in is not None else ", giving up")
+                )
+                await mark_failed(session, delivery, error, retry_in)
+            await session.commit()
+        return len(deliveries)
+
+    async def cleanup(self) -> None:
+        """Hourly removal of delivered messages past retention."""
+        if time.monotonic() - self._cleaned_at < CLEANUP_INTERVAL:
+            return
+        self._cleaned_at = time.monotonic()
+        async with background_session() as session:
+            deleted = await delete_sent(
+                session, timedelta(days=self.cfg.RETENTION_DAYS)
+            )
+            await session.commit()
+        if deleted:
+            logger.debug(f"Outbox cleanup removed {deleted} sent messages")
+
+    async def run(self) -> None:
+        """Dispatch until cancelled, sleeping while the queue is empty."""
+        while True:
+            try:
+                claimed = await self.dispatch_batch()
+                await self.cleanup()
+            except Exception as exc:
+                logger.warning(f"Outbox dispatch failed: {exc!r}")
+                claimed = 0
+            if claimed < self.batch_size:
+                # Commits in this worker wake us early, others are polled
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self.cfg.POLL_INTERVAL):
+                        await self.wakeup.wait()
+                self.wakeup.clear()
+
+
+def _release(limit: asyncio.Semaphore, send: asyncio.Future) -> None:
+    limit.release()
+    if not send.cancelled():
+        # Failures after the timeout were already reported as the timeout
+        send.exception()
+
+
+_dispatcher: OutboxDispatcher | None = None
+_task: asyncio.Task | None = None
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session: Session) -> None:
+    if session.info.pop(OUTBOX_FLAG, False) and _dispatcher is not None:
+        _dispatcher.wakeup.set()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_messages(session: Session) -> None:
+    session.info.pop(OUTBOX_FLAG, None)
+
+
+def start_outbox() -> None:
+    """Run the dispatcher in the background when ``OUTBOX_ENABLED``."""
+    global _dispatcher, _task
+    cfg = settings.outbox
+    if not cfg.ENABLED or _task is not None:
+        return
+    _dispatcher = OutboxDispatcher(build_sinks(cfg), cfg)
+    _task = asyncio.create_task(_dispatcher.run())
+
+
+async def stop_outbox() -> None:
+    """Cancel the dispatcher; claimed messages are retried after the lease."""
+    global _dispatcher, _task
+    if _task is None:
+        return
+    _task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _task
+    _dispatcher = _task = None
@@ -0,0 +1,138 @@
+"""Read replica routing with read-your-writes stickiness."""
+
+import math
+import time
+
+import itsdangerous
+from itsdangerous.exc import BadSignature
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Scope key of the middleware, so read sessions can check the cookie lazily
+STICKY_SCOPE_KEY = "read_your_writes"
+# Key of scope["state"] telling whether an unsafe request wrote; unset means
+# it did whenever it succeeded. Handlers running several calls set it.
+WROTE_STATE_KEY = "wrote_to_primary"
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReplicaHealth:
+    """Remembers a failed replica connect and routes reads to the primary
+    until ``retry_interval`` has passed."""
+
+    def __init__(self, retry_interval: float) -> None:
+        self.retry_interval = retry_interval
+        self.down_until = 0.0
+        self.fallbacks = 0
+
+    @property
+    def available(self) -> bool:
+        """Whether the replica should be tried."""
+        return time.monotonic() >= self.down_until
+
+    def mark_down(self, exc: BaseException) -> None:
+        """Skip replica for ``retry_interval`` seconds."""
+        if self.available:
+            logger.warning(
+                f"Read replica unavailable, using primary for "
+                f"{self.retry_interval:.0f}s: {exc!r}"
+            )
+        self.down_until = time.monotonic() + self.retry_interval
+        self.fallbacks += 1
+
+
+def record_write(scope: Scope, wrote: bool = True) -> None:
+    """Record whether the request wrote to the primary.
+
+    After ``True`` reads of the same request go to the primary, and the
+    middleware pins the client's next reads; after ``False`` it does not,
+    even for an unsafe method.
+    """
+    scope.setdefault("state", {})[WROTE_STATE_KEY] = wrote
+
+
+def sticky_to_primary(scope: Scope) -> bool:
+    """Whether the client wrote recently and must read from the primary."""
+    if scope.get("state", {}).get(WROTE_STATE_KEY):
+        return True
+    middleware = scope.get(STICKY_SCOPE_KEY)
+    return middleware is not None and middleware.sticky(scope)
+
+
+class ReadYourWritesMiddleware:
+    """Pins the client's reads to the primary after a successful write.
+
+    Any unsafe method answered with a non-error status sets a small signed
+    cookie holding a deadline, unless the handler recorded that it wrote
+    nothing (see :func:`record_write`), independent of the cookie session, so JSON
+    API paths without a session are covered too. Replica lag shorter than
+    ``sticky_seconds`` is then invisible to the writer. The cookie is only
+    verified when a read session is requested and the request carries it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        secret_key: str,
+        sticky_seconds: float,
+        cookie_name: str = "primary_until",
+        same_site: str = "lax",
+        https_only: bool = False,
+    ) -> None:
+        self.app = app
+        self.signer = itsdangerous.Signer(str(secret_key), salt="read-your-writes")
+        self.sticky_seconds = sticky_seconds
+        self.cookie_name = cookie_name
+        self.security_flags = f"httponly; samesite={same_site}"
+        if https_only:
+            self.security_flags += "; secure"
+
+    def sticky(self, scope: Scope) -> bool:
+        """Whether the request carries an unexpired write deadline."""
+        marker = f"{self.cookie_name}=".encode()
+        for name, value in scope["headers"]:
+            if name != b"cookie" or marker not in value:
+                continue
+            cookie = cookie_parser(value.decode("latin-1")).get(self.cookie_name)
+            if cookie is None:
+                continue
+            try:
+                deadline = float(self.signer.unsign(cookie))
+            except BadSignature, ValueError:
+                return False
+            return deadline > time.time()
+        return False
+
+    def _cookie_header(self) -> str:
+        deadline = time.time() + self.sticky_seconds
+        signed = self.signer.sign(f"{deadline:.3f}").decode()
+        return (
+            f"{self.cookie_name}={signed}; path=/; "
+            f"Max-Age={math.ceil(self.sticky_seconds)}; {self.security_flags}"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        scope[STICKY_SCOPE_KEY] = self
+        if scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and scope.get("state", {}).get(WROTE_STATE_KEY, True)
+            ):
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie", self._cookie_header()
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,57 @@
+"""Background job keeping the daily sales rollups current.
+
+Every worker runs the loop; an advisory lock in ``app.crud.sales.roll_up``
+lets one of them do the work at a time. After a full batch, for example
+while the first run backfills the history, the next batch starts right away.
+"""
+
+import asyncio
+import contextlib
+
+from loguru import logger
+
+from app.core import background_session, settings
+from app.crud import roll_up
+
+_task: asyncio.Task | None = None
+
+
+async def run_rollups() -> None:
+    """Roll up until cancelled."""
+    cfg = settings.rollup
+    while True:
+        more = False
+        try:
+            async with background_session() as session:
+                run = await roll_up(session, cfg.LAG, cfg.BATCH_SIZE)
+                await session.commit()
+            if run is not None:
+                more = run.more
+                if run.days:
+                    logger.debug(
+                        f"Sales rollup rebuilt {len(run.days)} days "
+                        f"up to {run.watermark:%Y-%m-%d %H:%M:%S}"
+                    )
+        except Exception as exc:
+            logger.warning(f"Sales rollup failed: {exc!r}")
+        if not more:
+            await asyncio.sleep(cfg.INTERVAL)
+
+
+def start_rollups() -> None:
+    """Run the rollup job in the background when ``ROLLUP_ENABLED``."""
+    global _task
+    if not settings.rollup.ENABLED or _task is not None:
+        return
+    _task = asyncio.create_task(run_rollups())
+
+
+async def stop_rollups() -> None:
+    """Cancel the job; an interrupted run is rolled back and redone."""
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _task
+    _task = None
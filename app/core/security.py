@@ -1,5 +1,8 @@
 """Authentication and security utilities."""
 
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 import jwt
@@ -8,10 +11,77 @@ from fastapi.security import HTTPBearer
 from passlib.context import CryptContext
 
 from app.core import settings
+from app.core.keys import key_manager
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 http_bearer = HTTPBearer()
+# For endpoints that also accept the cookie session or anonymous clients
+optional_http_bearer = HTTPBearer(auto_error=False)
+
+
+class PasswordHashExecutor:
+    """Runs bcrypt in a dedicated thread pool with a bounded queue.
+
+    bcrypt releases the GIL, so hashing proceeds in parallel without
+    blocking the event loop. When more than ``workers + max_queue`` calls
+    are pending, new calls fail fast with 503 instead of piling up.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_pending = workers + max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hash",
+        )
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a free worker."""
+        return max(0, self.pending - self.workers)
+
+    async def run[T](self, func: Callable[..., T], *args) -> T:
+        """Run hashing function in the pool.
+
+        Raises:
+            HTTPException: 503 if the queue is full.
+        """
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many authentication requests, try again later",
+                headers={"Retry-After": "1"},
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+
+    def stats(self) -> dict:
+        """Pool statistics for monitoring."""
+        return {
+            "workers": self.workers,
+            "in_progress": self.pending - self.queued,
+            "queued": self.queued,
+            "max_queue": self.max_pending - self.workers,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+password_executor = PasswordHashExecutor(
+    workers=settings.auth_jwt.password_hash_workers,
+    max_queue=settings.auth_jwt.password_hash_queue,
+)
 
 
 class AuthUtils:
@@ -27,15 +97,29 @@ class AuthUtils:
         """Verify password against hash."""
         return pwd_context.verify(password, hashed)
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash password in the password hashing pool."""
+        return await password_executor.run(pwd_context.hash, password)
+
+    @staticmethod
+    async def verify_password_async(password: str, hashed: str) -> bool:
+        """Verify password in the password hashing pool."""
+        return await password_executor.run(pwd_context.verify, password, hashed)
+
     @staticmethod
     def encode_jwt(
         payload: dict,
-        private_key: str = settings.auth_jwt.private_key,
-        algorithm: str = settings.auth_jwt.algorithm,
+        private_key: str | None = None,
+        algorithm: str | None = None,
         expire_minutes: int = settings.auth_jwt.access_token_expire_minutes,
         expire_timedelta: timedelta | None = None,
     ):
-        """Encode JWT token with expiration."""
+        """Encode JWT token with expiration.
+
+        Signs with the active key of ``key_manager`` unless an explicit
+        PEM private key is given.
+        """
         to_encode = payload.copy()
         now = datetime.now(UTC)
         if expire_timedelta:
@@ -46,24 +130,34 @@ class AuthUtils:
             exp=expire,
             iat=now,
         )
+        if private_key is None:
+            return key_manager.sign(to_encode)
+
         encoded = jwt.encode(
             to_encode,
             private_key,
-            algorithm,
+            algorithm or settings.auth_jwt.algorithm,
         )
         return encoded
 
     @staticmethod
     def decode_jwt(
         token: str | bytes,
-        public_key: str = settings.auth_jwt.public_key,
-        algorithm: str = settings.auth_jwt.algorithm,
+        public_key: str | None = None,
+        algorithm: str | None = None,
     ):
-        """Decode and verify JWT token."""
+        """Decode and verify JWT token.
+
+        Verifies against ``key_manager`` keys by ``kid`` unless an explicit
+        PEM public key is given.
+        """
+        if public_key is None:
+            return key_manager.verify(token)
+
         decoded = jwt.decode(
             token,
             public_key,
-            algorithms=[algorithm],
+            algorithms=[algorithm or settings.auth_jwt.algorithm],
         )
         return decoded
 
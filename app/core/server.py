@@ -0,0 +1,199 @@
+"""Production server launcher and worker resource limits."""
+
+import asyncio
+import contextlib
+import importlib.util
+import os
+import resource
+import signal
+import tempfile
+from pathlib import Path
+
+import uvicorn
+from loguru import logger
+
+from app.core.config import settings
+
+# Environment variables holding (size, max overflow) of each pool
+POOL_ENV = {
+    "storefront": ("DB_POOL_SIZE", "DB_MAX_OVERFLOW"),
+    "checkout": ("DB_POOLS_CHECKOUT__SIZE", "DB_POOLS_CHECKOUT__MAX_OVERFLOW"),
+    "admin": ("DB_POOLS_ADMIN__SIZE", "DB_POOLS_ADMIN__MAX_OVERFLOW"),
+    "background": ("DB_POOLS_BACKGROUND__SIZE", "DB_POOLS_BACKGROUND__MAX_OVERFLOW"),
+}
+
+type PoolSizes = dict[str, tuple[int, int]]
+
+
+def worker_count(requested: int = 0) -> int:
+    """Requested worker count, or one worker per available CPU."""
+    if requested > 0:
+        return requested
+    return os.process_cpu_count() or 1
+
+
+def configured_pools() -> PoolSizes:
+    """Size and max overflow of each primary database pool of a worker."""
+    pools = {"storefront": (settings.db.POOL_SIZE, settings.db.MAX_OVERFLOW)}
+    if settings.pools.ENABLED:
+        for name in ("checkout", "admin", "background"):
+            cfg = getattr(settings.pools, name.upper())
+            pools[name] = (cfg.SIZE, cfg.MAX_OVERFLOW)
+    return pools
+
+
+def dedicated_connections() -> int:
+    """Primary database connections a worker opens outside its pools."""
+    count = 0
+    if settings.events.ENABLED:
+        # LISTEN connection of the live updates hub
+        count += 1
+    if settings.db.SLOW_QUERY_MS > 0 and settings.db.SLOW_QUERY_EXPLAIN:
+        # One EXPLAIN of a slow query at a time
+        count += 1
+    return count
+
+
+def size_pools(workers: int) -> PoolSizes:
+    """Scale pools down so all workers fit the connection budget.
+
+    The budget is ``SERVER_DB_MAX_CONNECTIONS`` minus reserved connections,
+    shared by ``workers`` in each of ``SERVER_INSTANCES`` containers, minus
+    the connections each worker opens outside its pools. Pools shrink
+    proportionally, keeping at least one connection each.
+
+    Raises:
+        ValueError: If the budget cannot give every pool one connection.
+    """
+    cfg = settings.server
+    budget = (cfg.DB_MAX_CONNECTIONS - cfg.DB_RESERVED_CONNECTIONS) // (
+        workers * cfg.INSTANCES
+    ) - dedicated_connections()
+    pools = configured_pools()
+    if budget < len(pools):
+        raise ValueError(
+            f"{budget} pooled connections per worker cannot serve {len(pools)} "
+            f"pools; lower the worker count or raise SERVER_DB_MAX_CONNECTIONS"
+        )
+
+    demand = sum(size + overflow for size, overflow in pools.values())
+    if demand <= budget:
+        return pools
+
+    scale = budget / demand
+    sized = {
+        name: [max(1, int(size * scale)), int(overflow * scale)]
+        for name, (size, overflow) in pools.items()
+    }
+    # Rounding up to one connection may overshoot, trim the largest pools
+    while sum(map(sum, sized.values())) > budget:
+        largest = max(sized.values(), key=sum)
+        if largest[1]:
+            largest[1] -= 1
+        else:
+            largest[0] -= 1
+    return {name: (size, overflow) for name, (size, overflow) in sized.items()}
+
+
+def pool_env(pools: PoolSizes) -> dict[str, str]:
+    """Environment overrides applying pool sizes in worker processes."""
+    env = {}
+    for name, (size, overflow) in pools.items():
+        size_var, overflow_var = POOL_ENV[name]
+        env[size_var] = str(size)
+        env[overflow_var] = str(overflow)
+    return env
+
+
+def _prepare_metrics_dir(workers: int) -> None:
+    """Make workers share metrics, dropping snapshots of a previous run."""
+    directory = settings.metrics.MULTIPROC_DIR
+    if directory is None:
+        if workers > 1 and settings.metrics.ENABLED:
+            directory = Path(tempfile.mkdtemp(prefix="web-shop-metrics-"))
+            os.environ["METRICS_MULTIPROC_DIR"] = str(directory)
+        return
+
+    for stale in directory.glob("*.json"):
+        stale.unlink(missing_ok=True)
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def run_production(workers: int = 0, port: int | None = None) -> None:
+    """Start uvicorn with several workers sized for the database budget.
+
+    Workers exit after ``SERVER_MAX_REQUESTS`` requests or when their memory
+    exceeds ``SERVER_MAX_MEMORY_MB`` and the uvicorn supervisor starts a
+    replacement. uvloop and httptools are used when installed.
+    """
+    cfg = settings.server
+    workers = worker_count(workers or cfg.WORKERS)
+    pools = size_pools(workers)
+    os.environ.update(pool_env(pools))
+    _prepare_metrics_dir(workers)
+
+    loop = "uvloop" if _available("uvloop") else "asyncio"
+    http = "httptools" if _available("httptools") else "h11"
+    logger.info(
+        f"Starting {workers} workers (loop={loop}, http={http}), "
+        f"pools per worker: {pools}"
+    )
+    uvicorn.run(
+        "main:app",
+        host=cfg.HOST,
+        port=port or cfg.PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        limit_max_requests=cfg.MAX_REQUESTS or None,
+        timeout_graceful_shutdown=cfg.GRACEFUL_TIMEOUT,
+    )
+
+
+def rss_bytes() -> int:
+    """Resident memory of this process."""
+    with contextlib.suppress(OSError), open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    # Peak instead of current RSS where /proc is missing (kilobytes on Linux)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+async def _watch_memory(limit: int, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        rss = rss_bytes()
+        if rss > limit:
+            logger.warning(
+                f"Worker {os.getpid()} uses {rss // 2**20} MB, "
+                f"over SERVER_MAX_MEMORY_MB, restarting gracefully"
+            )
+            # uvicorn finishes in-flight requests, the supervisor replaces us
+            os.kill(os.getpid(), signal.SIGTERM)
+            return
+
+
+_watchdog: asyncio.Task | None = None
+
+
+def start_memory_watchdog() -> None:
+    """Restart worker when it grows past ``SERVER_MAX_MEMORY_MB``."""
+    global _watchdog
+    cfg = settings.server
+    if cfg.MAX_MEMORY_MB > 0 and _watchdog is None:
+        _watchdog = asyncio.create_task(
+            _watch_memory(cfg.MAX_MEMORY_MB * 2**20, cfg.MEMORY_CHECK_INTERVAL)
+        )
+
+
+async def stop_memory_watchdog() -> None:
+    """Cancel memory watchdog."""
+    global _watchdog
+    if _watchdog is None:
+        return
+    _watchdog.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _watchdog
+    _watchdog = None
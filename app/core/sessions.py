@@ -0,0 +1,167 @@
+"""Signed cookie sessions decoded on first use.
+
+Cookies are compatible with Starlette's ``SessionMiddleware``: base64 JSON
+signed with a ``TimestampSigner`` keyed by the same secret.
+"""
+
+import json
+import time
+from base64 import b64decode, b64encode
+from collections.abc import Iterable, Iterator, MutableMapping
+from typing import Any
+
+import itsdangerous
+from itsdangerous.exc import BadSignature
+from starlette.datastructures import MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class LazySession(MutableMapping[str, Any]):
+    """Session data, verified and decoded only when first read or written."""
+
+    def __init__(
+        self,
+        scope: Scope,
+        cookie_name: str,
+        signer: itsdangerous.TimestampSigner,
+        max_age: int | None,
+    ) -> None:
+        self._scope = scope
+        self._cookie_name = cookie_name
+        self._signer = signer
+        self._max_age = max_age
+        self._data: dict[str, Any] | None = None
+        # Decoded JSON of the incoming cookie, None without a valid one
+        self._original: bytes | None = None
+        self._signed_at = 0.0
+
+    def _cookie(self) -> str | None:
+        for name, value in self._scope["headers"]:
+            if name == b"cookie":
+                return cookie_parser(value.decode("latin-1")).get(self._cookie_name)
+        return None
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = {}
+            cookie = self._cookie()
+            if cookie:
+                try:
+                    payload, signed_at = self._signer.unsign(
+                        cookie, max_age=self._max_age, return_timestamp=True
+                    )
+                    original = b64decode(payload)
+                    self._data = json.loads(original)
+                except BadSignature, ValueError:
+                    return self._data
+                self._original = original
+                self._signed_at = signed_at.timestamp()
+        return self._data
+
+    @property
+    def had_cookie(self) -> bool:
+        """Whether the request carried a valid session cookie."""
+        return self._original is not None
+
+    def encode(self) -> bytes | None:
+        """JSON to store when the cookie must be (re)sent, else None.
+
+        The cookie is sent when the contents changed, or when more than half
+        of ``max_age`` has passed so active sessions keep sliding expiry.
+        """
+        if self._data is None:
+            return None
+        data = json.dumps(self._data).encode()
+        if data != (self._original or b"{}"):
+            return data
+        stale = time.time() - self._signed_at > (self._max_age or 0) / 2
+        if self._max_age and self._data and stale:
+            return data
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._load()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class LazySessionMiddleware:
+    """Session middleware that does no work unless a handler uses the session.
+
+    Requests under ``exclude_paths`` get no session at all. Elsewhere the
+    cookie is verified on first access to ``request.session`` and
+    ``Set-Cookie`` is only sent when the contents changed, so responses of
+    handlers that never touch the session stay cacheable.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        secret_key: str,
+        session_cookie: str = "session",
+        max_age: int | None = 14 * 24 * 60 * 60,
+        path: str = "/",
+        same_site: str = "lax",
+        https_only: bool = False,
+        exclude_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.signer = itsdangerous.TimestampSigner(str(secret_key))
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.exclude_paths = tuple(prefix.rstrip("/") for prefix in exclude_paths)
+        self.security_flags = f"httponly; samesite={same_site}"
+        if https_only:
+            self.security_flags += "; secure"
+
+    def _excluded(self, path: str) -> bool:
+        return any(
+            path == prefix or path.startswith(prefix + "/")
+            for prefix in self.exclude_paths
+        )
+
+    def _cookie_header(self, value: str, expiry: str) -> str:
+        return (
+            f"{self.session_cookie}={value}; path={self.path}; "
+            f"{expiry}{self.security_flags}"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket") or self._excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        session = LazySession(scope, self.session_cookie, self.signer, self.max_age)
+        scope["session"] = session
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                data = session.encode()
+                if data is not None and session:
+                    signed = self.signer.sign(b64encode(data)).decode()
+                    max_age = f"Max-Age={self.max_age}; " if self.max_age else ""
+                    MutableHeaders(scope=message).append(
+                        "Set-Cookie", self._cookie_header(signed, max_age)
+                    )
+                elif data is not None and session.had_cookie:
+                    MutableHeaders(scope=message).append(
+                        "Set-Cookie",
+                        self._cookie_header(
+                            "null", "expires=Thu, 01 Jan 1970 00:00:00 GMT; "
+                        ),
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,5 +1,22 @@
 """Jinja2 templates configuration."""
 
+import time
+
 from fastapi.templating import Jinja2Templates
 
-templates = Jinja2Templates(directory="app/templates")
+from app.monitoring.metrics import TEMPLATE_RENDER
+
+
+class InstrumentedTemplates(Jinja2Templates):
+    """Jinja2 templates recording render time per template."""
+
+    def TemplateResponse(self, *args, **kwargs):  # noqa: N802
+        start = time.perf_counter()
+        response = super().TemplateResponse(*args, **kwargs)
+        TEMPLATE_RENDER.observe(
+            time.perf_counter() - start, template=response.template.name
+        )
+        return response
+
+
+templates = InstrumentedTemplates(directory="app/templates")
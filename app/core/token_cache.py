@@ -0,0 +1,104 @@
+"""Bounded LRU cache of verified JWT claims."""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.security import AuthUtils
+
+
+class VerifiedTokenCache:
+    """LRU of tokens whose signature was already verified.
+
+    Entries are keyed by SHA-256 of the raw token, so tokens themselves are
+    never kept in memory, and are dropped as soon as their ``exp`` passes.
+    Tokens without ``exp`` or with a future ``nbf`` are never cached.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str | bytes) -> bytes:
+        if isinstance(token, str):
+            token = token.encode()
+        return hashlib.sha256(token).digest()
+
+    def get(self, token: str | bytes) -> dict | None:
+        """Return cached claims for token if still valid."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        exp, claims = entry
+        if time.time() >= exp:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return dict(claims)
+
+    def put(self, token: str | bytes, claims: dict) -> None:
+        """Store verified claims for token."""
+        if self.maxsize <= 0:
+            return
+
+        exp = claims.get("exp")
+        nbf = claims.get("nbf")
+        now = time.time()
+        if not isinstance(exp, int | float) or exp <= now:
+            return
+        if isinstance(nbf, int | float) and nbf > now:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (float(exp), dict(claims))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def decode(self, token: str | bytes) -> dict:
+        """Decode token, skipping signature verification on cache hit.
+
+        Raises:
+            jwt.InvalidTokenError: If token is invalid or expired.
+        """
+        claims = self.get(token)
+        if claims is not None:
+            self.hits += 1
+            return claims
+
+        self.misses += 1
+        claims = AuthUtils.decode_jwt(token)
+        self.put(token, claims)
+        return claims
+
+    def evict(self, token: str | bytes) -> None:
+        """Drop a single token, e.g. on logout or revocation."""
+        self._entries.pop(self._key(token), None)
+
+    def evict_subject(self, sub: str | int) -> None:
+        """Drop all cached tokens issued for subject."""
+        sub = str(sub)
+        stale = [
+            key
+            for key, (_, claims) in self._entries.items()
+            if claims.get("sub") == sub
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached tokens, e.g. after signing key rotation."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = VerifiedTokenCache(settings.auth_jwt.verified_token_cache_size)
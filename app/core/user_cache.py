@@ -0,0 +1,123 @@
+"""Short-lived cache of authenticated user identities."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import User
+
+
+@dataclass(frozen=True, slots=True)
+class UserIdentity:
+    """Read-only snapshot of user fields needed for authorization."""
+
+    id: int
+    username: str
+    email: str
+    is_active: bool
+    is_superuser: bool
+    created_at: datetime | None = None
+
+    @classmethod
+    def from_user(cls, user: User) -> UserIdentity:
+        """Snapshot ORM user."""
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            created_at=user.created_at,
+        )
+
+
+class UserCache:
+    """TTL cache of user identities keyed by user id.
+
+    Writes through ``UserCrud`` and the admin panel invalidate entries in
+    the current process; other workers see changes, including deactivation,
+    after at most ``ttl`` seconds.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[int, tuple[float, UserIdentity]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> UserIdentity | None:
+        """Return cached identity if not expired."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, identity = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[user_id]
+            return None
+
+        self._entries.move_to_end(user_id)
+        return identity
+
+    def put(self, identity: UserIdentity) -> None:
+        """Store identity for ``ttl`` seconds."""
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._entries[identity.id] = (time.monotonic() + self.ttl, identity)
+        self._entries.move_to_end(identity.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop cached identity after user changes."""
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached identities."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load(self, session: AsyncSession, user_id: int) -> UserIdentity | None:
+        """Get identity from cache, falling back to the database."""
+        identity = self.get(user_id)
+        if identity is not None:
+            self.hits += 1
+            return identity
+
+        self.misses += 1
+        user = await session.get(User, user_id)
+        if user is None:
+            return None
+
+        identity = UserIdentity.from_user(user)
+        self.put(identity)
+        return identity
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Cache statistics for monitoring."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+user_cache = UserCache(
+    ttl=settings.auth_jwt.user_cache_ttl,
+    maxsize=settings.auth_jwt.user_cache_size,
+)
@@ -0,0 +1,117 @@
+"""Startup warm-up and readiness state."""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core import async_session, settings, templates
+from app.core.database import all_engines
+from app.crud import category_crud, product_crud
+
+
+class Readiness:
+    """Whether this worker finished warming up and should get traffic."""
+
+    def __init__(self) -> None:
+        self.ready = False
+
+
+readiness = Readiness()
+
+_task: asyncio.Task | None = None
+
+
+async def open_connections(engine: AsyncEngine, count: int) -> None:
+    """Open up to ``count`` pool connections at once and return them idle."""
+    count = min(count, engine.pool.size())
+    async with contextlib.AsyncExitStack() as stack:
+        for _ in range(count):
+            conn = await stack.enter_async_context(engine.connect())
+            await conn.execute(text("SELECT 1"))
+
+
+def compile_templates() -> int:
+    """Compile every page template into the Jinja cache."""
+    env = templates.env
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+async def prime_queries() -> None:
+    """Run the queries behind the home page and category navigation."""
+    async with async_session() as session:
+        await category_crud.get_categories_with_product_count(session)
+        await product_crud.search_products(
+            session=session, only_active=True, sort_by="newest", limit=8
+        )
+
+
+async def request_pages(app: FastAPI, pages: list[str]) -> None:
+    """Render pages in process so every code path has run once."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as c:
+        for path in pages:
+            response = await c.get(path)
+            if response.status_code >= 400:
+                logger.warning(f"Warm-up request {path} -> {response.status_code}")
+
+
+async def _step(name: str, work: Awaitable) -> None:
+    """Run one warm-up step; failures are logged and do not block startup."""
+    start = time.perf_counter()
+    try:
+        await work
+    except Exception as exc:
+        logger.warning(f"Warm-up {name} failed: {exc!r}")
+        return
+    logger.debug(f"Warm-up {name} took {time.perf_counter() - start:.2f}s")
+
+
+async def warm_up(app: FastAPI) -> None:
+    """Warm pools, templates and caches, then mark the worker ready."""
+    cfg = settings.warmup
+    start = time.perf_counter()
+    if cfg.ENABLED:
+        try:
+            async with asyncio.timeout(cfg.TIMEOUT):
+                for name, engine in all_engines().items():
+                    await _step(
+                        f"{name} pool", open_connections(engine, cfg.CONNECTIONS)
+                    )
+                await _step("templates", asyncio.to_thread(compile_templates))
+                await _step("queries", prime_queries())
+                if cfg.PAGES:
+                    await _step("pages", request_pages(app, cfg.PAGES))
+        except TimeoutError:
+            logger.warning(f"Warm-up did not finish in {cfg.TIMEOUT:.0f}s")
+
+    readiness.ready = True
+    logger.info(f"Ready after {time.perf_counter() - start:.2f}s warm-up")
+
+
+def start_warmup(app: FastAPI) -> None:
+    """Warm up in the background; ``/health/ready`` answers 503 until done."""
+    global _task
+    readiness.ready = False
+    _task = asyncio.create_task(warm_up(app))
+
+
+async def stop_warmup() -> None:
+    """Report not ready and cancel an unfinished warm-up."""
+    global _task
+    readiness.ready = False
+    if _task is None:
+        return
+    _task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _task
+    _task = None
@@ -6,7 +6,9 @@ from app.crud.order import order_crud
 from app.crud.order_item import order_item_crud
 from app.crud.product import product_crud
 from app.crud.review import review_crud
+from app.crud.sales import roll_up
 from app.crud.user import user_crud
+from app.crud.user_stats import recompute_user_stats
 
 __all__ = [
     "BaseCrud",
@@ -16,4 +18,6 @@ __all__ = [
     "order_crud",
     "order_item_crud",
     "review_crud",
+    "recompute_user_stats",
+    "roll_up",
 ]
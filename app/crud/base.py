@@ -1,12 +1,16 @@
 """Base CRUD operations class."""
 
+from collections.abc import AsyncIterator, Sequence
+
 from loguru import logger
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
+from app.core.http_cache import collect_purge, purge_objects, schedule_purge
+
 
 class BaseCrud[
     ModelType: DeclarativeBase,
@@ -45,12 +49,19 @@ class BaseCrud[
         self,
         session: AsyncSession,
         obj_in: CreateSchemaType,
+        **values: object,
     ) -> ModelType:
-        """Create new object."""
-        data = self._prepare_create_data(obj_in)
+        """Create new object.
+
+        ``values`` are extra column values computed by the caller, e.g. a
+        password hash, and override fields of ``obj_in``.
+        """
+        data = self._prepare_create_data(obj_in) | values
         obj = self.model(**data)
         session.add(obj)
-        return await self._commit_refresh(session, obj)
+        obj = await self._commit_refresh(session, obj)
+        purge_objects(obj)
+        return obj
 
     async def get(
         self,
@@ -60,17 +71,72 @@ class BaseCrud[
         """Get object by ID."""
         return await session.get(self.model, obj_id)
 
+    async def _project(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        fields: Sequence[str],
+    ) -> list[dict]:
+        """Run ``select(model)`` statement reading only ``fields`` columns.
+
+        Rows come back as plain dicts without building ORM instances.
+        """
+        columns = [getattr(self.model, name) for name in fields]
+        result = await session.execute(stmt.with_only_columns(*columns))
+        return [dict(row) for row in result.mappings()]
+
     async def get_multi(
         self,
         session: AsyncSession,
         offset: int = 0,
         limit: int = 25,
-    ) -> list[ModelType]:
-        """Get multiple objects with pagination."""
+        fields: Sequence[str] | None = None,
+    ) -> list[ModelType] | list[dict]:
+        """Get multiple objects with pagination.
+
+        With ``fields``, returns dicts of those columns only.
+        """
         stmt = select(self.model).order_by(self.model.id).offset(offset).limit(limit)
+        if fields:
+            return await self._project(session, stmt, fields)
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def _stream(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        fields: Sequence[str] | None,
+        chunk_size: int,
+    ) -> AsyncIterator[list[ModelType] | list[dict]]:
+        """Run ``select(model)`` statement on a server-side cursor.
+
+        Yields lists of at most ``chunk_size`` objects, or dicts of ``fields``
+        columns, so only one chunk is held in memory at a time.
+        """
+        stmt = stmt.execution_options(yield_per=chunk_size)
+        if fields:
+            columns = [getattr(self.model, name) for name in fields]
+            result = await session.stream(stmt.with_only_columns(*columns))
+            async for part in result.mappings().partitions():
+                yield [dict(row) for row in part]
+        else:
+            result = await session.stream(stmt)
+            async for part in result.scalars().partitions():
+                yield list(part)
+
+    def stream_multi(
+        self,
+        session: AsyncSession,
+        offset: int = 0,
+        limit: int = 25,
+        fields: Sequence[str] | None = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[list[ModelType] | list[dict]]:
+        """Same page as ``get_multi``, read in chunks of ``chunk_size``."""
+        stmt = select(self.model).order_by(self.model.id).offset(offset).limit(limit)
+        return self._stream(session, stmt, fields, chunk_size)
+
     async def update(
         self,
         session: AsyncSession,
@@ -86,7 +152,11 @@ class BaseCrud[
                 logger.warning(
                     f"Field {field} does not exist in model {self.model.__name__}"
                 )
-        return await self._commit_refresh(session, db_obj)
+        # Before commit, while the replaced slug and category are in history
+        purge = collect_purge([db_obj], changed=data.keys())
+        db_obj = await self._commit_refresh(session, db_obj)
+        schedule_purge(purge)
+        return db_obj
 
     async def delete(
         self,
@@ -94,9 +164,11 @@ class BaseCrud[
         db_obj: ModelType,
     ) -> None:
         """Delete object."""
+        purge = collect_purge([db_obj])
         await session.delete(db_obj)
         try:
             await session.commit()
         except IntegrityError:
             await session.rollback()
             raise
+        schedule_purge(purge)
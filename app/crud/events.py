@@ -0,0 +1,41 @@
+"""Live update notifications.
+
+Writes publish stock and order status changes with ``pg_notify`` inside
+their own transaction, so Postgres delivers them to every listening worker
+only once the change commits and drops them on rollback. See
+``app.core.events`` for the listeners and ``GET /events`` for clients.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import OrderStatus
+
+CHANNEL = "shop_events"
+# NOTIFY payloads are limited to 8000 bytes; stay well below with events
+# of about 50 bytes each
+EVENTS_PER_NOTIFY = 100
+
+
+def stock_event(product_id: int, stock: int) -> dict[str, Any]:
+    """Event carrying the stock of a product."""
+    return {"type": "stock", "id": product_id, "stock": stock}
+
+
+def order_event(order_id: int, status: OrderStatus) -> dict[str, Any]:
+    """Event carrying the status of an order."""
+    return {"type": "order", "id": order_id, "status": status.value}
+
+
+async def publish(session: AsyncSession, events: Iterable[dict[str, Any]]) -> None:
+    """Notify listeners of ``events`` when the session commits."""
+    events = list(events)
+    for start in range(0, len(events), EVENTS_PER_NOTIFY):
+        payload = json.dumps(
+            events[start : start + EVENTS_PER_NOTIFY], separators=(",", ":")
+        )
+        await session.execute(select(func.pg_notify(CHANNEL, payload)))
@@ -1,18 +1,97 @@
 """Order CRUD operations."""
 
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.http_cache import PurgeEvent, collect_purge, schedule_purge
 from app.crud import BaseCrud
-from app.models import Order, OrderItem, OrderStatus
+from app.crud.events import order_event, publish, stock_event
+from app.crud.outbox import enqueue
+from app.models import Order, OrderItem, OrderStatus, Product
 from app.schemas import OrderCreate, OrderUpdate
 
+# Relations order lists can load on request
+ORDER_INCLUDES = frozenset({"items", "items_summary"})
+
+
+@dataclass(frozen=True, slots=True)
+class ItemsSummary:
+    """Line count, total quantity and first product image of an order."""
+
+    item_count: int
+    quantity: int
+    image: str | None
+
 
 class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
-    """CRUD operations for Order model."""
+    """CRUD operations for Order model.
+
+    List methods accept ``include`` with any of ``ORDER_INCLUDES``:
+    ``items`` eager loads lines with a slim product, ``items_summary`` sets
+    ``order.items_summary`` from one grouped query for the whole page.
+    With ``fields`` they return dicts of those columns instead of orders.
+    """
+
+    async def _list(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        include: Collection[str],
+        fields: Sequence[str] | None,
+    ) -> list[Order] | list[dict]:
+        """Run order list query and load requested relations."""
+        if fields:
+            return await self._project(session, stmt, fields)
+        if "items" in include:
+            stmt = stmt.options(
+                selectinload(Order.items)
+                .load_only(OrderItem.product_id, OrderItem.quantity, OrderItem.price)
+                .selectinload(OrderItem.product)
+                .load_only(Product.name, Product.slug, Product.image)
+            )
+        result = await session.execute(stmt)
+        orders = list(result.scalars().all())
+
+        if "items_summary" in include:
+            summaries = await self.get_items_summaries(
+                session, [order.id for order in orders]
+            )
+            empty = ItemsSummary(item_count=0, quantity=0, image=None)
+            for order in orders:
+                order.items_summary = summaries.get(order.id, empty)  # type: ignore[attr-defined]
+        return orders
+
+    async def get_items_summaries(
+        self,
+        session: AsyncSession,
+        order_ids: list[int],
+    ) -> dict[int, ItemsSummary]:
+        """Summarize items of many orders in a single grouped query."""
+        if not order_ids:
+            return {}
+        images = func.array_agg(aggregate_order_by(Product.image, OrderItem.id))
+        stmt = (
+            select(
+                OrderItem.order_id,
+                func.count(),
+                func.sum(OrderItem.quantity),
+                images.filter(Product.image.is_not(None))[1],
+            )
+            .join(Product, Product.id == OrderItem.product_id)
+            .where(OrderItem.order_id.in_(order_ids))
+            .group_by(OrderItem.order_id)
+        )
+        result = await session.execute(stmt)
+        return {
+            order_id: ItemsSummary(item_count=count, quantity=quantity, image=image)
+            for order_id, count, quantity, image in result.all()
+        }
 
     async def get_by_user_id(
         self,
@@ -20,7 +99,9 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
         user_id: int,
         offset: int = 0,
         limit: int = 25,
-    ) -> list[Order]:
+        include: Collection[str] = (),
+        fields: Sequence[str] | None = None,
+    ) -> list[Order] | list[dict]:
         """Get all user orders."""
         stmt = (
             select(Order)
@@ -29,8 +110,7 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
             .offset(offset)
             .limit(limit)
         )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._list(session, stmt, include, fields)
 
     async def get_by_status(
         self,
@@ -38,7 +118,9 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
         status: OrderStatus,
         offset: int = 0,
         limit: int = 25,
-    ) -> list[Order]:
+        include: Collection[str] = (),
+        fields: Sequence[str] | None = None,
+    ) -> list[Order] | list[dict]:
         """Get orders by status."""
         stmt = (
             select(Order)
@@ -47,8 +129,7 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
             .offset(offset)
             .limit(limit)
         )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._list(session, stmt, include, fields)
 
     async def get_with_items(
         self,
@@ -64,14 +145,29 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_statuses(
+        self,
+        session: AsyncSession,
+        order_ids: Collection[int],
+        user_id: int | None = None,
+    ) -> dict[int, OrderStatus]:
+        """Current status by order id, only orders of ``user_id`` if given."""
+        stmt = select(Order.id, Order.status).where(Order.id.in_(order_ids))
+        if user_id is not None:
+            stmt = stmt.where(Order.user_id == user_id)
+        result = await session.execute(stmt)
+        return dict(result.tuples().all())
+
     async def update_status(
         self,
         session: AsyncSession,
         db_obj: Order,
         new_status: OrderStatus,
     ) -> Order:
-        """Update order status."""
+        """Update order status, queueing an ``order.status_changed`` event."""
         order = db_obj
+        purge = PurgeEvent()
+        restocked: list[Product] = []
         if new_status == OrderStatus.cancelled and db_obj.status == OrderStatus.pending:
             order_with_items = await self.get_with_items(session, db_obj.id)
             if order_with_items:
@@ -79,9 +175,35 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
                 for item in order.items:
                     if item.product:
                         item.product.stock += item.quantity
+                        restocked.append(item.product)
+                purge = collect_purge(
+                    (item.product for item in order.items if item.product),
+                    changed={"stock"},
+                )
 
+        previous = order.status
         order.status = new_status
-        return await self._commit_refresh(session, order)
+        if previous != new_status:
+            enqueue(
+                session,
+                "order.status_changed",
+                {
+                    "order_id": order.id,
+                    "user_id": order.user_id,
+                    "status": new_status.value,
+                    "previous_status": previous.value,
+                },
+            )
+            await publish(
+                session,
+                [
+                    order_event(order.id, new_status),
+                    *(stock_event(p.id, p.stock) for p in restocked),
+                ],
+            )
+        order = await self._commit_refresh(session, order)
+        schedule_purge(purge)
+        return order
 
     async def get_user_orders_by_status(
         self,
@@ -90,7 +212,9 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
         status: OrderStatus,
         offset: int = 0,
         limit: int = 25,
-    ) -> list[Order]:
+        include: Collection[str] = (),
+        fields: Sequence[str] | None = None,
+    ) -> list[Order] | list[dict]:
         """Get user orders with specific status."""
         stmt = (
             select(Order)
@@ -99,8 +223,7 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
             .offset(offset)
             .limit(limit)
         )
-        result = await session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._list(session, stmt, include, fields)
 
     async def create_order_with_items(
         self,
@@ -177,9 +300,24 @@ class OrderCrud(BaseCrud[Order, OrderCreate, OrderUpdate]):
 
             item_data["product"].stock -= item_data["quantity"]
 
+        # Confirmation email and webhooks go out after commit, see app.core.outbox
+        enqueue(
+            session,
+            "order.created",
+            {
+                "order_id": order.id,
+                "user_id": user_id,
+                "total_price": str(total_price),
+                "item_count": len(validated_items),
+            },
+        )
+        products = [item_data["product"] for item_data in validated_items]
+        await publish(session, (stock_event(p.id, p.stock) for p in products))
+        purge = collect_purge(products, changed={"stock"})
         await session.commit()
         await session.refresh(order)
 
+        schedule_purge(purge)
         return order
 
 
@@ -5,7 +5,9 @@ from decimal import Decimal
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_cache import collect_purge, schedule_purge
 from app.crud import BaseCrud
+from app.crud.events import publish, stock_event
 from app.models import OrderItem, Product
 from app.schemas import OrderItemCreate, OrderItemUpdate
 
@@ -49,8 +51,12 @@ class OrderItemCrud(BaseCrud[OrderItem, OrderItemCreate, OrderItemUpdate]):
         session.add(obj)
 
         product.stock -= obj_in.quantity
+        await publish(session, [stock_event(product.id, product.stock)])
 
-        return await self._commit_refresh(session, obj)
+        purge = collect_purge([product], changed={"stock"})
+        obj = await self._commit_refresh(session, obj)
+        schedule_purge(purge)
+        return obj
 
     async def calculate_order_total(
         self,
@@ -0,0 +1,146 @@
+"""Outbox message queries.
+
+Events are added to the session of the change they describe and committed
+with it. Dispatchers claim due messages with ``FOR UPDATE SKIP LOCKED``, so
+several workers share the queue without taking the same message.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import settings
+from app.models import OutboxMessage, OutboxStatus
+
+# Key of session.info set when a transaction added outbox messages
+OUTBOX_FLAG = "outbox"
+
+UTC_NOW = func.timezone("utc", func.now())
+
+
+@dataclass(frozen=True, slots=True)
+class Delivery:
+    """Claimed message, detached from the session that claimed it."""
+
+    id: int
+    topic: str
+    sink: str
+    payload: dict[str, Any]
+    attempts: int
+
+
+def enqueue(session: AsyncSession, topic: str, payload: dict[str, Any]) -> None:
+    """Add ``topic`` event for every sink routed to it in ``OUTBOX_ROUTES``.
+
+    Nothing is sent until the session commits; a rollback drops the event.
+    """
+    sinks = settings.outbox.ROUTES.get(topic, [])
+    if not sinks:
+        return
+    session.add_all(
+        OutboxMessage(topic=topic, sink=sink, payload=payload) for sink in sinks
+    )
+    session.info[OUTBOX_FLAG] = True
+
+
+async def claim(session: AsyncSession, limit: int, lease: float) -> list[Delivery]:
+    """Take up to ``limit`` due messages for ``lease`` seconds.
+
+    Counts the attempt and hides the messages from other dispatchers until
+    the lease ends, so a crashed dispatcher's messages are retried.
+    Commit right after to release the row locks.
+    """
+    due = (
+        select(OutboxMessage.id)
+        .where(
+            OutboxMessage.status == OutboxStatus.pending,
+            OutboxMessage.available_at <= UTC_NOW,
+        )
+        .order_by(OutboxMessage.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        update(OutboxMessage)
+        .where(OutboxMessage.id.in_(due))
+        .values(
+            attempts=OutboxMessage.attempts + 1,
+            available_at=UTC_NOW + timedelta(seconds=lease),
+        )
+        .returning(
+            OutboxMessage.id,
+            OutboxMessage.topic,
+            OutboxMessage.sink,
+            OutboxMessage.payload,
+            OutboxMessage.attempts,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(stmt)
+    return [Delivery(*row) for row in result]
+
+
+def _still_claimed(deliveries: Sequence[Delivery]):
+    """Rows not claimed again since, matched by the attempt they were sent as."""
+    return (
+        tuple_(OutboxMessage.id, OutboxMessage.attempts).in_(
+            [(delivery.id, delivery.attempts) for delivery in deliveries]
+        ),
+        OutboxMessage.status == OutboxStatus.pending,
+    )
+
+
+async def mark_sent(session: AsyncSession, deliveries: Sequence[Delivery]) -> int:
+    """Record successful deliveries, returning how many were still claimed.
+
+    A message whose lease ran out may have been claimed by another
+    dispatcher; its row then belongs to that claim and is left alone.
+    """
+    result = await session.execute(
+        update(OutboxMessage)
+        .where(*_still_claimed(deliveries))
+        .values(status=OutboxStatus.sent, sent_at=UTC_NOW, last_error=None)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+async def mark_failed(
+    session: AsyncSession,
+    delivery: Delivery,
+    error: str,
+    retry_in: float | None,
+) -> bool:
+    """Schedule a retry in ``retry_in`` seconds, or give up when None.
+
+    Returns False when the message was claimed again in the meantime.
+    """
+    values: dict[str, Any] = {"last_error": error[:2000]}
+    if retry_in is None:
+        values["status"] = OutboxStatus.failed
+    else:
+        values["available_at"] = UTC_NOW + timedelta(seconds=retry_in)
+    result = await session.execute(
+        update(OutboxMessage)
+        .where(*_still_claimed([delivery]))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount > 0
+
+
+async def delete_sent(session: AsyncSession, older_than: timedelta) -> int:
+    """Remove delivered messages older than ``older_than``."""
+    result = await session.execute(
+        delete(OutboxMessage)
+        .where(
+            OutboxMessage.status == OutboxStatus.sent,
+            OutboxMessage.sent_at < UTC_NOW - older_than,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -1,11 +1,16 @@
 """Product CRUD operations."""
 
+from collections.abc import Collection, Sequence
+from decimal import Decimal
+
 from slugify import slugify
 from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.http_cache import purge_objects
 from app.crud import BaseCrud
+from app.crud.events import publish, stock_event
 from app.models import Product
 from app.schemas import ProductCreate, ProductUpdate
 
@@ -62,13 +67,14 @@ class ProductCrud(BaseCrud[Product, ProductCreate, ProductUpdate]):
         session: AsyncSession,
         search_query: str | None = None,
         category_id: int | None = None,
-        min_price: float | None = None,
-        max_price: float | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
         only_active: bool = True,
         sort_by: str = "created_at_desc",
         offset: int = 0,
         limit: int = 25,
-    ) -> list[Product]:
+        fields: Sequence[str] | None = None,
+    ) -> list[Product] | list[dict]:
         """Search and filter products.
 
         Args:
@@ -80,6 +86,7 @@ class ProductCrud(BaseCrud[Product, ProductCreate, ProductUpdate]):
             sort_by: Sort order.
             offset: Pagination offset.
             limit: Results limit.
+            fields: Columns to read; rows are returned as dicts when given.
         """
         stmt = select(Product)
 
@@ -126,6 +133,8 @@ class ProductCrud(BaseCrud[Product, ProductCreate, ProductUpdate]):
         # Pagination
         stmt = stmt.offset(offset).limit(limit)
 
+        if fields:
+            return await self._project(session, stmt, fields)
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
@@ -164,6 +173,16 @@ class ProductCrud(BaseCrud[Product, ProductCreate, ProductUpdate]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_stock_levels(
+        self,
+        session: AsyncSession,
+        product_ids: Collection[int],
+    ) -> dict[int, int]:
+        """Current stock by product id; unknown ids are left out."""
+        stmt = select(Product.id, Product.stock).where(Product.id.in_(product_ids))
+        result = await session.execute(stmt)
+        return dict(result.tuples().all())
+
     async def update_stock(
         self,
         session: AsyncSession,
@@ -188,7 +207,10 @@ class ProductCrud(BaseCrud[Product, ProductCreate, ProductUpdate]):
             )
 
         product.stock = new_stock
-        return await self._commit_refresh(session, product)
+        await publish(session, [stock_event(product.id, new_stock)])
+        product = await self._commit_refresh(session, product)
+        purge_objects(product, changed={"stock"})
+        return product
 
 
 product_crud = ProductCrud(Product)
@@ -0,0 +1,267 @@
+"""Daily sales rollups.
+
+``sales_daily_products`` and ``sales_daily_categories`` hold per-day
+counters of orders by creation day (UTC). :func:`roll_up` finds the orders
+changed since the watermark by ``orders.updated_at`` and rebuilds every day
+they were placed on, so new orders, status changes and edited items all
+land in the right bucket and a rerun gives the same result. Analytics read
+only the rollup tables.
+
+Changing order items through the ORM bumps ``updated_at`` of their order.
+Deleted orders and raw SQL writes are not seen by the watermark and need
+``python -m app.commands.rebuild_sales_rollups``.
+"""
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import chain
+
+from sqlalchemy import (
+    Date,
+    Select,
+    cast,
+    delete,
+    distinct,
+    event,
+    func,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import settings
+from app.models import (
+    Order,
+    OrderItem,
+    OrderStatus,
+    Product,
+    RollupWatermark,
+    SalesDailyCategory,
+    SalesDailyProduct,
+)
+
+ROLLUP_NAME = "sales"
+# pg_try_advisory_xact_lock key; one worker rolls up at a time
+ROLLUP_LOCK = 0x5A1E5
+EPOCH = datetime(1970, 1, 1)
+UTC_NOW = func.timezone("utc", func.now())
+
+COUNTERS = ("units", "revenue", "order_count", "cancelled_orders", "cancelled_units")
+
+ORDER_DAY = cast(Order.created_at, Date)
+SOLD = Order.status != OrderStatus.cancelled
+CANCELLED = Order.status == OrderStatus.cancelled
+
+type SalesModel = type[SalesDailyProduct] | type[SalesDailyCategory]
+
+# Column each rollup table is keyed by besides the day
+ROLLUP_KEYS = {
+    SalesDailyProduct: SalesDailyProduct.product_id,
+    SalesDailyCategory: SalesDailyCategory.category_id,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RollupRun:
+    """Outcome of one :func:`roll_up` call."""
+
+    days: list[date]
+    watermark: datetime
+    # The window was capped at the batch size, more changes are waiting
+    more: bool
+
+
+def _counters() -> list:
+    units = OrderItem.quantity
+    columns = [
+        func.coalesce(func.sum(units).filter(SOLD), 0),
+        func.coalesce(func.sum(units * OrderItem.price).filter(SOLD), 0),
+        func.count(distinct(Order.id)).filter(SOLD),
+        func.count(distinct(Order.id)).filter(CANCELLED),
+        func.coalesce(func.sum(units).filter(CANCELLED), 0),
+    ]
+    return [column.label(name) for column, name in zip(columns, COUNTERS, strict=True)]
+
+
+def _orders_of_days(stmt: Select, days: Collection[date]) -> Select:
+    # The range lets the planner use ix_orders_created_at
+    first = datetime.combine(min(days), time())
+    last = datetime.combine(max(days), time()) + timedelta(days=1)
+    return stmt.where(
+        Order.created_at >= first,
+        Order.created_at < last,
+        ORDER_DAY.in_(days),
+    )
+
+
+def product_rollup_select(days: Collection[date]) -> Select:
+    """Rollup rows of ``days`` aggregated from orders, per product."""
+    stmt = select(ORDER_DAY.label("day"), OrderItem.product_id, *_counters()).join(
+        OrderItem, OrderItem.order_id == Order.id
+    )
+    return _orders_of_days(stmt, days).group_by(ORDER_DAY, OrderItem.product_id)
+
+
+def category_rollup_select(days: Collection[date]) -> Select:
+    """Rollup rows of ``days`` aggregated from orders, per product category."""
+    stmt = (
+        select(ORDER_DAY.label("day"), Product.category_id, *_counters())
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .join(Product, Product.id == OrderItem.product_id)
+    )
+    return _orders_of_days(stmt, days).group_by(ORDER_DAY, Product.category_id)
+
+
+async def rebuild_days(session: AsyncSession, days: Collection[date]) -> None:
+    """Replace the rollup rows of ``days`` with fresh aggregates."""
+    if not days:
+        return
+    days = sorted(days)
+    for model, rows in (
+        (SalesDailyProduct, product_rollup_select(days)),
+        (SalesDailyCategory, category_rollup_select(days)),
+    ):
+        await session.execute(
+            delete(model)
+            .where(model.day.in_(days))
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(
+            insert(model).from_select(["day", ROLLUP_KEYS[model].key, *COUNTERS], rows)
+        )
+
+
+def _changed(since: datetime, until: datetime) -> list:
+    return [Order.updated_at > since, Order.updated_at <= until]
+
+
+async def changed_days(
+    session: AsyncSession, since: datetime, until: datetime
+) -> list[date]:
+    """Creation days of orders updated after ``since`` up to ``until``."""
+    stmt = select(distinct(ORDER_DAY)).where(*_changed(since, until))
+    result = await session.execute(stmt)
+    return sorted(result.scalars().all())
+
+
+async def get_watermark(session: AsyncSession) -> RollupWatermark | None:
+    """Progress of the sales rollup, None before its first run."""
+    result = await session.execute(
+        select(RollupWatermark).where(RollupWatermark.name == ROLLUP_NAME)
+    )
+    return result.scalar_one_or_none()
+
+
+async def roll_up(session: AsyncSession, lag: float, batch: int) -> RollupRun | None:
+    """Rebuild the days of orders changed since the watermark and advance it.
+
+    Only changes older than ``lag`` seconds are taken, so transactions still
+    running with an earlier ``updated_at`` are not skipped, and at most about
+    ``batch`` orders per call. Returns None when another worker holds the
+    lock. Run in its own transaction and commit right after.
+    """
+    locked = await session.scalar(select(func.pg_try_advisory_xact_lock(ROLLUP_LOCK)))
+    if not locked:
+        return None
+    current = await get_watermark(session)
+    since = current.watermark if current is not None else EPOCH
+    until = await session.scalar(select(UTC_NOW - timedelta(seconds=lag)))
+
+    # Cap the window at the batch-th change; orders sharing that timestamp
+    # are all inside it
+    capped = await session.scalar(
+        select(Order.updated_at)
+        .where(*_changed(since, until))
+        .order_by(Order.updated_at)
+        .offset(batch - 1)
+        .limit(1)
+    )
+    if capped is not None:
+        until = capped
+
+    days = await changed_days(session, since, until)
+    await rebuild_days(session, days)
+    if until > since:
+        stmt = insert(RollupWatermark).values(name=ROLLUP_NAME, watermark=until)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RollupWatermark.name],
+                set_={"watermark": until, "updated_at": UTC_NOW},
+            )
+        )
+    return RollupRun(days, max(since, until), more=capped is not None)
+
+
+async def get_daily(
+    session: AsyncSession,
+    model: SalesModel,
+    start: date,
+    end: date,
+    key_ids: Collection[int] = (),
+    offset: int = 0,
+    limit: int = 1000,
+) -> Sequence[SalesDailyProduct | SalesDailyCategory]:
+    """Rollup rows from ``start`` to ``end`` inclusive, optionally of some ids."""
+    key = ROLLUP_KEYS[model]
+    stmt = select(model).where(model.day.between(start, end))
+    if key_ids:
+        stmt = stmt.where(key.in_(key_ids))
+    stmt = stmt.order_by(model.day, key).offset(offset).limit(limit)
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+async def get_totals(
+    session: AsyncSession,
+    model: SalesModel,
+    start: date,
+    end: date,
+    sort_by: str = "revenue",
+    limit: int = 25,
+) -> list[dict]:
+    """Counters summed over ``start`` to ``end`` per product or category.
+
+    Sorted by the ``sort_by`` counter, highest first.
+    """
+    key = ROLLUP_KEYS[model]
+    sums = [func.sum(getattr(model, name)).label(name) for name in COUNTERS]
+    stmt = (
+        select(key, *sums)
+        .where(model.day.between(start, end))
+        .group_by(key)
+        .order_by(func.sum(getattr(model, sort_by)).desc(), key)
+        .limit(limit)
+    )
+    result = await session.execute(stmt)
+    return [dict(row) for row in result.mappings()]
+
+
+def _previous_order_ids(item: OrderItem) -> list[int]:
+    history = inspect(item).attrs.order_id.history
+    return [*history.deleted, item.order_id]
+
+
+@event.listens_for(Session, "after_flush")
+def _touch_orders_of_items(session: Session, flush_context: object) -> None:
+    """Mark orders whose items changed so the next rollup rebuilds their day."""
+    if not settings.rollup.ENABLED:
+        return
+    new_orders = {obj.id for obj in session.new if isinstance(obj, Order)}
+    order_ids: set[int] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, OrderItem):
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        order_ids.update(_previous_order_ids(obj))
+    order_ids -= new_orders
+    order_ids.discard(None)
+    if not order_ids:
+        return
+    session.connection().execute(
+        update(Order).where(Order.id.in_(sorted(order_ids))).values(updated_at=UTC_NOW)
+    )
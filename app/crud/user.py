@@ -3,9 +3,11 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import settings
 from app.core.security import AuthUtils
+from app.core.user_cache import user_cache
 from app.crud import BaseCrud
-from app.models import Order, Review, User
+from app.models import Order, OrderStatus, Review, User, UserStats
 from app.schemas import UserCreate, UserUpdate
 
 
@@ -13,9 +15,37 @@ class UserCrud(BaseCrud[User, UserCreate, UserUpdate]):
     """CRUD operations for User model."""
 
     def _prepare_create_data(self, obj_in: UserCreate) -> dict:
-        data = obj_in.model_dump(exclude={"password"})
-        data["hashed_password"] = AuthUtils.hash_password(obj_in.password)
-        return data
+        return obj_in.model_dump(exclude={"password"})
+
+    async def create(
+        self,
+        session: AsyncSession,
+        obj_in: UserCreate,
+    ) -> User:
+        """Create user, hashing password off the event loop."""
+        hashed_password = await AuthUtils.hash_password_async(obj_in.password)
+        return await super().create(session, obj_in, hashed_password=hashed_password)
+
+    async def update(
+        self,
+        session: AsyncSession,
+        db_obj: User,
+        obj_in: UserUpdate,
+    ) -> User:
+        """Update user and drop cached identity."""
+        user = await super().update(session, db_obj, obj_in)
+        user_cache.invalidate(user.id)
+        return user
+
+    async def delete(
+        self,
+        session: AsyncSession,
+        db_obj: User,
+    ) -> None:
+        """Delete user and drop cached identity."""
+        user_id = db_obj.id
+        await super().delete(session, db_obj)
+        user_cache.invalidate(user_id)
 
     async def get_user_by_username(
         self,
@@ -44,8 +74,10 @@ class UserCrud(BaseCrud[User, UserCreate, UserUpdate]):
         new_password: str,
     ) -> User:
         """Update user password."""
-        user.hashed_password = AuthUtils.hash_password(new_password)
-        return await self._commit_refresh(session, user)
+        user.hashed_password = await AuthUtils.hash_password_async(new_password)
+        user = await self._commit_refresh(session, user)
+        user_cache.invalidate(user.id)
+        return user
 
     async def toggle_active_status(
         self,
@@ -54,7 +86,9 @@ class UserCrud(BaseCrud[User, UserCreate, UserUpdate]):
     ) -> User:
         """Toggle user active status."""
         user.is_active = not user.is_active
-        return await self._commit_refresh(session, user)
+        user = await self._commit_refresh(session, user)
+        user_cache.invalidate(user.id)
+        return user
 
     async def get_active_users(
         self,
@@ -78,47 +112,45 @@ class UserCrud(BaseCrud[User, UserCreate, UserUpdate]):
         session: AsyncSession,
         user_id: int,
     ) -> dict:
-        """Get user statistics including orders, reviews, and spending."""
-        from app.models import OrderStatus
-
-        # Total orders count
-        orders_stmt = select(func.count(Order.id)).where(Order.user_id == user_id)
-        orders_result = await session.execute(orders_stmt)
-        total_orders = orders_result.scalar_one()
-
-        # Pending orders count
-        pending_stmt = select(func.count(Order.id)).where(
-            Order.user_id == user_id, Order.status == OrderStatus.pending
-        )
-        pending_result = await session.execute(pending_stmt)
-        pending_orders = pending_result.scalar_one()
-
-        # Completed orders count
-        completed_stmt = select(func.count(Order.id)).where(
-            Order.user_id == user_id, Order.status == OrderStatus.delivered
+        """Get user statistics including orders, reviews, and spending.
+
+        Reads the ``user_stats`` row when ``DB_USER_STATS`` is enabled,
+        otherwise aggregates orders and reviews in one query.
+        """
+        if settings.db.USER_STATS:
+            summary = await session.get(UserStats, user_id)
+            if summary is not None:
+                return {
+                    "user_id": user_id,
+                    "total_orders": summary.total_orders,
+                    "pending_orders": summary.pending_orders,
+                    "completed_orders": summary.completed_orders,
+                    "total_spent": float(summary.total_spent),
+                    "total_reviews": summary.total_reviews,
+                }
+
+        reviews_count = (
+            select(func.count(Review.id))
+            .where(Review.user_id == user_id)
+            .scalar_subquery()
         )
-        completed_result = await session.execute(completed_stmt)
-        completed_orders = completed_result.scalar_one()
-
-        # Total spent (paid orders only)
-        total_spent_stmt = select(func.sum(Order.total_price)).where(
-            Order.user_id == user_id, Order.status == OrderStatus.paid
-        )
-        total_spent_result = await session.execute(total_spent_stmt)
-        total_spent = total_spent_result.scalar_one() or 0
-
-        # Reviews count
-        reviews_stmt = select(func.count(Review.id)).where(Review.user_id == user_id)
-        reviews_result = await session.execute(reviews_stmt)
-        reviews_count = reviews_result.scalar_one()
+        stmt = select(
+            func.count(Order.id),
+            func.count(Order.id).filter(Order.status == OrderStatus.pending),
+            func.count(Order.id).filter(Order.status == OrderStatus.delivered),
+            func.sum(Order.total_price).filter(Order.status == OrderStatus.paid),
+            reviews_count,
+        ).where(Order.user_id == user_id)
+        result = await session.execute(stmt)
+        total, pending, completed, spent, reviews = result.one()
 
         return {
             "user_id": user_id,
-            "total_orders": total_orders,
-            "pending_orders": pending_orders,
-            "completed_orders": completed_orders,
-            "total_spent": float(total_spent),
-            "total_reviews": reviews_count,
+            "total_orders": total,
+            "pending_orders": pending,
+            "completed_orders": completed,
+            "total_spent": float(spent or 0),
+            "total_reviews": reviews,
         }
 
 
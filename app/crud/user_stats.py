@@ -0,0 +1,231 @@
+"""User statistics summary maintenance.
+
+With ``DB_USER_STATS`` enabled, every ORM flush that inserts, updates or
+deletes orders or reviews adjusts the affected ``user_stats`` rows in the
+same transaction. Reviews removed by ``ON DELETE CASCADE`` when a product or
+category is deleted are counted before the flush. Raw SQL writes (bulk
+loads, manual fixes) bypass it and need
+``python -m app.commands.repair_user_stats``.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Connection, Insert, Select, event, func, inspect, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core import settings
+from app.models import Category, Order, OrderStatus, Product, Review, User, UserStats
+
+STAT_COLUMNS = (
+    "total_orders",
+    "pending_orders",
+    "completed_orders",
+    "total_spent",
+    "total_reviews",
+)
+
+# Key of session.info with reviews per user the flush deletes by cascade
+CASCADED_REVIEWS = "user_stats_cascaded_reviews"
+
+
+@dataclass
+class StatsDelta:
+    """Change of one user's counters within a flush."""
+
+    total_orders: int = 0
+    pending_orders: int = 0
+    completed_orders: int = 0
+    total_spent: Decimal = Decimal(0)
+    total_reviews: int = 0
+
+    def add_order(self, status: OrderStatus, total_price: Any, sign: int) -> None:
+        """Count (sign=1) or uncount (sign=-1) an order."""
+        self.total_orders += sign
+        self.pending_orders += sign * (status == OrderStatus.pending)
+        self.completed_orders += sign * (status == OrderStatus.delivered)
+        if status == OrderStatus.paid:
+            self.total_spent += sign * Decimal(str(total_price or 0))
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, field.name) for field in fields(self))
+
+
+def stats_select(first_id: int, last_id: int) -> Select:
+    """Summary rows recomputed from orders and reviews for a user id range."""
+    orders = (
+        select(
+            Order.user_id,
+            func.count().label("total_orders"),
+            func.count()
+            .filter(Order.status == OrderStatus.pending)
+            .label("pending_orders"),
+            func.count()
+            .filter(Order.status == OrderStatus.delivered)
+            .label("completed_orders"),
+            func.sum(Order.total_price)
+            .filter(Order.status == OrderStatus.paid)
+            .label("total_spent"),
+        )
+        .where(Order.user_id.between(first_id, last_id))
+        .group_by(Order.user_id)
+        .subquery()
+    )
+    reviews = (
+        select(Review.user_id, func.count().label("total_reviews"))
+        .where(Review.user_id.between(first_id, last_id))
+        .group_by(Review.user_id)
+        .subquery()
+    )
+    return (
+        select(
+            User.id,
+            *(func.coalesce(orders.c[name], 0) for name in STAT_COLUMNS[:-1]),
+            func.coalesce(reviews.c.total_reviews, 0),
+        )
+        .outerjoin(orders, orders.c.user_id == User.id)
+        .outerjoin(reviews, reviews.c.user_id == User.id)
+        .where(User.id.between(first_id, last_id))
+    )
+
+
+def recompute_user_stats(first_id: int, last_id: int) -> Insert:
+    """Statement overwriting summary rows of a user id range."""
+    stmt = insert(UserStats).from_select(
+        ["id", *STAT_COLUMNS], stats_select(first_id, last_id)
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[UserStats.id],
+        set_={name: stmt.excluded[name] for name in STAT_COLUMNS},
+    )
+
+
+def _previous(obj: object, name: str) -> Any:
+    """Attribute value as it was before the current flush."""
+    history = inspect(obj).attrs[name].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(obj, name)
+
+
+def cascaded_reviews_select(deleted: Iterable[object]) -> Select | None:
+    """Reviews per user that deleting ``deleted`` removes by ``ON DELETE CASCADE``.
+
+    Covers reviews of deleted products and of products in deleted
+    categories. Reviews deleted through the ORM are counted by
+    :func:`collect_deltas`, and deleted users lose their summary row anyway.
+    None when no product or category is deleted.
+    """
+    product_ids, category_ids, user_ids, review_ids = set(), set(), set(), set()
+    for obj in deleted:
+        if isinstance(obj, Product):
+            product_ids.add(obj.id)
+        elif isinstance(obj, Category):
+            category_ids.add(obj.id)
+        elif isinstance(obj, User):
+            user_ids.add(obj.id)
+        elif isinstance(obj, Review):
+            review_ids.add(obj.id)
+    if not product_ids and not category_ids:
+        return None
+
+    products = select(Product.id).where(
+        Product.id.in_(product_ids) | Product.category_id.in_(category_ids)
+    )
+    stmt = select(Review.user_id, func.count()).where(Review.product_id.in_(products))
+    if user_ids:
+        stmt = stmt.where(Review.user_id.not_in(user_ids))
+    if review_ids:
+        stmt = stmt.where(Review.id.not_in(review_ids))
+    return stmt.group_by(Review.user_id)
+
+
+def collect_deltas(
+    session: Session, cascaded_reviews: Mapping[int, int] | None = None
+) -> dict[int, StatsDelta]:
+    """Counter changes per user implied by the pending flush.
+
+    ``cascaded_reviews`` are review counts per user removed by the database
+    along with deleted products, see :func:`cascaded_reviews_select`.
+    """
+    deltas: defaultdict[int, StatsDelta] = defaultdict(StatsDelta)
+    for user_id, count in (cascaded_reviews or {}).items():
+        deltas[user_id].total_reviews -= count
+
+    for obj in session.new:
+        if isinstance(obj, Order):
+            deltas[obj.user_id].add_order(obj.status, obj.total_price, 1)
+        elif isinstance(obj, Review):
+            deltas[obj.user_id].total_reviews += 1
+
+    for obj in session.dirty:
+        if isinstance(obj, Order) and session.is_modified(obj):
+            deltas[_previous(obj, "user_id")].add_order(
+                _previous(obj, "status"), _previous(obj, "total_price"), -1
+            )
+            deltas[obj.user_id].add_order(obj.status, obj.total_price, 1)
+        elif isinstance(obj, Review) and session.is_modified(obj):
+            deltas[_previous(obj, "user_id")].total_reviews -= 1
+            deltas[obj.user_id].total_reviews += 1
+
+    for obj in session.deleted:
+        if isinstance(obj, Order):
+            deltas[_previous(obj, "user_id")].add_order(
+                _previous(obj, "status"), _previous(obj, "total_price"), -1
+            )
+        elif isinstance(obj, Review):
+            deltas[_previous(obj, "user_id")].total_reviews -= 1
+
+    return {user_id: delta for user_id, delta in deltas.items() if delta}
+
+
+def apply_delta(connection: Connection, user_id: int, delta: StatsDelta) -> None:
+    """Add delta to the user's summary row, creating it when missing."""
+    increments = {
+        name: getattr(UserStats, name) + getattr(delta, name) for name in STAT_COLUMNS
+    }
+    result = connection.execute(
+        update(UserStats).where(UserStats.id == user_id).values(increments)
+    )
+    if result.rowcount:
+        return
+
+    # No row yet: aggregate from scratch, which already sees this flush.
+    # A concurrent insert wins the conflict and gets our delta added instead.
+    stmt = insert(UserStats).from_select(
+        ["id", *STAT_COLUMNS], stats_select(user_id, user_id)
+    )
+    connection.execute(
+        stmt.on_conflict_do_update(index_elements=[UserStats.id], set_=increments)
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _count_cascaded_reviews(
+    session: Session, flush_context: object, instances: object
+) -> None:
+    session.info.pop(CASCADED_REVIEWS, None)
+    if not settings.db.USER_STATS:
+        return
+    stmt = cascaded_reviews_select(session.deleted)
+    if stmt is not None:
+        # Must run before the deletes, afterwards the reviews are gone
+        rows = session.connection().execute(stmt).tuples()
+        session.info[CASCADED_REVIEWS] = dict(rows)
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_user_stats(session: Session, flush_context: object) -> None:
+    if not settings.db.USER_STATS:
+        return
+    deltas = collect_deltas(session, session.info.pop(CASCADED_REVIEWS, None))
+    if not deltas:
+        return
+    connection = session.connection()
+    # Fixed order keeps concurrent transactions from deadlocking
+    for user_id in sorted(deltas):
+        apply_delta(connection, user_id, deltas[user_id])
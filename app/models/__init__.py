@@ -4,9 +4,12 @@ from app.models.base import Base, CreateAtMixin, UpdateAtMixin, num_10_2, str_25
 from app.models.category import Category
 from app.models.order import Order, OrderStatus
 from app.models.order_item import OrderItem
+from app.models.outbox import OutboxMessage, OutboxStatus
 from app.models.product import Product
 from app.models.review import Review
+from app.models.sales import RollupWatermark, SalesDailyCategory, SalesDailyProduct
 from app.models.user import User
+from app.models.user_stats import UserStats
 
 __all__ = [
     "CreateAtMixin",
@@ -17,8 +20,14 @@ __all__ = [
     "Category",
     "Order",
     "OrderItem",
+    "OutboxMessage",
+    "OutboxStatus",
     "Product",
     "Review",
+    "RollupWatermark",
+    "SalesDailyCategory",
+    "SalesDailyProduct",
     "User",
+    "UserStats",
     "OrderStatus",
 ]
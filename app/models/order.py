@@ -3,7 +3,7 @@
 import enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, ForeignKey, Text, text
+from sqlalchemy import Enum, ForeignKey, Index, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -26,13 +26,25 @@ class OrderStatus(enum.Enum):
 class Order(Base, CreateAtMixin, UpdateAtMixin):
     """Customer order model."""
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    __table_args__ = (
+        Index("ix_orders_user_id_created_at", "user_id", "created_at"),
+        Index("ix_orders_status_created_at", "status", "created_at"),
+        # Sales rollups: changed orders since the watermark, orders of a day
+        Index("ix_orders_updated_at", "updated_at"),
+        Index("ix_orders_created_at", "created_at"),
+    )
+
+    # active_history keeps previous values for the user_stats summary
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), active_history=True
+    )
     status: Mapped[OrderStatus] = mapped_column(
         Enum(OrderStatus),
         default=OrderStatus.pending,
         server_default=text("'pending'"),
+        active_history=True,
     )
-    total_price: Mapped[num_10_2]
+    total_price: Mapped[num_10_2] = mapped_column(active_history=True)
     shipping_address: Mapped[str] = mapped_column(Text)
 
     items: Mapped[list[OrderItem]] = relationship(
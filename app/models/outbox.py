@@ -0,0 +1,51 @@
+"""Transactional outbox of events for external systems."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Index, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, CreateAtMixin
+
+
+class OutboxStatus:
+    """Delivery states of an outbox message."""
+
+    pending = "pending"
+    sent = "sent"
+    failed = "failed"
+
+
+class OutboxMessage(Base, CreateAtMixin):
+    """One event to deliver to one sink.
+
+    Written in the transaction of the change it describes, so an event is
+    stored if and only if the change is committed. Messages are delivered
+    at least once by the dispatcher in ``app.core.outbox``.
+    """
+
+    __tablename__ = "outbox"  # type: ignore
+    __table_args__ = (
+        # Claim query: due pending messages in order
+        Index(
+            "ix_outbox_pending_available_at",
+            "available_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    topic: Mapped[str] = mapped_column(String(64))
+    sink: Mapped[str] = mapped_column(String(32))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    status: Mapped[str] = mapped_column(
+        String(16), default=OutboxStatus.pending, server_default=OutboxStatus.pending
+    )
+    attempts: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Next attempt; pushed ahead while a dispatcher holds the message
+    available_at: Mapped[datetime] = mapped_column(
+        server_default=text("TIMEZONE('utc', now())")
+    )
+    sent_at: Mapped[datetime | None]
+    last_error: Mapped[str | None] = mapped_column(Text)
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, String, Text, text
+from sqlalchemy import ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -14,6 +14,31 @@ from app.models import Base, CreateAtMixin, UpdateAtMixin, num_10_2, str_255
 class Product(Base, CreateAtMixin, UpdateAtMixin):
     """Product catalog item model."""
 
+    # Storefront queries only read active products, so most indexes are partial
+    __table_args__ = (
+        Index("ix_products_category_id", "category_id"),
+        Index(
+            "ix_products_active_category_id_created_at",
+            "category_id",
+            "created_at",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_products_active_category_id_price",
+            "category_id",
+            "price",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_products_active_created_at",
+            "created_at",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_products_active_price", "price", postgresql_where=text("is_active")),
+        Index("ix_products_active_name", "name", postgresql_where=text("is_active")),
+        Index("ix_products_active_stock", "stock", postgresql_where=text("is_active")),
+    )
+
     name: Mapped[str_255]
     slug: Mapped[str_255 | None] = mapped_column(unique=True)
     description: Mapped[str | None] = mapped_column(Text)
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Text
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models import Base, CreateAtMixin
@@ -14,10 +14,17 @@ if TYPE_CHECKING:
 class Review(Base, CreateAtMixin):
     """Product review model."""
 
+    __table_args__ = (
+        Index("ix_reviews_product_id_created_at", "product_id", "created_at"),
+        Index("ix_reviews_user_id_product_id", "user_id", "product_id"),
+    )
+
     product_id: Mapped[int] = mapped_column(
         ForeignKey("products.id", ondelete="CASCADE")
     )
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), active_history=True
+    )
     rating: Mapped[int] = mapped_column(CheckConstraint("rating >= 1 AND rating <= 5"))
     comment: Mapped[str | None] = mapped_column(Text, nullable=True)
 
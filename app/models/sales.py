@@ -0,0 +1,66 @@
+"""Daily sales rollups for admin analytics."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Index, Numeric, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base, UpdateAtMixin
+
+
+class SalesCountersMixin:
+    """Counters of one rollup row; cancelled orders only count as cancellations."""
+
+    day: Mapped[date]
+    units: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Sum over many orders outgrows the Numeric(10, 2) of a single order
+    revenue: Mapped[Decimal] = mapped_column(
+        Numeric(precision=14, scale=2), default=0, server_default="0"
+    )
+    order_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    cancelled_orders: Mapped[int] = mapped_column(default=0, server_default="0")
+    cancelled_units: Mapped[int] = mapped_column(default=0, server_default="0")
+
+
+class SalesDailyProduct(Base, SalesCountersMixin):
+    """Sales of one product on one UTC day, by order creation time.
+
+    Rebuilt day by day from orders by ``app.core.rollups``; never written
+    by requests.
+    """
+
+    __tablename__ = "sales_daily_products"  # type: ignore
+
+    __table_args__ = (
+        UniqueConstraint("day", "product_id"),
+        Index("ix_sales_daily_products_product_id_day", "product_id", "day"),
+    )
+
+    product_id: Mapped[int] = mapped_column(
+        ForeignKey("products.id", ondelete="CASCADE")
+    )
+
+
+class SalesDailyCategory(Base, SalesCountersMixin):
+    """Sales of one category on one UTC day, by the product's category."""
+
+    __tablename__ = "sales_daily_categories"  # type: ignore
+
+    __table_args__ = (
+        UniqueConstraint("day", "category_id"),
+        Index("ix_sales_daily_categories_category_id_day", "category_id", "day"),
+    )
+
+    category_id: Mapped[int] = mapped_column(
+        ForeignKey("categories.id", ondelete="CASCADE")
+    )
+
+
+class RollupWatermark(Base, UpdateAtMixin):
+    """Orders changed up to ``watermark`` are included in the rollup ``name``."""
+
+    __tablename__ = "rollup_watermarks"  # type: ignore
+
+    name: Mapped[str] = mapped_column(String(64), unique=True)
+    watermark: Mapped[datetime]
@@ -1,6 +1,6 @@
 """User model."""
 
-from sqlalchemy import text
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models import Base, CreateAtMixin, UpdateAtMixin
@@ -9,6 +9,14 @@ from app.models import Base, CreateAtMixin, UpdateAtMixin
 class User(Base, CreateAtMixin, UpdateAtMixin):
     """User account model."""
 
+    __table_args__ = (
+        Index(
+            "ix_users_active_created_at",
+            "created_at",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     email: Mapped[str] = mapped_column(unique=True)
     username: Mapped[str] = mapped_column(unique=True)
     hashed_password: Mapped[str]
@@ -0,0 +1,32 @@
+"""Per-user order and review summary."""
+
+from decimal import Decimal
+
+from sqlalchemy import ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models import Base
+
+
+class UserStats(Base):
+    """Account dashboard counters, one row per user keyed by user id.
+
+    Maintained in the transaction of every ORM write to orders and reviews
+    when ``DB_USER_STATS`` is enabled.
+    """
+
+    __tablename__ = "user_stats"  # type: ignore
+
+    id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        autoincrement=False,
+    )
+    total_orders: Mapped[int] = mapped_column(default=0, server_default="0")
+    pending_orders: Mapped[int] = mapped_column(default=0, server_default="0")
+    completed_orders: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Sum over many orders outgrows the Numeric(10, 2) of a single order
+    total_spent: Mapped[Decimal] = mapped_column(
+        Numeric(precision=14, scale=2), default=0, server_default="0"
+    )
+    total_reviews: Mapped[int] = mapped_column(default=0, server_default="0")
@@ -0,0 +1,20 @@
+"""Request and database monitoring."""
+
+from app.monitoring.middleware import MetricsMiddleware, QueryStatsMiddleware
+from app.monitoring.queries import current_query_stats, instrument_engine
+from app.monitoring.slow_queries import (
+    install_slow_query_recorder,
+    stop_slow_query_recorder,
+)
+from app.monitoring.tasks import start_monitoring, stop_monitoring
+
+__all__ = [
+    "MetricsMiddleware",
+    "QueryStatsMiddleware",
+    "start_monitoring",
+    "stop_monitoring",
+    "current_query_stats",
+    "instrument_engine",
+    "install_slow_query_recorder",
+    "stop_slow_query_recorder",
+]
@@ -0,0 +1,80 @@
+"""Gauges refreshed from application state at collection time."""
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.database import replica_health
+from app.core.security import password_executor
+from app.core.token_cache import token_cache
+from app.core.user_cache import user_cache
+from app.monitoring.metrics import Counter, Gauge, registry
+
+DB_POOL_SIZE = registry.register(
+    Gauge("db_pool_size", "Configured connection pool size.", ("pool",))
+)
+DB_POOL_CHECKED_OUT = registry.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the pool.",
+        ("pool",),
+    )
+)
+DB_POOL_OVERFLOW = registry.register(
+    Gauge("db_pool_overflow", "Connections open beyond the pool size.", ("pool",))
+)
+CACHE_HITS = registry.register(
+    Counter("cache_hits_total", "In-process cache hits.", ("cache",))
+)
+CACHE_MISSES = registry.register(
+    Counter("cache_misses_total", "In-process cache misses.", ("cache",))
+)
+CACHE_SIZE = registry.register(
+    Gauge("cache_entries", "Entries held by in-process caches.", ("cache",))
+)
+DB_REPLICA_FALLBACKS = registry.register(
+    Counter(
+        "db_replica_fallbacks_total",
+        "Read requests sent to the primary because the replica was unreachable.",
+    )
+)
+PASSWORD_HASH_QUEUED = registry.register(
+    Gauge("password_hash_queued", "Password hashing calls waiting for a worker.")
+)
+PASSWORD_HASH_REJECTED = registry.register(
+    Counter(
+        "password_hash_rejected_total",
+        "Password hashing calls rejected because the queue was full.",
+    )
+)
+
+
+def register_collectors(engines: dict[str, AsyncEngine]) -> None:
+    """Refresh pool, cache and password hashing gauges on collection.
+
+    Args:
+        engines: Engines by pool name, used as the ``pool`` label.
+    """
+
+    def collect_pool() -> None:
+        for name, engine in engines.items():
+            pool = engine.sync_engine.pool
+            DB_POOL_SIZE.set(pool.size(), pool=name)
+            DB_POOL_CHECKED_OUT.set(pool.checkedout(), pool=name)
+            DB_POOL_OVERFLOW.set(max(0, pool.overflow()), pool=name)
+
+    def collect_caches() -> None:
+        for name, cache in (("user", user_cache), ("token", token_cache)):
+            CACHE_HITS.set_total(cache.hits, cache=name)
+            CACHE_MISSES.set_total(cache.misses, cache=name)
+            CACHE_SIZE.set(len(cache), cache=name)
+
+    def collect_password_hashing() -> None:
+        PASSWORD_HASH_QUEUED.set(password_executor.queued)
+        PASSWORD_HASH_REJECTED.set_total(password_executor.rejected)
+
+    def collect_replica() -> None:
+        DB_REPLICA_FALLBACKS.set_total(replica_health.fallbacks)
+
+    registry.add_collector(collect_pool)
+    registry.add_collector(collect_replica)
+    registry.add_collector(collect_caches)
+    registry.add_collector(collect_password_hashing)
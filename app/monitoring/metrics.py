@@ -0,0 +1,411 @@
+"""Prometheus text format metrics.
+
+Metrics are plain per-process dictionaries updated from the event loop
+without locks. With several uvicorn workers each worker periodically dumps
+a snapshot into ``METRICS_MULTIPROC_DIR`` and ``/metrics`` merges the
+snapshots of all workers. Counters of exited workers are folded into one
+file, so recycled workers do not pile up snapshots.
+"""
+
+import asyncio
+import json
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from app.core.config import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+type Labels = tuple[str, ...]
+type Sample = tuple[str, dict[str, str], float]
+
+
+class Metric(ABC):
+    """Base metric with a fixed set of label names."""
+
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        multiprocess_mode: str = "sum",
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.multiprocess_mode = multiprocess_mode
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Labels) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    @abstractmethod
+    def samples(self) -> list[Sample]:
+        """Current samples of metric."""
+
+
+class Counter(Metric):
+    """Monotonically increasing value."""
+
+    type = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase counter for label values."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """Set counter from an external cumulative total."""
+        self._values[self._key(labels)] = value
+
+    def samples(self) -> list[Sample]:
+        return [(self.name, self._labels(k), v) for k, v in self._values.items()]
+
+
+class Gauge(Metric):
+    """Value that can go up and down.
+
+    ``multiprocess_mode`` selects how worker values combine: ``sum`` or
+    ``max``. Gauges of exited workers are dropped.
+    """
+
+    type = "gauge"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set gauge for label values."""
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase gauge for label values."""
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease gauge for label values."""
+        self.inc(-amount, **labels)
+
+    def samples(self) -> list[Sample]:
+        return [(self.name, self._labels(k), v) for k, v in self._values.items()]
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: count per bucket (last one is +Inf), then sum
+        self._values: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record observation for label values."""
+        key = self._key(labels)
+        data = self._values.get(key)
+        if data is None:
+            data = self._values[key] = [0.0] * (len(self.buckets) + 2)
+
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                data[index] += 1
+                break
+        else:
+            data[len(self.buckets)] += 1
+        data[-1] += value
+
+    def samples(self) -> list[Sample]:
+        samples = []
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for key, data in self._values.items():
+            labels = self._labels(key)
+            cumulative = 0.0
+            for bound, count in zip(bounds, data, strict=False):
+                cumulative += count
+                samples.append(
+                    (f"{self.name}_bucket", {**labels, "le": bound}, cumulative)
+                )
+            samples.append((f"{self.name}_sum", labels, data[-1]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class Registry:
+    """Collection of metrics of the current process."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def register[M: Metric](self, metric: M) -> M:
+        """Add metric to registry."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Add callback refreshing gauges right before collection."""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> dict:
+        """Serializable state of all metrics."""
+        for collector in self._collectors:
+            collector()
+
+        return {
+            metric.name: {
+                "type": metric.type,
+                "help": metric.documentation,
+                "mode": metric.multiprocess_mode,
+                "samples": metric.samples(),
+            }
+            for metric in self._metrics.values()
+        }
+
+
+def merge_snapshots(snapshots: Iterable[tuple[dict, bool]]) -> dict:
+    """Combine worker snapshots.
+
+    Args:
+        snapshots: Pairs of snapshot and whether its worker is alive.
+    """
+    merged: dict[str, dict] = {}
+    for snapshot, alive in snapshots:
+        for name, metric in snapshot.items():
+            if metric["type"] == "gauge" and not alive:
+                continue
+
+            target = merged.setdefault(name, {**metric, "samples": {}})
+            for sample_name, labels, value in metric["samples"]:
+                key = (sample_name, tuple(sorted(labels.items())))
+                if key not in target["samples"]:
+                    target["samples"][key] = value
+                elif metric["mode"] == "max":
+                    target["samples"][key] = max(target["samples"][key], value)
+                else:
+                    target["samples"][key] += value
+
+    for metric in merged.values():
+        metric["samples"] = [
+            (sample_name, dict(labels), value)
+            for (sample_name, labels), value in metric["samples"].items()
+        ]
+    return merged
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return f"{int(value)}.0"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def render(snapshot: dict) -> str:
+    """Render snapshot in Prometheus text exposition format 0.0.4."""
+    lines = []
+    for name, metric in sorted(snapshot.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for sample_name, labels, value in metric["samples"]:
+            if labels:
+                rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                sample_name = f"{sample_name}{{{rendered}}}"
+            lines.append(f"{sample_name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class SnapshotStore:
+    """Per-worker snapshot files in a directory shared by all workers.
+
+    Files are named by pid and start time, so a reused pid never overwrites
+    counters of an exited worker. Snapshots of exited workers are folded
+    into ``dead.json`` and deleted on the next read, like
+    ``prometheus_client`` does in ``mark_process_dead``; gauges of exited
+    workers are dropped. The directory should be emptied when the server
+    (re)starts.
+    """
+
+    DEAD = "dead.json"
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"{os.getpid()}-{time.time_ns()}.json"
+
+    @staticmethod
+    def _replace(path: Path, snapshot: dict) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(snapshot))
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read(path: Path) -> dict | None:
+        # Snapshots are replaced atomically, files only vanish
+        try:
+            return json.loads(path.read_text())
+        except OSError:
+            return None
+
+    def write(self, snapshot: dict) -> None:
+        """Atomically replace this worker's snapshot."""
+        self._replace(self.path, snapshot)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with open(self.directory / "dead.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _fold(self, exited: list[Path]) -> None:
+        """Add counters of exited workers to ``dead.json``, delete their files."""
+        dead_path = self.directory / self.DEAD
+        with self._locked():
+            # Another worker may have folded some of them meanwhile
+            snapshots = [
+                (snapshot, False)
+                for snapshot in map(self._read, [dead_path, *exited])
+                if snapshot is not None
+            ]
+            self._replace(dead_path, merge_snapshots(snapshots))
+            for path in exited:
+                path.unlink(missing_ok=True)
+
+    def read_all(self) -> list[tuple[dict, bool]]:
+        """Snapshots of all workers with liveness flags."""
+        snapshots = []
+        exited = []
+        for path in self.directory.glob("*.json"):
+            if path.name == self.DEAD:
+                continue
+            snapshot = self._read(path)
+            if snapshot is None:
+                continue
+            pid = int(path.stem.split("-", 1)[0])
+            if _pid_alive(pid):
+                snapshots.append((snapshot, True))
+            elif fcntl is None:
+                snapshots.append((snapshot, False))
+            else:
+                exited.append(path)
+
+        if exited:
+            self._fold(exited)
+        dead = self._read(self.directory / self.DEAD)
+        if dead is not None:
+            snapshots.append((dead, False))
+        return snapshots
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+registry = Registry()
+
+snapshot_store = (
+    SnapshotStore(settings.metrics.MULTIPROC_DIR)
+    if settings.metrics.MULTIPROC_DIR
+    else None
+)
+
+
+def _write_and_merge(store: SnapshotStore, snapshot: dict) -> str:
+    store.write(snapshot)
+    return render(merge_snapshots(store.read_all()))
+
+
+async def collect() -> str:
+    """Render metrics of this worker or, in multiprocess mode, all workers."""
+    snapshot = registry.snapshot()
+    if snapshot_store is None:
+        return render(snapshot)
+    return await asyncio.to_thread(_write_and_merge, snapshot_store, snapshot)
+
+
+async def flush() -> None:
+    """Write this worker's snapshot for other workers to merge."""
+    if snapshot_store is not None:
+        await asyncio.to_thread(snapshot_store.write, registry.snapshot())
+
+
+HTTP_REQUESTS = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request duration by route template.",
+        ("method", "route"),
+    )
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.register(
+    Gauge(
+        "http_requests_in_progress",
+        "HTTP requests currently being handled.",
+        ("method",),
+    )
+)
+DB_POOL_WAIT = registry.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time to check out a pool connection (waiting, connecting, pre-ping).",
+        ("pool",),
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+TEMPLATE_RENDER = registry.register(
+    Histogram(
+        "template_render_seconds",
+        "Jinja2 template render time.",
+        ("template",),
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+)
+EVENT_LOOP_LAG = registry.register(
+    Histogram(
+        "event_loop_lag_seconds",
+        "Delay of scheduled event loop callbacks.",
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    )
+)
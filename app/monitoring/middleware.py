@@ -0,0 +1,80 @@
+"""Monitoring ASGI middleware."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import settings
+from app.monitoring.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+from app.monitoring.queries import report_query_stats, start_query_stats
+from app.monitoring.utils import route_template
+
+
+class QueryStatsMiddleware:
+    """Collect SQL statistics per request and flag N+1 patterns.
+
+    With ``DB_QUERY_DEBUG`` enabled, query count and time are also returned
+    in ``X-DB-Query-Count``, ``X-DB-Query-Time`` and ``Server-Timing``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_query_stats(scope)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.db.QUERY_DEBUG:
+                headers = MutableHeaders(scope=message)
+                duration = f"{stats.duration * 1000:.1f}"
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Query-Time"] = duration
+                headers.append("Server-Timing", f"db;dur={duration}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            report_query_stats(stats)
+
+
+class MetricsMiddleware:
+    """Record request count, duration and in-flight requests per route."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(method=method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec(method=method)
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start, method=method, route=route
+            )
+            HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
@@ -0,0 +1,31 @@
+"""Connection pool instrumentation."""
+
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.monitoring.metrics import DB_POOL_WAIT
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Async queue pool recording connection checkout time."""
+
+    pool_name = "storefront"
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start, pool=self.pool_name)
+
+
+def named_pool_class(name: str) -> type[InstrumentedAsyncPool]:
+    """Pool class labelling its metrics with ``name``.
+
+    A subclass rather than an attribute on the pool instance, because the
+    engine recreates pools from their class on dispose.
+    """
+    return type(
+        f"{name.title()}AsyncPool", (InstrumentedAsyncPool,), {"pool_name": name}
+    )
@@ -0,0 +1,108 @@
+"""Per-request SQL query statistics and N+1 detection."""
+
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core import settings
+from app.monitoring.utils import route_template
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"\$\d+|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUE_LISTS = re.compile(r"\((?:\?, )+\?\)")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize SQL statement to its shape.
+
+    Bind placeholders and literals become ``?`` and expanded ``IN`` lists
+    collapse, so ``WHERE id = $1`` issued for different ids matches.
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _LITERALS.sub("?", statement)
+    return _VALUE_LISTS.sub("(?+)", statement)
+
+
+@dataclass
+class QueryStats:
+    """SQL statements executed while handling a single request."""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    scope: dict | None = field(default=None, repr=False)
+
+    @property
+    def route(self) -> str:
+        """Method and route template of the request."""
+        if self.scope is None:
+            return "unknown"
+        return f"{self.scope['method']} {route_template(self.scope)}"
+
+    def record(self, statement: str, duration: float) -> None:
+        """Account for an executed statement."""
+        self.count += 1
+        self.duration += duration
+        self.statements[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed more than ``threshold`` times."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats(scope: dict | None = None) -> QueryStats:
+    """Begin collecting statistics for current request context."""
+    stats = QueryStats(scope=scope)
+    _current_stats.set(stats)
+    return stats
+
+
+def current_query_stats() -> QueryStats | None:
+    """Statistics of request being handled, if any."""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - context._query_started)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach query statistics listeners to engine."""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def report_query_stats(stats: QueryStats) -> None:
+    """Log repeated statement shapes as likely N+1 queries."""
+    threshold = settings.db.N_PLUS_ONE_THRESHOLD
+    for statement, count in stats.repeated(threshold):
+        logger.warning(
+            f"Possible N+1 in {stats.route}: statement repeated {count} times: "
+            f"{statement[:300]}"
+        )
+
+    if settings.db.QUERY_DEBUG:
+        logger.debug(
+            f"{stats.route}: {stats.count} queries in {stats.duration * 1000:.1f} ms"
+        )
@@ -0,0 +1,50 @@
+"""Metrics and monitoring endpoints."""
+
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.core import settings
+from app.core.deps import SuperUser
+from app.core.warmup import readiness
+from app.monitoring import slow_queries
+from app.monitoring.metrics import collect
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False, name="metrics")
+async def metrics(authorization: str | None = Header(default=None)):
+    """Metrics in Prometheus text format."""
+    if not settings.metrics.ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    token = settings.metrics.TOKEN
+    if token and not secrets.compare_digest(authorization or "", f"Bearer {token}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+
+    return PlainTextResponse(await collect(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/health/live", include_in_schema=False, name="health_live")
+async def health_live() -> dict:
+    """Liveness probe: the process serves requests, no database access."""
+    return {"status": "ok"}
+
+
+@router.get("/health/ready", include_in_schema=False, name="health_ready")
+async def health_ready() -> JSONResponse:
+    """Readiness probe: 503 until startup warm-up has finished."""
+    if not readiness.ready:
+        return JSONResponse(
+            {"status": "starting"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+    return JSONResponse({"status": "ready"})
+
+
+@router.get("/monitoring/slow-queries", tags=["monitoring"], name="slow_queries")
+async def get_slow_queries(admin: SuperUser) -> list[dict]:
+    """Recent slow queries with captured plans (admins only)."""
+    recorder = slow_queries.slow_query_recorder
+    return recorder.recent() if recorder else []
@@ -0,0 +1,175 @@
+"""Slow query recorder with EXPLAIN capture."""
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+
+from loguru import logger
+from sqlalchemy import URL, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core import database, settings
+from app.monitoring.queries import current_query_stats, fingerprint
+
+EXPLAINABLE = ("select", "with")
+
+# Do not explain the same statement shape more often than this
+EXPLAIN_INTERVAL = 60.0
+
+
+@dataclass
+class SlowQuery:
+    """Statement that exceeded the slow query threshold."""
+
+    statement: str
+    parameters: list
+    duration_ms: float
+    route: str
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    plan: list | None = None
+    explain_error: str | None = None
+
+
+def _redact(parameters) -> list:
+    if parameters is None:
+        return []
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+    if not settings.db.SLOW_QUERY_REDACT:
+        return [repr(value)[:200] for value in parameters]
+    return [f"<{type(value).__name__}>" for value in parameters]
+
+
+class SlowQueryRecorder:
+    """Keeps the most recent slow statements in a ring buffer.
+
+    Plans are captured with ``EXPLAIN (FORMAT JSON)`` (without ``ANALYZE``,
+    so the statement is never executed again) in a background task on a
+    separate unpooled connection to the database that ran the statement,
+    one at a time and at most once per statement shape per
+    ``EXPLAIN_INTERVAL``.
+    """
+
+    def __init__(self, threshold_ms: float, size: int) -> None:
+        self.threshold = threshold_ms / 1000
+        self.entries: deque[SlowQuery] = deque(maxlen=size)
+        # Engines installed on and their EXPLAIN engines, by database URL
+        self._sources: dict[URL, AsyncEngine] = {}
+        self._explain_engines: dict[URL, AsyncEngine] = {}
+        self._explained_at: dict[str, float] = {}
+        self._explaining = False
+        self._tasks: set[asyncio.Task] = set()
+
+    def install(self, engine: AsyncEngine) -> None:
+        """Attach timing listeners to engine."""
+        self._sources.setdefault(engine.url, engine)
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, params, context, many):
+        context._slow_query_started = time.perf_counter()
+
+    def _after_execute(self, conn, cursor, statement, params, context, many):
+        duration = time.perf_counter() - context._slow_query_started
+        if duration < self.threshold:
+            return
+
+        stats = current_query_stats()
+        entry = SlowQuery(
+            statement=statement,
+            parameters=_redact(params),
+            duration_ms=round(duration * 1000, 2),
+            route=stats.route if stats else "unknown",
+        )
+        self.entries.append(entry)
+        logger.warning(
+            f"Slow query {entry.duration_ms} ms in {entry.route}: "
+            f"{statement[:300]} params={entry.parameters}"
+        )
+
+        if settings.db.SLOW_QUERY_EXPLAIN and not many:
+            self._schedule_explain(entry, params, conn.engine.url)
+
+    def _schedule_explain(self, entry: SlowQuery, params, url: URL) -> None:
+        if self._explaining or not entry.statement.lstrip().lower().startswith(
+            EXPLAINABLE
+        ):
+            return
+
+        shape = fingerprint(entry.statement)
+        now = time.monotonic()
+        if now - self._explained_at.get(shape, -EXPLAIN_INTERVAL) < EXPLAIN_INTERVAL:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._explained_at[shape] = now
+        self._explaining = True
+        task = loop.create_task(self._explain(entry, tuple(params or ()), url))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, entry: SlowQuery, params: tuple, url: URL) -> None:
+        try:
+            engine = self._explain_engines.get(url)
+            if engine is None:
+                engine = self._explain_engines[url] = database.unpooled_engine(
+                    self._sources[url]
+                )
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                plan = await raw.driver_connection.fetchval(
+                    f"EXPLAIN (FORMAT JSON) {entry.statement}", *params
+                )
+            entry.plan = json.loads(plan) if isinstance(plan, str) else plan
+        except Exception as exc:
+            entry.explain_error = str(exc)
+            logger.warning(f"EXPLAIN failed for slow query: {exc}")
+        finally:
+            self._explaining = False
+
+    def recent(self) -> list[dict]:
+        """Recorded slow queries, newest first."""
+        return [asdict(entry) for entry in reversed(self.entries)]
+
+    async def close(self) -> None:
+        """Cancel a running EXPLAIN and close its connections."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for engine in self._explain_engines.values():
+            await engine.dispose()
+        self._explain_engines.clear()
+
+
+slow_query_recorder: SlowQueryRecorder | None = None
+
+
+def install_slow_query_recorder(engines: Iterable[AsyncEngine]) -> None:
+    """Enable recorder on every engine if ``DB_SLOW_QUERY_MS`` is set.
+
+    When disabled no listeners are attached, so there is no overhead.
+    """
+    global slow_query_recorder
+    if settings.db.SLOW_QUERY_MS <= 0 or slow_query_recorder is not None:
+        return
+
+    slow_query_recorder = SlowQueryRecorder(
+        settings.db.SLOW_QUERY_MS, settings.db.SLOW_QUERY_BUFFER
+    )
+    for engine in engines:
+        slow_query_recorder.install(engine)
+
+
+async def stop_slow_query_recorder() -> None:
+    """Close the EXPLAIN connections on shutdown."""
+    if slow_query_recorder is not None:
+        await slow_query_recorder.close()
@@ -0,0 +1,45 @@
+"""Background monitoring tasks."""
+
+import asyncio
+import contextlib
+
+from app.core import settings
+from app.monitoring.metrics import EVENT_LOOP_LAG, flush
+
+_tasks: list[asyncio.Task] = []
+
+
+async def _measure_loop_lag(interval: float) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - start - interval))
+
+
+async def _flush_snapshots(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await flush()
+
+
+def start_monitoring() -> None:
+    """Start event loop lag probe and snapshot writer."""
+    cfg = settings.metrics
+    if not cfg.ENABLED:
+        return
+
+    _tasks.append(asyncio.create_task(_measure_loop_lag(cfg.LOOP_LAG_INTERVAL)))
+    if cfg.MULTIPROC_DIR:
+        _tasks.append(asyncio.create_task(_flush_snapshots(cfg.SNAPSHOT_INTERVAL)))
+
+
+async def stop_monitoring() -> None:
+    """Stop background tasks and write final snapshot."""
+    for task in _tasks:
+        task.cancel()
+    for task in _tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    _tasks.clear()
+    await flush()
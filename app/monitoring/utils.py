@@ -0,0 +1,23 @@
+"""Monitoring helpers."""
+
+from starlette.types import Scope
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """Route path template for request, e.g. ``/product/{slug}``.
+
+    Uses the matched FastAPI route, or the mount prefix for mounted apps
+    (admin, static files). Raw paths are never returned, so the result is
+    safe as a low cardinality log field or metric label.
+    """
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is not None:
+        return path
+
+    mount_path = scope.get("root_path", "")[len(scope.get("app_root_path", "")) :]
+    if mount_path:
+        return f"{mount_path}/*"
+    return UNMATCHED_ROUTE
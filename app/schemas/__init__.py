@@ -7,6 +7,12 @@ from app.schemas.auth import (
     TokenPair,
 )
 from app.schemas.base import BaseSchema
+from app.schemas.batch import (
+    BatchRequest,
+    BatchRequestItem,
+    BatchResponse,
+    BatchResponseItem,
+)
 from app.schemas.carts import (
     CartItemAdd,
     CartItemResponse,
@@ -19,7 +25,15 @@ from app.schemas.category import (
     CategoryRead,
     CategoryUpdate,
 )
-from app.schemas.order import OrderBase, OrderCreate, OrderRead, OrderUpdate
+from app.schemas.order import (
+    OrderBase,
+    OrderCreate,
+    OrderItemsSummary,
+    OrderLineRead,
+    OrderListRead,
+    OrderRead,
+    OrderUpdate,
+)
 from app.schemas.order_item import (
     OrderItemBase,
     OrderItemCreate,
@@ -28,6 +42,13 @@ from app.schemas.order_item import (
 )
 from app.schemas.product import ProductBase, ProductCreate, ProductRead, ProductUpdate
 from app.schemas.review import ReviewBase, ReviewCreate, ReviewRead, ReviewUpdate
+from app.schemas.sales import (
+    CategorySalesTotal,
+    ProductSalesTotal,
+    RollupStatus,
+    SalesDailyCategoryRead,
+    SalesDailyProductRead,
+)
 from app.schemas.user import UserBase, UserCreate, UserInfo, UserRead, UserUpdate
 
 __all__ = [
@@ -43,6 +64,9 @@ __all__ = [
     "OrderBase",
     "OrderCreate",
     "OrderRead",
+    "OrderListRead",
+    "OrderLineRead",
+    "OrderItemsSummary",
     "OrderUpdate",
     "ProductBase",
     "ProductCreate",
@@ -66,4 +90,13 @@ __all__ = [
     "CartItemUpdate",
     "CartItemResponse",
     "CartResponse",
+    "BatchRequest",
+    "BatchRequestItem",
+    "BatchResponse",
+    "BatchResponseItem",
+    "SalesDailyProductRead",
+    "SalesDailyCategoryRead",
+    "ProductSalesTotal",
+    "CategorySalesTotal",
+    "RollupStatus",
 ]
@@ -0,0 +1,36 @@
+"""Batch API Pydantic schemas."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class BatchRequestItem(BaseModel):
+    """One API call of a batch."""
+
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(
+        pattern=r"^/",
+        description="Path with query string, e.g. /products/slug/phone?x=1",
+    )
+    body: Any = Field(None, description="JSON body of the call")
+
+
+class BatchRequest(BaseModel):
+    """API calls to run in one round trip."""
+
+    requests: list[BatchRequestItem] = Field(min_length=1)
+
+
+class BatchResponseItem(BaseModel):
+    """Result of one call, in the order of the request."""
+
+    status: int
+    headers: dict[str, str]
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Results of all calls of a batch."""
+
+    responses: list[BatchResponseItem]
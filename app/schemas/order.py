@@ -2,6 +2,10 @@
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
+
+from pydantic import model_validator
+from sqlalchemy import inspect
 
 from app.models import OrderStatus
 from app.schemas import BaseSchema
@@ -37,3 +41,50 @@ class OrderRead(OrderBase):
     id: int
     created_at: datetime
     updated_at: datetime
+
+
+class OrderLineProduct(BaseSchema):
+    """Product fields shown next to an order line."""
+
+    id: int
+    name: str
+    slug: str | None = None
+    image: str | None = None
+
+
+class OrderLineRead(BaseSchema):
+    """Order line loaded with ``include=items``."""
+
+    id: int
+    product_id: int
+    quantity: int
+    price: Decimal
+    product: OrderLineProduct | None = None
+
+
+class OrderItemsSummary(BaseSchema):
+    """Order lines digest loaded with ``include=items_summary``."""
+
+    item_count: int
+    quantity: int
+    image: str | None = None
+
+
+class OrderListRead(OrderRead):
+    """Order with the relations requested through ``include``."""
+
+    items: list[OrderLineRead] | None = None
+    items_summary: OrderItemsSummary | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _loaded_only(cls, data: Any) -> Any:
+        """Leave out relations that were not loaded instead of lazy loading."""
+        state = inspect(data, raiseerr=False)
+        if state is None:
+            return data
+        return {
+            name: getattr(data, name)
+            for name in cls.model_fields
+            if name not in state.unloaded and hasattr(data, name)
+        }
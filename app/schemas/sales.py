@@ -0,0 +1,49 @@
+"""Sales analytics Pydantic schemas."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from app.schemas import BaseSchema
+
+
+class SalesCounters(BaseSchema):
+    """Counters of a rollup row; cancelled orders are only in cancelled_*."""
+
+    units: int
+    revenue: Decimal
+    order_count: int
+    cancelled_orders: int
+    cancelled_units: int
+
+
+class SalesDailyProductRead(SalesCounters):
+    """Sales of one product on one day."""
+
+    day: date
+    product_id: int
+
+
+class SalesDailyCategoryRead(SalesCounters):
+    """Sales of one category on one day."""
+
+    day: date
+    category_id: int
+
+
+class ProductSalesTotal(SalesCounters):
+    """Sales of one product summed over a period."""
+
+    product_id: int
+
+
+class CategorySalesTotal(SalesCounters):
+    """Sales of one category summed over a period."""
+
+    category_id: int
+
+
+class RollupStatus(BaseSchema):
+    """How current the rollups are."""
+
+    watermark: datetime | None
+    updated_at: datetime | None
@@ -4,6 +4,7 @@ from starlette import status
 
 from app.core import SessionDep, templates
 from app.core.security import AuthUtils
+from app.core.user_cache import user_cache
 from app.crud import order_crud, user_crud
 from app.models import OrderStatus
 
@@ -30,7 +31,7 @@ async def account_page(
     user_id = require_auth(request)
 
     # Get user
-    user = await user_crud.get(session, user_id)
+    user = await user_cache.load(session, user_id)
     if not user:
         # Clear only web user data, keep admin data
         request.session.pop("user_id", None)
@@ -45,7 +46,9 @@ async def account_page(
     stats = await user_crud.get_user_statistics(session, user_id)
 
     # Get recent orders
-    recent_orders = await order_crud.get_by_user_id(session, user_id, limit=5)
+    recent_orders = await order_crud.get_by_user_id(
+        session, user_id, limit=5, include=["items_summary"]
+    )
 
     return templates.TemplateResponse(
         request=request,
@@ -73,12 +76,16 @@ async def account_orders(
         try:
             order_status = OrderStatus[status_filter]
             orders = await order_crud.get_user_orders_by_status(
-                session, user_id, order_status, limit=50
+                session, user_id, order_status, limit=50, include=["items_summary"]
             )
         except KeyError:
-            orders = await order_crud.get_by_user_id(session, user_id, limit=50)
+            orders = await order_crud.get_by_user_id(
+                session, user_id, limit=50, include=["items_summary"]
+            )
     else:
-        orders = await order_crud.get_by_user_id(session, user_id, limit=50)
+        orders = await order_crud.get_by_user_id(
+            session, user_id, limit=50, include=["items_summary"]
+        )
 
     return templates.TemplateResponse(
         request=request,
@@ -248,7 +255,7 @@ async def account_profile(
     """Profile editing page."""
     user_id = require_auth(request)
 
-    user = await user_crud.get(session, user_id)
+    user = await user_cache.load(session, user_id)
     if not user:
         # Clear only web user data, keep admin data
         request.session.pop("user_id", None)
@@ -366,7 +373,9 @@ async def account_password_update(
         raise HTTPException(status_code=404, detail="User not found")
 
     # Check current password
-    if not AuthUtils.verify_password(current_password, user.hashed_password):
+    if not await AuthUtils.verify_password_async(
+        current_password, user.hashed_password
+    ):
         request.session["flash_message"] = "Invalid current password"
         request.session["flash_type"] = "error"
         return RedirectResponse(
@@ -41,7 +41,9 @@ async def login_process(
     user = await user_crud.get_user_by_username(session, username)
 
     # Check user and password
-    if not user or not AuthUtils.verify_password(password, user.hashed_password):
+    if not user or not await AuthUtils.verify_password_async(
+        password, user.hashed_password
+    ):
         request.session["flash_message"] = "Invalid username or password"
         request.session["flash_type"] = "error"
         return RedirectResponse(
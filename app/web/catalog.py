@@ -1,18 +1,41 @@
 from contextlib import suppress
+from decimal import Decimal, InvalidOperation
 
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import HTMLResponse
 
-from app.core import SessionDep, templates
+from app.core import ReadSessionDep, templates
+from app.core.http_cache import (
+    CATEGORY_LIST_KEY,
+    PRODUCT_LIST_KEY,
+    apply_cache_headers,
+    category_key,
+    product_key,
+)
 from app.crud import category_crud, product_crud
 
 router = APIRouter()
 
 
+def _parse_price(value: str | None) -> Decimal | None:
+    """Parse price filter, ignoring empty and invalid values.
+
+    Decimal binds as ``numeric`` like the price column, so the bound stays
+    exact and the comparison can use the price index.
+    """
+    if not value or not value.strip():
+        return None
+    with suppress(InvalidOperation):
+        price = Decimal(value.strip())
+        if price.is_finite():
+            return price
+    return None
+
+
 @router.get("/", response_class=HTMLResponse, name="catalog")
 async def get_catalog(
     request: Request,
-    session: SessionDep,
+    session: ReadSessionDep,
     search: str | None = Query(None, description="Search by name or description"),
     category_id: str | None = Query(None, description="Filter by category"),
     min_price: str | None = Query(None, description="Minimum price"),
@@ -37,15 +60,8 @@ async def get_catalog(
         with suppress(ValueError):
             category_id_int = int(category_id)
 
-    # Convert prices from strings to float, ignoring empty values
-    min_price_float = None
-    max_price_float = None
-    if min_price and min_price.strip():
-        with suppress(ValueError):
-            min_price_float = float(min_price)
-    if max_price and max_price.strip():
-        with suppress(ValueError):
-            max_price_float = float(max_price)
+    min_price_value = _parse_price(min_price)
+    max_price_value = _parse_price(max_price)
 
     # Get all categories for filter
     categories = await category_crud.get_categories_with_product_count(session)
@@ -63,8 +79,8 @@ async def get_catalog(
         session=session,
         search_query=search,
         category_id=category_id_int,
-        min_price=min_price_float,
-        max_price=max_price_float,
+        min_price=min_price_value,
+        max_price=max_price_value,
         only_active=True,
         sort_by=sort,
         offset=offset,
@@ -77,8 +93,8 @@ async def get_catalog(
         session=session,
         search_query=search,
         category_id=category_id_int,
-        min_price=min_price_float,
-        max_price=max_price_float,
+        min_price=min_price_value,
+        max_price=max_price_value,
         only_active=True,
         limit=1000,  # Get large number for counting
     )
@@ -105,7 +121,7 @@ async def get_catalog(
         {"value": "name_desc", "label": "Name: Z-A"},
     ]
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         request=request,
         name="catalog.html",  # Use separate template for catalog
         context={
@@ -129,12 +145,17 @@ async def get_catalog(
         },
     )
 
+    cache_keys = [PRODUCT_LIST_KEY, CATEGORY_LIST_KEY]
+    cache_keys += [category_key(category["id"]) for category in categories]
+    cache_keys += [product_key(product.id) for product in products]
+    return apply_cache_headers(request, response, cache_keys)
+
 
 @router.get("/category/{slug}", response_class=HTMLResponse, name="catalog_by_category")
 async def get_catalog_by_category_slug(
     slug: str,
     request: Request,
-    session: SessionDep,
+    session: ReadSessionDep,
     page: int = Query(1, ge=1),
     per_page: int = Query(12, ge=1, le=50),
 ):
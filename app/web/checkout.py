@@ -2,7 +2,7 @@ from fastapi import APIRouter, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from starlette import status
 
-from app.core import SessionDep, templates
+from app.core import CheckoutSessionDep, templates
 from app.crud import order_crud
 from app.utils.cart import CartManager
 
@@ -12,7 +12,7 @@ router = APIRouter()
 @router.get("/", response_class=HTMLResponse, name="checkout")
 async def checkout_page(
     request: Request,
-    session: SessionDep,
+    session: CheckoutSessionDep,
 ):
     """Display checkout page."""
     cart_details = await CartManager.get_cart_details(request, session)
@@ -49,7 +49,7 @@ async def checkout_page(
 @router.post("/", name="checkout_process")
 async def process_checkout(
     request: Request,
-    session: SessionDep,
+    session: CheckoutSessionDep,
     shipping_address: str = Form(..., min_length=10),
     payment_method: str = Form(default="cash"),
 ):
@@ -89,11 +89,9 @@ async def process_checkout(
             cart_items=cart_items,
         )
 
+        # The confirmation email was queued in the order's transaction
         CartManager.clear_cart(request)
 
-        # TODO: Send email notification (item 8)
-        # await send_order_confirmation_email(order)
-
         request.session["flash_message"] = f"Order #{order.id} successfully created"
         request.session["flash_type"] = "success"
 
@@ -1,7 +1,14 @@
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
-from app.core import SessionDep, templates
+from app.core import ReadSessionDep, templates
+from app.core.http_cache import (
+    CATEGORY_LIST_KEY,
+    PRODUCT_LIST_KEY,
+    apply_cache_headers,
+    category_key,
+    product_key,
+)
 from app.crud import category_crud, product_crud
 
 router = APIRouter()
@@ -10,7 +17,7 @@ router = APIRouter()
 @router.get("/", response_class=HTMLResponse, name="home")
 async def home(
     request: Request,
-    session: SessionDep,
+    session: ReadSessionDep,
 ) -> HTMLResponse:
     """
     Display home page.
@@ -46,7 +53,7 @@ async def home(
     cart = CartManager.get_cart(request)
     cart_count = sum(item.get("quantity", 0) for item in cart.values())
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         request=request,
         name="home.html",
         context={
@@ -59,3 +66,10 @@ async def home(
             "cart_count": cart_count,
         },
     )
+
+    cache_keys = [PRODUCT_LIST_KEY, CATEGORY_LIST_KEY]
+    cache_keys += [category_key(category["id"]) for category in categories_with_counts]
+    cache_keys += [
+        product_key(product.id) for product in featured_products + popular_products
+    ]
+    return apply_cache_headers(request, response, cache_keys)
@@ -4,7 +4,8 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from starlette import status
 
-from app.core import SessionDep, templates
+from app.core import ReadSessionDep, SessionDep, settings, templates
+from app.core.http_cache import apply_cache_headers, category_key, product_key
 from app.crud import product_crud, review_crud
 from app.models import Product
 from app.schemas import ReviewCreate
@@ -16,7 +17,7 @@ router = APIRouter()
 async def product_detail(
     slug: str,
     request: Request,
-    session: SessionDep,
+    session: ReadSessionDep,
 ):
     """Display product detail page."""
     stmt = (
@@ -52,7 +53,7 @@ async def product_detail(
         # can_review = await has_purchased_product(session, user_id, product.id)
         can_review = not user_review  # Simplified version
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         request=request,
         name="product-detail.html",
         context={
@@ -64,9 +65,13 @@ async def product_detail(
             "total_reviews": total_reviews,
             "user_review": user_review,
             "can_review": can_review,
+            "live_stock": settings.events.ENABLED and settings.events.PRODUCT_PAGE,
         },
     )
 
+    cache_keys = [product_key(product.id), category_key(product.category_id)]
+    return apply_cache_headers(request, response, cache_keys)
+
 
 @router.post("/{slug}/review", name="product_add_review")
 async def add_review(
@@ -0,0 +1,56 @@
+"""Minimal in-process ASGI client for benchmarks."""
+
+from collections.abc import Callable
+
+
+async def asgi_request(
+    app: Callable,
+    path: str,
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    body: bytes = b"",
+) -> tuple[int, bytes]:
+    """Send a single request straight to an ASGI app.
+
+    Skips sockets and HTTP parsing so the numbers reflect only
+    application work.
+    """
+    path, _, query = path.partition("?")
+    raw_headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in (headers or {}).items()
+    ]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"bench"), *raw_headers],
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    received = False
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive() -> dict:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
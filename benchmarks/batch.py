@@ -0,0 +1,91 @@
+"""Product screen loaded with separate calls vs one ``POST /batch``.
+
+Usage:
+    python -m benchmarks.batch [--screens 100] [--rtt 100]
+        [--url http://localhost:8000]
+
+Loads the calls of a mobile product screen (product by slug, reviews, rating,
+category, cart) one after another and as a single batch, adding ``--rtt``
+milliseconds per round trip to model a mobile link. Without ``--url`` the
+ASGI app runs in process against the database from ``.env``; seed it with
+``benchmarks.seed``.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import httpx
+
+from benchmarks.loadtest import discover, make_client
+
+
+def screen_calls(product_id: int, slug: str, category_id: int) -> list[str]:
+    return [
+        f"/products/slug/{slug}",
+        f"/products/{product_id}/reviews/?limit=10",
+        f"/products/{product_id}/reviews/rating",
+        f"/categories/{category_id}",
+        "/cart/",
+    ]
+
+
+async def separate(client: httpx.AsyncClient, paths: list[str], rtt: float) -> None:
+    for path in paths:
+        await asyncio.sleep(rtt)
+        (await client.get(path)).raise_for_status()
+
+
+async def batched(client: httpx.AsyncClient, paths: list[str], rtt: float) -> None:
+    await asyncio.sleep(rtt)
+    response = await client.post(
+        "/batch", json={"requests": [{"path": path} for path in paths]}
+    )
+    response.raise_for_status()
+    failed = [r["status"] for r in response.json()["responses"] if r["status"] >= 400]
+    if failed:
+        raise RuntimeError(f"batch calls failed: {failed}")
+
+
+async def main(args) -> None:
+    catalog = await discover(args)
+    rng = random.Random(0)
+    screens = []
+    for _ in range(args.screens):
+        index = rng.randrange(len(catalog.product_ids))
+        screens.append(
+            screen_calls(
+                catalog.product_ids[index],
+                catalog.product_slugs[index],
+                rng.choice(catalog.category_ids),
+            )
+        )
+
+    async with make_client(args) as client:
+        for name, load in (("separate", separate), ("batch", batched)):
+            await load(client, screens[0], 0)
+            latencies = []
+            for paths in screens:
+                start = time.perf_counter()
+                await load(client, paths, args.rtt / 1000)
+                latencies.append((time.perf_counter() - start) * 1000)
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{name:<9} screen p50={quantiles[49]:8.1f}ms "
+                f"p95={quantiles[94]:8.1f}ms"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--screens", type=int, default=100)
+    parser.add_argument("--rtt", type=float, default=100, help="ms per round trip")
+    parser.add_argument("--url", help="server URL; in-process ASGI app if omitted")
+    parser.add_argument("--timeout", type=float, default=30)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,68 @@
+"""Authenticated requests/sec with and without the verified-token cache.
+
+Usage:
+    python -m benchmarks.jwt_cache [--requests 5000]
+
+Drives a minimal app guarded by ``get_current_token_payload`` in process,
+so only JWT handling is measured, not the database.
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import Depends, FastAPI
+
+from app.core.deps import get_current_token_payload
+from app.core.security import AuthUtils
+from app.core.token_cache import token_cache
+from benchmarks.asgi import asgi_request
+
+
+def build_app() -> FastAPI:
+    """Create app with a single authenticated endpoint."""
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(payload: dict = Depends(get_current_token_payload)):  # noqa: B008
+        return {"sub": payload["sub"]}
+
+    return app
+
+
+async def run(app: FastAPI, token: str, requests: int) -> float:
+    """Return requests/sec for sequential authenticated requests."""
+    headers = {"Authorization": f"Bearer {token}"}
+    status, _ = await asgi_request(app, "/me", headers=headers)
+    assert status == 200, status
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await asgi_request(app, "/me", headers=headers)
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int) -> None:
+    app = build_app()
+    token = AuthUtils.create_access_token(user_id=1, username="bench")
+    maxsize = token_cache.maxsize
+
+    token_cache.maxsize = 0
+    token_cache.clear()
+    uncached = await run(app, token, requests)
+
+    token_cache.maxsize = maxsize or 1
+    token_cache.clear()
+    cached = await run(app, token, requests)
+    token_cache.maxsize = maxsize
+
+    print(f"verify every request: {uncached:10.0f} req/s")
+    print(f"verified-token cache: {cached:10.0f} req/s")
+    print(f"speedup:              {cached / uncached:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
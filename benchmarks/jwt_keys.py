@@ -0,0 +1,90 @@
+"""Token minting and verification cost per signing algorithm.
+
+Usage:
+    python -m benchmarks.jwt_keys [--iterations 2000]
+
+Compares RS256 with PEM parsing on every call (previous behaviour),
+RS256 and EdDSA with preloaded key objects.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+from types import SimpleNamespace
+
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+    PublicFormat,
+)
+
+from app.core import security
+from app.core.auth import create_token_pair
+from app.core.keys import JWTKey, KeyManager
+from app.core.security import AuthUtils
+
+
+def _pem_pair(private_key) -> tuple[bytes, bytes]:
+    private_pem = private_key.private_bytes(
+        Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
+    )
+    return private_pem, public_pem
+
+
+def _per_second(func: Callable[[], object], iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - start)
+
+
+def main(iterations: int) -> None:
+    user = SimpleNamespace(id=1, username="bench")
+    rsa_private, rsa_public = _pem_pair(rsa.generate_private_key(65537, 2048))
+    ed_private, ed_public = _pem_pair(ed25519.Ed25519PrivateKey.generate())
+
+    managers = {
+        "RS256": KeyManager(JWTKey.from_pem(rsa_public, rsa_private)),
+        "EdDSA": KeyManager(JWTKey.from_pem(ed_public, ed_private)),
+    }
+    original = security.key_manager
+
+    print(f"{'variant':<14} {'token pairs/s':>14} {'decode/s':>12}")
+
+    token = AuthUtils.encode_jwt({"sub": "1"}, private_key=rsa_private.decode())
+    mint = _per_second(
+        lambda: (
+            AuthUtils.encode_jwt({"sub": "1"}, private_key=rsa_private.decode()),
+            AuthUtils.encode_jwt({"sub": "1"}, private_key=rsa_private.decode()),
+        ),
+        iterations,
+    )
+    verify = _per_second(
+        lambda: AuthUtils.decode_jwt(token, public_key=rsa_public.decode()),
+        iterations,
+    )
+    print(f"{'RS256 (PEM)':<14} {mint:>14.0f} {verify:>12.0f}")
+
+    try:
+        for name, manager in managers.items():
+            security.key_manager = manager
+            token = AuthUtils.create_access_token(user_id=1, username="bench")
+            mint = _per_second(lambda: create_token_pair(user), iterations)
+            verify = _per_second(partial(AuthUtils.decode_jwt, token), iterations)
+            print(f"{name:<14} {mint:>14.0f} {verify:>12.0f}")
+    finally:
+        security.key_manager = original
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,132 @@
+"""Stock updates pushed over ``GET /events`` vs polling.
+
+Usage:
+    python -m benchmarks.live_updates --url http://localhost:8000
+        [--clients 200] [--watch 5] [--writes 20] [--duration 30]
+        [--poll-interval 5]
+
+Opens ``--clients`` event streams, each watching ``--watch`` random
+products, while ``--writes`` stock changes per second are committed through
+``ProductCrud.update_stock`` in this process. Reports requests made,
+events received and the delay from commit to delivery, next to the request
+count and staleness of clients polling every ``--poll-interval`` seconds.
+Needs a running server (the in-process transport buffers streams) using
+the database from ``.env``; seed it with ``benchmarks.seed``.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+import httpx
+
+from benchmarks.loadtest import discover
+
+
+async def watch(
+    client: httpx.AsyncClient,
+    product_ids: list[int],
+    committed: dict[tuple[int, int], float],
+    delays: list[float],
+    deadline: float,
+) -> int:
+    """Read one stream until ``deadline``, returning the events received."""
+    received = 0
+    params = {"products": product_ids}
+    try:
+        async with asyncio.timeout(max(deadline - time.perf_counter(), 0)):
+            async with client.stream("GET", "/events", params=params) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    event = json.loads(line.removeprefix("data: "))
+                    received += 1
+                    sent_at = committed.get((event["id"], event["stock"]))
+                    if sent_at is not None:
+                        delays.append((time.perf_counter() - sent_at) * 1000)
+    except TimeoutError:
+        pass
+    return received
+
+
+async def write(
+    product_ids: list[int],
+    committed: dict[tuple[int, int], float],
+    args,
+    deadline: float,
+) -> int:
+    """Add one unit of stock to random products at ``--writes`` per second."""
+    from app.core import async_session
+    from app.crud import product_crud
+
+    rng = random.Random(1)
+    writes = 0
+    while time.perf_counter() < deadline:
+        product_id = rng.choice(product_ids)
+        async with async_session() as session:
+            started = time.perf_counter()
+            product = await product_crud.update_stock(session, product_id, 1)
+        committed[(product_id, product.stock)] = started
+        writes += 1
+        await asyncio.sleep(1 / args.writes)
+    return writes
+
+
+async def main(args) -> None:
+    catalog = await discover(args)
+    rng = random.Random(0)
+    committed: dict[tuple[int, int], float] = {}
+    delays: list[float] = []
+
+    limits = httpx.Limits(max_connections=args.clients)
+    async with httpx.AsyncClient(
+        base_url=args.url, timeout=args.timeout, limits=limits
+    ) as client:
+        deadline = time.perf_counter() + args.duration
+        streams = [
+            watch(
+                client,
+                rng.sample(catalog.product_ids, args.watch),
+                committed,
+                delays,
+                deadline,
+            )
+            for _ in range(args.clients)
+        ]
+
+        async def writer() -> int:
+            # Let the streams subscribe before the first write
+            await asyncio.sleep(1)
+            return await write(catalog.product_ids, committed, args, deadline)
+
+        *received, writes = await asyncio.gather(*streams, writer())
+
+    polls = int(args.clients * args.duration / args.poll_interval)
+    print(f"writes     {writes} stock changes in {args.duration:.0f}s")
+    print(f"sse        requests={args.clients:<8} events={sum(received)}")
+    if len(delays) >= 2:
+        quantiles = statistics.quantiles(delays, n=100)
+        print(f"           delay p50={quantiles[49]:8.1f}ms p95={quantiles[94]:8.1f}ms")
+    print(
+        f"polling    requests={polls:<8} mean delay={args.poll_interval * 500:8.1f}ms"
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", required=True, help="server URL")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--watch", type=int, default=5, help="products per client")
+    parser.add_argument("--writes", type=float, default=20, help="per second")
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--poll-interval", type=float, default=5)
+    parser.add_argument("--timeout", type=float, default=30)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
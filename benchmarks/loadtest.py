@@ -0,0 +1,338 @@
+"""HTTP load test for storefront, API and checkout flows.
+
+Usage:
+    python -m benchmarks.loadtest [--scenarios browse,api] [--concurrency 20]
+        [--duration 30] [--url http://localhost:8000]
+        [--output results.json] [--baseline baseline.json] [--threshold 0.1]
+
+Without ``--url`` requests go straight to the ASGI app in process (the
+database from ``.env`` is still used). Scenarios that log in expect users
+created by ``benchmarks.seed``.
+
+Exit status is 1 when a scenario regresses against the baseline by more
+than ``--threshold``: lower RPS, higher p95, or a higher error rate.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+DEFAULT_PASSWORD = "benchmark"
+USERNAME_TEMPLATE = "user{n}"
+
+SORTS = ("newest", "price_asc", "price_desc", "name_asc", "name_desc")
+
+
+@dataclass
+class Catalog:
+    """Ids and slugs discovered before the run."""
+
+    product_ids: list[int]
+    product_slugs: list[str]
+    category_ids: list[int]
+
+
+@dataclass
+class ScenarioStats:
+    """Latencies and errors collected for one scenario."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> dict:
+        """Aggregate numbers for the report."""
+        latencies = sorted(self.latencies)
+        requests = len(latencies)
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+            "rps": round(requests / self.elapsed, 1) if self.elapsed else 0.0,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "p99_ms": _percentile(latencies, 99),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        }
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, round(percent / 100 * len(values)) - 1))
+    return round(values[index], 2)
+
+
+class Session:
+    """Virtual user: HTTP client with its own cookies and timing."""
+
+    def __init__(self, client: httpx.AsyncClient, stats: ScenarioStats) -> None:
+        self.client = client
+        self.stats = stats
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        ok: Callable[[httpx.Response], bool] | None = None,
+        **kwargs,
+    ) -> httpx.Response | None:
+        """Send request and record latency; non 2xx/3xx counts as error."""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.stats.latencies.append((time.perf_counter() - start) * 1000)
+            self.stats.errors += 1
+            return None
+
+        self.stats.latencies.append((time.perf_counter() - start) * 1000)
+        success = ok(response) if ok else response.status_code < 400
+        if not success:
+            self.stats.errors += 1
+        return response
+
+
+def _redirects_to(prefix: str) -> Callable[[httpx.Response], bool]:
+    def check(response: httpx.Response) -> bool:
+        return response.status_code == 303 and response.headers.get(
+            "location", ""
+        ).startswith(prefix)
+
+    return check
+
+
+def _username(users: int) -> str:
+    return USERNAME_TEMPLATE.format(n=random.randint(1, users))
+
+
+async def browse(session: Session, catalog: Catalog, args) -> None:
+    """Anonymous storefront browsing."""
+    await session.request("GET", "/")
+    params = {"sort": random.choice(SORTS), "page": random.randint(1, 5)}
+    if catalog.category_ids and random.random() < 0.7:
+        params["category_id"] = random.choice(catalog.category_ids)
+    if random.random() < 0.3:
+        params["min_price"] = random.choice((10, 50, 100))
+        params["max_price"] = params["min_price"] * 10
+    await session.request("GET", "/catalog/", params=params)
+    if catalog.product_slugs:
+        slug = random.choice(catalog.product_slugs)
+        await session.request("GET", f"/product/{slug}")
+
+
+async def api(session: Session, catalog: Catalog, args) -> None:
+    """Public API list and detail calls."""
+    offset = random.randint(0, 500)
+    await session.request("GET", "/products/", params={"offset": offset, "limit": 20})
+    if catalog.product_ids:
+        await session.request("GET", f"/products/{random.choice(catalog.product_ids)}")
+    await session.request("GET", "/categories/")
+
+
+async def cart(session: Session, catalog: Catalog, args) -> None:
+    """Anonymous cart mutations."""
+    if not catalog.product_ids:
+        return
+    product_id = random.choice(catalog.product_ids)
+    await session.request(
+        "POST", "/cart/add", data={"product_id": product_id, "quantity": 1}
+    )
+    await session.request(
+        "POST", "/cart/update", data={"product_id": product_id, "quantity": 2}
+    )
+    await session.request("GET", "/cart/")
+    await session.request("POST", "/cart/clear")
+
+
+async def login(session: Session, catalog: Catalog, args) -> None:
+    """API login with password check."""
+    await session.request(
+        "POST",
+        "/auth/login",
+        json={"username": _username(args.users), "password": args.password},
+    )
+
+
+async def checkout(session: Session, catalog: Catalog, args) -> None:
+    """Web login, add to cart and place an order."""
+    if not catalog.product_ids:
+        return
+    await session.request(
+        "POST",
+        "/auth/",
+        data={"username": _username(args.users), "password": args.password},
+        ok=_redirects_to("/account"),
+    )
+    for product_id in random.sample(catalog.product_ids, k=2):
+        await session.request(
+            "POST", "/cart/add", data={"product_id": product_id, "quantity": 1}
+        )
+    await session.request(
+        "POST",
+        "/checkout/",
+        data={"shipping_address": "1 Benchmark Street, Test City"},
+        ok=_redirects_to("/account/orders/"),
+    )
+    session.client.cookies.clear()
+
+
+type Scenario = Callable[[Session, Catalog, argparse.Namespace], Awaitable[None]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "browse": browse,
+    "api": api,
+    "cart": cart,
+    "login": login,
+    "checkout": checkout,
+}
+
+
+def make_client(args) -> httpx.AsyncClient:
+    """Client for a remote server or the in-process ASGI app."""
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+
+    from main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest",
+        timeout=args.timeout,
+    )
+
+
+async def discover(args) -> Catalog:
+    """Collect product ids, slugs and category ids through the API."""
+    async with make_client(args) as client:
+        products = (await client.get("/products/", params={"limit": 100})).json()
+        categories = (await client.get("/categories/", params={"limit": 100})).json()
+    return Catalog(
+        product_ids=[product["id"] for product in products],
+        product_slugs=[product["slug"] for product in products],
+        category_ids=[category["id"] for category in categories],
+    )
+
+
+async def run_scenario(scenario: Scenario, catalog: Catalog, args) -> ScenarioStats:
+    """Run ``concurrency`` virtual users for ``duration`` seconds."""
+    stats = ScenarioStats()
+    deadline = time.perf_counter() + args.duration
+
+    async def user() -> None:
+        async with make_client(args) as client:
+            session = Session(client, stats)
+            while time.perf_counter() < deadline:
+                await scenario(session, catalog, args)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(args.concurrency)))
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Describe regressions of results against baseline."""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if current["rps"] < previous["rps"] * (1 - threshold):
+            regressions.append(f"{name}: rps {previous['rps']} -> {current['rps']}")
+        if current["p95_ms"] > previous["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {previous['p95_ms']} -> {current['p95_ms']} ms"
+            )
+        if current["error_rate"] > previous["error_rate"] + threshold / 10:
+            regressions.append(
+                f"{name}: error rate {previous['error_rate']} -> "
+                f"{current['error_rate']}"
+            )
+    return regressions
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except OSError, subprocess.CalledProcessError:
+        return None
+
+
+async def main(args) -> int:
+    random.seed(args.seed)
+    catalog = await discover(args)
+
+    results = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "revision": _git_revision(),
+        "target": args.url or "asgi",
+        "concurrency": args.concurrency,
+        "duration_s": args.duration,
+        "scenarios": {},
+    }
+    for name in args.scenarios:
+        stats = await run_scenario(SCENARIOS[name], catalog, args)
+        summary = results["scenarios"][name] = stats.summary()
+        print(
+            f"{name:<9} rps={summary['rps']:>8} p50={summary['p50_ms']:>8}ms "
+            f"p95={summary['p95_ms']:>8}ms p99={summary['p99_ms']:>8}ms "
+            f"errors={summary['error_rate']:.2%}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=list(SCENARIOS),
+        help=f"comma separated, from: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--url", help="server URL; in-process ASGI app if omitted")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--users", type=int, default=1000, help="seeded users")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="write results JSON")
+    parser.add_argument("--baseline", type=Path, help="baseline results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="allowed regression (0.1=10%%)"
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return args
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main(parse_args())))
@@ -0,0 +1,108 @@
+"""Catalog latency during a login storm.
+
+Usage:
+    python -m benchmarks.login_storm [--logins 200] [--probes 100]
+
+Runs a burst of concurrent password checks next to a stream of cheap
+"catalog" requests on one event loop, once with bcrypt called inline and
+once through the password hashing pool, and reports catalog latency.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import FastAPI, HTTPException
+
+from app.core.security import AuthUtils, password_executor
+from benchmarks.asgi import asgi_request
+
+PASSWORD = "benchmark-password"
+
+
+def build_app(hashed: str) -> FastAPI:
+    """Create app with inline and pooled login endpoints."""
+    app = FastAPI()
+
+    @app.post("/login/inline")
+    async def login_inline():
+        if not AuthUtils.verify_password(PASSWORD, hashed):
+            raise HTTPException(401)
+        return {"ok": True}
+
+    @app.post("/login/pooled")
+    async def login_pooled():
+        if not await AuthUtils.verify_password_async(PASSWORD, hashed):
+            raise HTTPException(401)
+        return {"ok": True}
+
+    @app.get("/catalog")
+    async def catalog():
+        return {"products": list(range(20))}
+
+    return app
+
+
+async def probe_catalog(app: FastAPI, probes: int, stop: asyncio.Event) -> list[float]:
+    """Measure catalog latency until storm ends or probes run out."""
+    latencies = []
+    for _ in range(probes):
+        if stop.is_set():
+            break
+        start = time.perf_counter()
+        await asgi_request(app, "/catalog")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+    return latencies
+
+
+async def storm(app: FastAPI, path: str, logins: int, probes: int) -> dict:
+    """Run login storm and catalog probes concurrently."""
+    stop = asyncio.Event()
+
+    async def logins_task() -> list[int]:
+        results = await asyncio.gather(
+            *(asgi_request(app, path, method="POST") for _ in range(logins))
+        )
+        stop.set()
+        return [status for status, _ in results]
+
+    start = time.perf_counter()
+    statuses, latencies = await asyncio.gather(
+        logins_task(), probe_catalog(app, probes, stop)
+    )
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "elapsed_s": elapsed,
+        "ok": statuses.count(200),
+        "rejected": statuses.count(503),
+        "catalog_p50_ms": statistics.median(latencies) if latencies else 0.0,
+        "catalog_max_ms": latencies[-1] if latencies else 0.0,
+        "catalog_samples": len(latencies),
+    }
+
+
+async def main(logins: int, probes: int) -> None:
+    hashed = AuthUtils.hash_password(PASSWORD)
+    app = build_app(hashed)
+
+    for name, path in (("inline", "/login/inline"), ("pooled", "/login/pooled")):
+        result = await storm(app, path, logins, probes)
+        print(
+            f"{name:<7} logins ok={result['ok']:<4} 503={result['rejected']:<4} "
+            f"elapsed={result['elapsed_s']:.2f}s  "
+            f"catalog p50={result['catalog_p50_ms']:.2f}ms "
+            f"max={result['catalog_max_ms']:.2f}ms "
+            f"(n={result['catalog_samples']})"
+        )
+    print(f"pool: {password_executor.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--probes", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.probes))
@@ -0,0 +1,88 @@
+"""Checkout query latency while admin queries saturate the database pool.
+
+Usage:
+    python -m benchmarks.pool_isolation [--admin-queries 20] [--probes 200]
+
+Starts many slow "admin" queries (``pg_sleep``) next to a stream of short
+"checkout" queries, once with both on the storefront pool (as without
+``DB_POOLS_ENABLED``) and once on their own pools, and reports checkout
+latency. Requires the database from ``.env``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import admin_session, async_session, checkout_session
+
+
+async def admin_load(
+    maker: async_sessionmaker[AsyncSession], queries: int, seconds: float
+) -> None:
+    """Run slow queries that hold connections."""
+
+    async def heavy() -> None:
+        async with maker() as session:
+            await session.execute(text("SELECT pg_sleep(:s)"), {"s": seconds})
+
+    # Errors are expected when the admin pool times out
+    await asyncio.gather(*(heavy() for _ in range(queries)), return_exceptions=True)
+
+
+async def probe(maker: async_sessionmaker[AsyncSession], probes: int) -> list[float]:
+    """Measure latency of short queries."""
+    latencies = []
+    for _ in range(probes):
+        start = time.perf_counter()
+        async with maker() as session:
+            await session.execute(text("SELECT 1"))
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+    return latencies
+
+
+async def run(
+    name: str,
+    admin_maker: async_sessionmaker[AsyncSession],
+    checkout_maker: async_sessionmaker[AsyncSession],
+    args,
+) -> None:
+    load = asyncio.create_task(admin_load(admin_maker, args.admin_queries, args.sleep))
+    await asyncio.sleep(0.1)
+    try:
+        latencies = await asyncio.wait_for(
+            probe(checkout_maker, args.probes), timeout=args.sleep * 10
+        )
+    except TimeoutError:
+        latencies = []
+    await load
+
+    if not latencies:
+        print(f"{name:<9} checkout timed out")
+        return
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<9} checkout p50={quantiles[49]:7.1f}ms "
+        f"p95={quantiles[94]:7.1f}ms max={max(latencies):7.1f}ms"
+    )
+
+
+async def main(args) -> None:
+    await run("shared", async_session, async_session, args)
+    await run("isolated", admin_session, checkout_session, args)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--admin-queries", type=int, default=20)
+    parser.add_argument("--sleep", type=float, default=2.0, help="admin query time")
+    parser.add_argument("--probes", type=int, default=200)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
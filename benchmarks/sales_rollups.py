@@ -0,0 +1,101 @@
+"""Admin sales reports from orders vs from the daily rollup tables.
+
+Usage:
+    python -m benchmarks.sales_rollups [--days 30] [--repeat 5]
+
+Runs "revenue per day per category" and "top products by units" over the
+last ``--days`` days, once aggregating ``orders`` and ``order_items`` as an
+ad-hoc query would and once reading the rollups, and reports the median
+time of each. Requires the database from ``.env``, seeded with
+``benchmarks.seed`` and rolled up with ``make rebuild-sales-rollups``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import async_session
+from app.crud.sales import (
+    category_rollup_select,
+    get_daily,
+    get_totals,
+    product_rollup_select,
+)
+from app.models import SalesDailyCategory, SalesDailyProduct
+
+type Report = Callable[[AsyncSession, date, date], Awaitable[object]]
+
+
+def _days(start: date, end: date) -> list[date]:
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+async def categories_from_orders(session: AsyncSession, start: date, end: date):
+    return (await session.execute(category_rollup_select(_days(start, end)))).all()
+
+
+async def top_products_from_orders(session: AsyncSession, start: date, end: date):
+    daily = product_rollup_select(_days(start, end)).subquery()
+    units = func.sum(daily.c.units)
+    stmt = (
+        select(daily.c.product_id, units)
+        .group_by(daily.c.product_id)
+        .order_by(units.desc())
+        .limit(25)
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def categories_from_rollup(session: AsyncSession, start: date, end: date):
+    return await get_daily(session, SalesDailyCategory, start, end, limit=100_000)
+
+
+async def top_products_from_rollup(session: AsyncSession, start: date, end: date):
+    return await get_totals(session, SalesDailyProduct, start, end, "units", 25)
+
+
+REPORTS: dict[str, tuple[Report, Report]] = {
+    "revenue per day per category": (categories_from_orders, categories_from_rollup),
+    "top products by units": (top_products_from_orders, top_products_from_rollup),
+}
+
+
+async def timed(report: Report, start: date, end: date, repeat: int) -> float:
+    """Median milliseconds of ``repeat`` runs after a warm-up run."""
+    timings = []
+    for attempt in range(repeat + 1):
+        async with async_session() as session:
+            began = time.perf_counter()
+            await report(session, start, end)
+            if attempt:
+                timings.append((time.perf_counter() - began) * 1000)
+    return statistics.median(timings)
+
+
+async def main(args) -> None:
+    end = datetime.now(UTC).date()
+    start = end - timedelta(days=args.days - 1)
+    for name, (from_orders, from_rollup) in REPORTS.items():
+        orders_ms = await timed(from_orders, start, end, args.repeat)
+        rollup_ms = await timed(from_rollup, start, end, args.repeat)
+        print(
+            f"{name:<30} orders={orders_ms:9.1f}ms rollup={rollup_ms:8.1f}ms "
+            f"x{orders_ms / max(rollup_ms, 1e-3):.0f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
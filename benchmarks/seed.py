@@ -0,0 +1,375 @@
+"""Synthetic large-catalog data for benchmarks.
+
+Usage:
+    python -m benchmarks.seed [--seed 42] [--categories 200]
+        [--products 1000000] [--users 100000] [--orders 3000000]
+        [--reviews 2000000] [--batch 50000] [--truncate] [--no-fk-checks]
+
+Rows are generated deterministically from ``--seed`` and bulk-loaded with
+``COPY`` in batches, bypassing the ORM; the next batch is generated while
+the previous one is being copied. Product popularity in orders and reviews
+follows a Zipf distribution, so a small share of products gets most of the
+traffic. Orders carry 1-6 items (about 10M order items by default).
+
+All users are ``USERNAME_TEMPLATE`` with ``DEFAULT_PASSWORD`` from
+``benchmarks.loadtest``; the password is hashed once and the hash is shared,
+since hashing 100k bcrypt passwords would take longer than the whole load.
+
+Tables must be empty, or pass ``--truncate`` to wipe them first. Explicit
+ids are written and sequences are moved past them afterwards.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import asyncpg
+
+from app.core import settings
+from app.core.security import AuthUtils
+from benchmarks.loadtest import DEFAULT_PASSWORD, USERNAME_TEMPLATE
+
+TABLES = ("categories", "products", "users", "orders", "order_items", "reviews")
+
+# Fixed reference point keeps generated timestamps reproducible
+EPOCH = datetime(2024, 1, 1)
+HISTORY = timedelta(days=730)
+
+ADJECTIVES = ("Classic", "Compact", "Deluxe", "Eco", "Modern", "Portable", "Smart")
+NOUNS = ("Backpack", "Camera", "Chair", "Desk", "Kettle", "Lamp", "Mug", "Speaker")
+DEPARTMENTS = ("Audio", "Books", "Garden", "Home", "Kitchen", "Office", "Outdoor")
+STREETS = ("Main St", "Oak Ave", "Park Rd", "Lake Dr", "Hill Ln", "River Way")
+STATUSES = ("pending", "paid", "shipped", "delivered", "cancelled")
+STATUS_WEIGHTS = (5, 10, 10, 70, 5)
+RATING_WEIGHTS = (5, 5, 10, 30, 50)
+
+type Rows = list[tuple]
+
+
+def _rng(seed: int, table: str) -> random.Random:
+    """Independent generator per table, so counts of one table do not
+    change the data of the others."""
+    return random.Random(f"{seed}:{table}")
+
+
+def _timestamp(rng: random.Random) -> datetime:
+    return EPOCH + timedelta(seconds=rng.randrange(int(HISTORY.total_seconds())))
+
+
+def _price(rng: random.Random) -> Decimal:
+    # Log-uniform between 1 and 2000
+    cents = int(100 * 2000 ** rng.random())
+    return Decimal(cents).scaleb(-2)
+
+
+def zipf_cum_weights(n: int, exponent: float, rng: random.Random) -> list[float]:
+    """Cumulative Zipf weights over ``n`` items in shuffled rank order.
+
+    Shuffling keeps popular products spread over ids and categories
+    instead of all being the oldest rows.
+    """
+    ranks = list(range(1, n + 1))
+    rng.shuffle(ranks)
+    return list(itertools.accumulate(1 / rank**exponent for rank in ranks))
+
+
+def categories(args) -> Iterator[Rows]:
+    rng = _rng(args.seed, "categories")
+    rows = []
+    for category_id in range(1, args.categories + 1):
+        name = f"{rng.choice(DEPARTMENTS)} {category_id}"
+        created = _timestamp(rng)
+        rows.append((category_id, name, f"category-{category_id}", created, created))
+    yield rows
+
+
+def products(args, prices: list[Decimal]) -> Iterator[Rows]:
+    """Products in batches; fills ``prices`` indexed by product id."""
+    rng = _rng(args.seed, "products")
+    prices.append(Decimal(0))
+    for start in range(1, args.products + 1, args.batch):
+        rows = []
+        for product_id in range(start, min(start + args.batch, args.products + 1)):
+            name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {product_id}"
+            price = _price(rng)
+            prices.append(price)
+            created = _timestamp(rng)
+            rows.append(
+                (
+                    product_id,
+                    name,
+                    name.lower().replace(" ", "-"),
+                    f"{name}. Synthetic product for benchmarks.",
+                    price,
+                    rng.randint(1, args.categories),
+                    None,
+                    rng.random() < 0.95,
+                    rng.randint(0, 500),
+                    created,
+                    created,
+                )
+            )
+        yield rows
+
+
+def users(args, hashed_password: str) -> Iterator[Rows]:
+    rng = _rng(args.seed, "users")
+    for start in range(1, args.users + 1, args.batch):
+        rows = []
+        for user_id in range(start, min(start + args.batch, args.users + 1)):
+            username = USERNAME_TEMPLATE.format(n=user_id)
+            created = _timestamp(rng)
+            rows.append(
+                (
+                    user_id,
+                    f"{username}@example.com",
+                    username,
+                    hashed_password,
+                    True,
+                    False,
+                    created,
+                    created,
+                )
+            )
+        yield rows
+
+
+def orders(args, prices: list[Decimal], popularity: list[float]) -> Iterator[tuple]:
+    """Batches of orders with their items, both referencing explicit ids."""
+    rng = _rng(args.seed, "orders")
+    product_ids = range(1, args.products + 1)
+    item_id = 0
+    for start in range(1, args.orders + 1, args.batch):
+        order_rows, item_rows = [], []
+        for order_id in range(start, min(start + args.batch, args.orders + 1)):
+            picked = rng.choices(
+                product_ids, cum_weights=popularity, k=rng.randint(1, 6)
+            )
+            total = Decimal(0)
+            for product_id in dict.fromkeys(picked):
+                quantity = rng.choices((1, 2, 3, 4), weights=(70, 20, 7, 3))[0]
+                price = prices[product_id]
+                total += price * quantity
+                item_id += 1
+                item_rows.append((item_id, order_id, product_id, quantity, price))
+
+            user_id = rng.randint(1, args.users)
+            address = (
+                f"{rng.randint(1, 999)} {rng.choice(STREETS)}, City {user_id % 500}"
+            )
+            created = _timestamp(rng)
+            order_rows.append(
+                (
+                    order_id,
+                    user_id,
+                    rng.choices(STATUSES, weights=STATUS_WEIGHTS)[0],
+                    total,
+                    address,
+                    created,
+                    created + timedelta(hours=rng.randint(0, 240)),
+                )
+            )
+        yield order_rows, item_rows
+
+
+def reviews(args, popularity: list[float]) -> Iterator[Rows]:
+    rng = _rng(args.seed, "reviews")
+    product_ids = range(1, args.products + 1)
+    for start in range(1, args.reviews + 1, args.batch):
+        end = min(start + args.batch, args.reviews + 1)
+        picked = rng.choices(product_ids, cum_weights=popularity, k=end - start)
+        rows = []
+        for review_id, product_id in zip(range(start, end), picked, strict=True):
+            rating = rng.choices((1, 2, 3, 4, 5), weights=RATING_WEIGHTS)[0]
+            comment = f"Rated {rating} of 5." if rng.random() < 0.6 else None
+            rows.append(
+                (
+                    review_id,
+                    product_id,
+                    rng.randint(1, args.users),
+                    rating,
+                    comment,
+                    _timestamp(rng),
+                )
+            )
+        yield rows
+
+
+COLUMNS = {
+    "categories": ("id", "name", "slug", "created_at", "updated_at"),
+    "products": (
+        "id",
+        "name",
+        "slug",
+        "description",
+        "price",
+        "category_id",
+        "image",
+        "is_active",
+        "stock",
+        "created_at",
+        "updated_at",
+    ),
+    "users": (
+        "id",
+        "email",
+        "username",
+        "hashed_password",
+        "is_active",
+        "is_superuser",
+        "created_at",
+        "updated_at",
+    ),
+    "orders": (
+        "id",
+        "user_id",
+        "status",
+        "total_price",
+        "shipping_address",
+        "created_at",
+        "updated_at",
+    ),
+    "order_items": ("id", "order_id", "product_id", "quantity", "price"),
+    "reviews": ("id", "product_id", "user_id", "rating", "comment", "created_at"),
+}
+
+
+async def _pipeline[T](
+    batches: Iterator[T], copy: Callable[[T], Awaitable[None]]
+) -> None:
+    """Copy each batch while the next one is generated in a thread."""
+    sentinel = object()
+    pending = asyncio.to_thread(next, batches, sentinel)
+    while (batch := await pending) is not sentinel:
+        pending = asyncio.ensure_future(asyncio.to_thread(next, batches, sentinel))
+        await copy(batch)
+
+
+class Loader:
+    """COPY batches into tables and report throughput."""
+
+    def __init__(self, conn: asyncpg.Connection) -> None:
+        self.conn = conn
+        self.counts = dict.fromkeys(TABLES, 0)
+
+    async def copy(self, table: str, rows: Rows) -> None:
+        await self.conn.copy_records_to_table(
+            table, records=rows, columns=COLUMNS[table]
+        )
+        self.counts[table] += len(rows)
+
+    async def load(self, table: str, batches: Iterator[Rows]) -> None:
+        start = time.perf_counter()
+        await _pipeline(batches, lambda rows: self.copy(table, rows))
+        self._report(table, start)
+
+    async def load_orders(self, batches: Iterator[tuple]) -> None:
+        start = time.perf_counter()
+
+        async def copy(batch: tuple) -> None:
+            order_rows, item_rows = batch
+            await self.copy("orders", order_rows)
+            await self.copy("order_items", item_rows)
+
+        await _pipeline(batches, copy)
+        self._report("orders", start)
+        print(f"{'order_items':<12} {self.counts['order_items']:>11,} rows")
+
+    def _report(self, table: str, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        rows = self.counts[table]
+        print(
+            f"{table:<12} {rows:>11,} rows {elapsed:>7.1f}s {rows / elapsed:>10,.0f}/s"
+        )
+
+
+async def prepare(conn: asyncpg.Connection, truncate: bool) -> None:
+    """Empty tables or make sure they already are."""
+    if truncate:
+        await conn.execute(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE")
+        return
+
+    for table in TABLES:
+        if await conn.fetchval(f"SELECT EXISTS (SELECT 1 FROM {table})"):
+            raise SystemExit(f"Table {table} is not empty, use --truncate")
+
+
+async def finish(conn: asyncpg.Connection) -> None:
+    """Move sequences past explicit ids and refresh planner statistics."""
+    for table in TABLES:
+        await conn.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        )
+    await conn.execute(f"ANALYZE {', '.join(TABLES)}")
+
+
+async def main(args) -> None:
+    started = time.perf_counter()
+    hashed_password = await asyncio.to_thread(AuthUtils.hash_password, args.password)
+
+    db = settings.db
+    conn = await asyncpg.connect(
+        user=db.USER, password=db.PASSWORD, host=db.HOST, port=db.PORT, database=db.NAME
+    )
+    try:
+        await prepare(conn, args.truncate)
+        if args.no_fk_checks:
+            # Skips FK triggers; needs superuser, ids are consistent by design
+            await conn.execute("SET session_replication_role = replica")
+
+        loader = Loader(conn)
+        prices: list[Decimal] = []
+        popularity = zipf_cum_weights(
+            args.products, args.zipf, _rng(args.seed, "popularity")
+        )
+
+        await loader.load("categories", categories(args))
+        await loader.load("products", products(args, prices))
+        await loader.load("users", users(args, hashed_password))
+        await loader.load_orders(orders(args, prices, popularity))
+        await loader.load("reviews", reviews(args, popularity))
+
+        await conn.execute("RESET session_replication_role")
+        await finish(conn)
+    finally:
+        await conn.close()
+
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=3_000_000)
+    parser.add_argument("--reviews", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=50_000, help="rows per COPY")
+    parser.add_argument(
+        "--zipf", type=float, default=1.1, help="popularity skew exponent"
+    )
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument(
+        "--truncate", action="store_true", help="empty shop tables first"
+    )
+    parser.add_argument(
+        "--no-fk-checks",
+        action="store_true",
+        help="disable FK triggers during load (superuser only)",
+    )
+    args = parser.parse_args()
+
+    if min(args.categories, args.products, args.users) < 1:
+        parser.error("--categories, --products and --users must be positive")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,150 @@
+"""Rows per second serialized by each API read schema.
+
+Usage:
+    python -m benchmarks.serialization [--rows 100] [--seconds 1]
+
+Builds ORM objects in memory and encodes pages of ``--rows`` of them the way
+FastAPI does for ``response_model`` (validate, dump to dicts, ``json.dumps``)
+and through ``app.api.v1.serialization`` as with ``API_FAST_JSON``. No
+database is needed.
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api.v1.serialization import dump_json
+from app.models import Category, Order, OrderItem, Product, Review, User
+from app.models.order import OrderStatus
+from app.schemas import (
+    CategoryRead,
+    OrderListRead,
+    OrderRead,
+    ProductRead,
+    ReviewRead,
+    UserRead,
+)
+
+NOW = datetime(2025, 1, 1, 12, 0)
+STAMPS = {"created_at": NOW, "updated_at": NOW}
+
+
+def product(i: int) -> Product:
+    return Product(
+        id=i,
+        name=f"Product {i}",
+        slug=f"product-{i}",
+        description="Lorem ipsum dolor sit amet. " * 8,
+        price=Decimal("1299.90"),
+        category_id=i % 10,
+        image=f"products/{i}.webp",
+        is_active=True,
+        stock=i % 50,
+        **STAMPS,
+    )
+
+
+def review(i: int) -> Review:
+    row = Review(id=i, product_id=i, user_id=i, rating=5, comment="Great!")
+    # ReviewRead expects both timestamps, the model only stores created_at
+    row.created_at = row.updated_at = NOW
+    return row
+
+
+def order(i: int, lines: int = 0) -> Order:
+    return Order(
+        id=i,
+        user_id=i % 100,
+        status=OrderStatus.pending,
+        total_price=Decimal("2599.80"),
+        shipping_address="Moscow, Tverskaya st. 1, apt. 10",
+        items=[
+            OrderItem(
+                id=i * 10 + n,
+                product_id=n,
+                quantity=2,
+                price=Decimal("1299.90"),
+                product=product(n),
+            )
+            for n in range(lines)
+        ],
+        **STAMPS,
+    )
+
+
+# Read schema and a factory of one row for it
+CASES: dict[str, tuple[type, Callable[[int], object]]] = {
+    "CategoryRead": (
+        CategoryRead,
+        lambda i: Category(id=i, name=f"Category {i}", slug=f"category-{i}", **STAMPS),
+    ),
+    "ProductRead": (ProductRead, product),
+    "ReviewRead": (ReviewRead, review),
+    "UserRead": (
+        UserRead,
+        lambda i: User(
+            id=i,
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+            is_active=True,
+            is_superuser=False,
+            **STAMPS,
+        ),
+    ),
+    "OrderRead": (OrderRead, order),
+    "OrderListRead[items]": (OrderListRead, lambda i: order(i, lines=3)),
+}
+
+
+def fastapi_path(schema: type) -> Callable[[list], bytes]:
+    """Encoding done by FastAPI for ``response_model=list[schema]``."""
+    adapter = TypeAdapter(list[schema])
+
+    def encode(rows: list) -> bytes:
+        value = adapter.validate_python(rows, from_attributes=True)
+        return JSONResponse(adapter.dump_python(value, mode="json")).body
+
+    return encode
+
+
+def fast_path(schema: type) -> Callable[[list], bytes]:
+    return lambda rows: dump_json(list[schema], rows)
+
+
+def rows_per_second(encode: Callable[[list], bytes], rows: list, seconds: float) -> int:
+    encode(rows)
+    pages = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        encode(rows)
+        pages += 1
+    return int(pages * len(rows) / elapsed)
+
+
+def main(args) -> None:
+    for name, (schema, make_row) in CASES.items():
+        rows = [make_row(i) for i in range(args.rows)]
+        if fast_path(schema)(rows) != fastapi_path(schema)(rows):
+            print(f"{name:<21} output differs between paths")
+        default = rows_per_second(fastapi_path(schema), rows, args.seconds)
+        fast = rows_per_second(fast_path(schema), rows, args.seconds)
+        print(
+            f"{name:<21} fastapi={default:>9} rows/s fast={fast:>9} rows/s "
+            f"x{fast / default:.2f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100, help="rows per page")
+    parser.add_argument("--seconds", type=float, default=1.0, help="per measurement")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(parse_args())
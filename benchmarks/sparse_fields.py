@@ -0,0 +1,69 @@
+"""Full rows vs sparse fieldsets on a 100-item product page.
+
+Usage:
+    python -m benchmarks.sparse_fields [--requests 200] [--limit 100]
+        [--fields id,name,price,image] [--url http://localhost:8000]
+
+Requests ``GET /products/`` with and without ``?fields=`` and reports
+latency percentiles and response size. Without ``--url`` the ASGI app runs
+in process against the database from ``.env``; seed it with
+``benchmarks.seed`` so products have descriptions.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from benchmarks.loadtest import make_client
+
+
+async def measure(client: httpx.AsyncClient, params: dict, requests: int) -> dict:
+    """Latency percentiles (ms) and mean body size of sequential requests."""
+    latencies = []
+    sizes = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get("/products/", params=params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        sizes.append(len(response.content))
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": quantiles[49],
+        "p95": quantiles[94],
+        "kb": statistics.mean(sizes) / 1024,
+    }
+
+
+async def main(args) -> None:
+    variants = {
+        "full": {"limit": args.limit},
+        "fields": {"limit": args.limit, "fields": args.fields},
+    }
+    async with make_client(args) as client:
+        # Warm up pools, statement caches and the sparse field path
+        for params in variants.values():
+            await measure(client, params, 5)
+        for name, params in variants.items():
+            result = await measure(client, params, args.requests)
+            print(
+                f"{name:<7} p50={result['p50']:7.2f}ms p95={result['p95']:7.2f}ms "
+                f"size={result['kb']:8.1f}KB"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--fields", default="id,name,price,image")
+    parser.add_argument("--url", help="server URL; in-process ASGI app if omitted")
+    parser.add_argument("--timeout", type=float, default=30)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,83 @@
+"""Buffered vs streamed list responses by page size.
+
+Usage:
+    python -m benchmarks.streaming [--path /users/] [--limits 100,1000,10000]
+        [--requests 5] [--url http://localhost:8000]
+
+Requests the generic CRUD listing with and without ``?stream=`` and reports
+time to first byte, total time and body size. Without ``--url`` the ASGI app
+runs in process and peak Python memory of a request is reported as well; the
+in-process transport buffers bodies, so use ``--url`` for a meaningful time
+to first byte. Seed the database from ``.env`` with ``benchmarks.seed``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+import httpx
+
+from benchmarks.loadtest import make_client
+
+
+async def measure(client: httpx.AsyncClient, args, params: dict) -> dict:
+    """Mean timings (ms), body size and peak traced memory of requests."""
+    ttfb, total, peaks = [], [], []
+    size = 0
+    for _ in range(args.requests):
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        async with client.stream("GET", args.path, params=params) as response:
+            response.raise_for_status()
+            size = 0
+            async for chunk in response.aiter_raw():
+                if not size:
+                    ttfb.append((time.perf_counter() - start) * 1000)
+                size += len(chunk)
+        total.append((time.perf_counter() - start) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+    return {
+        "ttfb": statistics.mean(ttfb),
+        "total": statistics.mean(total),
+        "kb": size / 1024,
+        "peak_mb": max(peaks) / 2**20,
+    }
+
+
+async def main(args) -> None:
+    if not args.url:
+        tracemalloc.start()
+    async with make_client(args) as client:
+        for limit in args.limits:
+            for mode in ("buffered", "json", "ndjson"):
+                params = {"limit": limit}
+                if mode != "buffered":
+                    params["stream"] = mode
+                result = await measure(client, args, params)
+                peak = f" peak={result['peak_mb']:7.1f}MB" if not args.url else ""
+                print(
+                    f"limit={limit:<6} {mode:<8} ttfb={result['ttfb']:8.1f}ms "
+                    f"total={result['total']:8.1f}ms size={result['kb']:9.1f}KB"
+                    f"{peak}"
+                )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default="/users/", help="generic CRUD listing")
+    parser.add_argument(
+        "--limits",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[100, 1000, 10000],
+        help="comma separated page sizes",
+    )
+    parser.add_argument("--requests", type=int, default=5)
+    parser.add_argument("--url", help="server URL; in-process ASGI app if omitted")
+    parser.add_argument("--timeout", type=float, default=60)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,121 @@
+"""Throughput of the production server by number of workers.
+
+Usage:
+    python -m benchmarks.worker_scaling [--workers 1,2,4] [--scenarios browse]
+        [--concurrency 50] [--duration 20] [--port 8100]
+
+For each worker count starts ``python main.py --production`` on a spare port,
+waits until it answers, runs the ``benchmarks.loadtest`` scenarios against it
+and stops it. Reports RPS, p95 and scaling efficiency relative to one worker.
+Requires the database from ``.env`` loaded with ``benchmarks.seed``.
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.loadtest import DEFAULT_PASSWORD, SCENARIOS, discover, run_scenario
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "main.py", "--production", f"--workers={workers}"]
+        + [f"--port={port}"],
+        cwd=ROOT,
+        env=os.environ | {"SERVER_HOST": "127.0.0.1"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.send_signal(signal.SIGINT)
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+async def wait_ready(url: str, timeout: float = 60) -> None:
+    """Poll until the server answers."""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/categories/", params={"limit": 1})
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.5)
+    raise TimeoutError(f"server at {url} did not start")
+
+
+async def measure(workers: int, args) -> dict[str, dict]:
+    """Summary of each scenario with ``workers`` server processes."""
+    server = start_server(workers, args.port)
+    try:
+        await wait_ready(args.url)
+        catalog = await discover(args)
+        # Warm up pools and caches of every worker
+        warmup = argparse.Namespace(**vars(args) | {"duration": 3})
+        await run_scenario(SCENARIOS[args.scenarios[0]], catalog, warmup)
+        return {
+            name: (await run_scenario(SCENARIOS[name], catalog, args)).summary()
+            for name in args.scenarios
+        }
+    finally:
+        stop_server(server)
+
+
+async def main(args) -> None:
+    baseline: dict[str, float] = {}
+    for workers in args.workers:
+        results = await measure(workers, args)
+        for name, summary in results.items():
+            baseline.setdefault(name, summary["rps"] / workers)
+            efficiency = summary["rps"] / (baseline[name] * workers or 1)
+            print(
+                f"workers={workers:<3} {name:<9} rps={summary['rps']:>8} "
+                f"p95={summary['p95_ms']:>8}ms efficiency={efficiency:6.1%} "
+                f"errors={summary['error_rate']:.2%}"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    cpus = os.process_cpu_count() or 1
+    counts = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--workers",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=counts,
+        help="comma separated worker counts",
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        default=["browse"],
+        help=f"comma separated, from: {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20, help="seconds")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--users", type=int, default=1000, help="seeded users")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    args = parser.parse_args()
+    args.url = f"http://127.0.0.1:{args.port}"
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
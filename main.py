@@ -1,26 +1,125 @@
 """FastAPI web shop application entry point."""
 
+import argparse
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.sessions import SessionMiddleware
 
 from app.admin.setup import setup_admin
 from app.api import router_v1
-from app.core import register_exception_handlers, settings
+from app.core import (
+    register_exception_handlers,
+    replica_engine,
+    settings,
+)
+from app.core.database import all_engines, dispose_engines
+from app.core.events import start_events, stop_events
+from app.core.outbox import start_outbox, stop_outbox
+from app.core.replica import ReadYourWritesMiddleware
+from app.core.rollups import start_rollups, stop_rollups
+from app.core.server import (
+    run_production,
+    start_memory_watchdog,
+    stop_memory_watchdog,
+)
+from app.core.sessions import LazySessionMiddleware
+from app.core.warmup import start_warmup, stop_warmup
+from app.monitoring import (
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+    install_slow_query_recorder,
+    instrument_engine,
+    start_monitoring,
+    stop_monitoring,
+    stop_slow_query_recorder,
+)
+from app.monitoring.collectors import register_collectors
+from app.monitoring.router import router as monitoring_router
 from app.web import router as web_router
 
-app = FastAPI(title="FastApi AutoShop")
-app.add_middleware(SessionMiddleware, secret_key=settings.admin.SECRET_KEY)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up and run background tasks; release connections on shutdown."""
+    start_monitoring()
+    start_memory_watchdog()
+    start_warmup(app)
+    start_outbox()
+    start_events()
+    start_rollups()
+    yield
+    await stop_rollups()
+    await stop_events()
+    await stop_outbox()
+    await stop_warmup()
+    await stop_memory_watchdog()
+    await stop_monitoring()
+    await stop_slow_query_recorder()
+    await dispose_engines()
+
+
+# JSON API resources, static files and probes never use the cookie session;
+# /auth and /cart are shared with web pages and keep it
+SESSIONLESS_PATHS = (
+    "/static",
+    "/metrics",
+    "/health",
+    "/monitoring",
+    "/.well-known",
+    "/products",
+    "/categories",
+    "/users",
+    "/orders",
+    "/order_items",
+    "/reviews",
+    "/analytics",
+)
+
+app = FastAPI(title="FastApi AutoShop", lifespan=lifespan)
+if replica_engine is not None:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        secret_key=settings.admin.SECRET_KEY,
+        sticky_seconds=settings.replica.STICKY_SECONDS,
+    )
+app.add_middleware(
+    LazySessionMiddleware,
+    secret_key=settings.admin.SECRET_KEY,
+    exclude_paths=SESSIONLESS_PATHS,
+)
+if settings.db.QUERY_STATS:
+    for engine in all_engines().values():
+        instrument_engine(engine)
+    app.add_middleware(QueryStatsMiddleware)
+install_slow_query_recorder(all_engines().values())
+if settings.metrics.ENABLED:
+    register_collectors(all_engines())
+    app.add_middleware(MetricsMiddleware)
 setup_admin(app)
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 app.include_router(web_router)
+app.include_router(monitoring_router)
 app.include_router(router_v1)
 
 register_exception_handlers(app)
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", reload=True)
+    parser = argparse.ArgumentParser(description="Run the web shop server")
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        help="run several workers without reload (see SERVER_* settings)",
+    )
+    parser.add_argument("--workers", type=int, default=0, help="0 = one per CPU")
+    parser.add_argument("--port", type=int)
+    args = parser.parse_args()
+
+    if args.production:
+        run_production(args.workers, args.port)
+    else:
+        uvicorn.run("main:app", reload=True, port=args.port or 8000)
@@ -0,0 +1,30 @@
+"""Shared pytest configuration.
+
+Test modules import the application, which needs a configured ``.env`` and
+JWT keys. Without them every module is reported as skipped instead of
+failing to import.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+try:
+    import app.core  # noqa: F401
+except (ValidationError, OSError) as exc:  # no .env or JWT keys
+    APP_ERROR: Exception | None = exc
+else:
+    APP_ERROR = None
+
+
+class AppModule(pytest.Module):
+    """Test module skipped before import when the app is not configured."""
+
+    def collect(self):
+        if APP_ERROR is not None:
+            reason = str(APP_ERROR).splitlines()[0]
+            pytest.skip(f"app is not configured: {reason}")
+        return super().collect()
+
+
+def pytest_pycollect_makemodule(module_path, parent):
+    return AppModule.from_parent(parent, path=module_path)
@@ -0,0 +1,192 @@
+"""Unit tests for in-process dispatch of batched API calls."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy.exc import IntegrityError
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+
+from app.api.v1.batch import call, call_scope, is_streaming, run_batch
+from app.core import register_exception_handlers
+from app.core.replica import sticky_to_primary
+from app.schemas import BatchRequestItem
+
+
+def parent_scope() -> dict:
+    """Scope of a ``POST /batch`` request, fresh for every use."""
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/batch",
+        "root_path": "/api",
+        "query_string": b"",
+        "headers": [
+            (b"authorization", b"Bearer token"),
+            (b"content-type", b"application/json"),
+            (b"content-length", b"512"),
+        ],
+        "route": object(),
+        "path_params": {"id": "1"},
+        "state": {"user_id": 1},
+    }
+
+
+def test_call_scope_copies_auth_and_replaces_body_headers() -> None:
+    item = BatchRequestItem(method="POST", path="/cart/?x=1", body={"quantity": 2})
+    scope, body = call_scope(parent_scope(), item)
+
+    assert json.loads(body) == {"quantity": 2}
+    assert scope["method"] == "POST"
+    assert scope["path"] == "/api/cart/"
+    assert scope["raw_path"] == b"/api/cart/"
+    assert scope["query_string"] == b"x=1"
+    assert scope["headers"] == [
+        (b"authorization", b"Bearer token"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    assert "route" not in scope
+    assert "path_params" not in scope
+
+
+def test_call_scope_without_body_and_own_state() -> None:
+    parent = parent_scope()
+    scope, body = call_scope(parent, BatchRequestItem(path="/products"))
+
+    assert body == b""
+    assert scope["headers"] == [(b"authorization", b"Bearer token")]
+    scope["state"]["user_id"] = 2
+    assert parent["state"] == {"user_id": 1}
+
+
+@pytest.mark.parametrize(
+    "path, streaming",
+    [
+        ("/events?products=1", True),
+        ("/events/", True),
+        ("/products?stream=ndjson", True),
+        ("/products?limit=5&stream", True),
+        ("/products?limit=5", False),
+        ("/events-log", False),
+    ],
+)
+def test_is_streaming(path: str, streaming: bool) -> None:
+    assert is_streaming(BatchRequestItem(path=path)) is streaming
+
+
+async def echo(scope, receive, send) -> None:
+    request = Request(scope, receive)
+    response = JSONResponse({"body": (await request.body()).decode()})
+    await response(scope, receive, send)
+
+
+async def endless(scope, receive, send) -> None:
+    async def chunks():
+        while True:
+            yield b"data: 1\n\n"
+            await asyncio.sleep(0.01)
+
+    await StreamingResponse(chunks())(scope, receive, send)
+
+
+async def slow(scope, receive, send) -> None:
+    await asyncio.sleep(10)
+
+
+def test_call_collects_response() -> None:
+    item = BatchRequestItem(method="POST", path="/echo", body=[1])
+    result = asyncio.run(call(echo, parent_scope(), item, timeout=1))
+
+    assert result.status == 200
+    assert "content-length" not in result.headers
+    assert json.loads(result.body) == {"body": "[1]"}
+
+
+def test_streaming_response_ends_on_disconnect() -> None:
+    result = asyncio.run(call(endless, parent_scope(), BatchRequestItem(path="/x"), 5))
+    assert result.status == 200
+
+
+def test_slow_call_times_out() -> None:
+    result = asyncio.run(call(slow, parent_scope(), BatchRequestItem(path="/x"), 0.05))
+    assert result.status == 504
+
+
+def app_scope() -> dict:
+    """Batch scope of an application with the project's exception handlers."""
+    application = FastAPI()
+    register_exception_handlers(application)
+    return parent_scope() | {"app": application}
+
+
+@pytest.mark.parametrize(
+    "exc, status, detail",
+    [
+        (HTTPException(404), 404, "Not Found"),
+        (RequestValidationError([]), 422, []),
+        (IntegrityError("INSERT", {}, Exception()), 409, "IntegrityError conflict"),
+    ],
+    ids=["router 404", "validation", "registered"],
+)
+def test_call_renders_errors_with_app_handlers(exc, status, detail) -> None:
+    async def failing(scope, receive, send) -> None:
+        raise exc
+
+    result = asyncio.run(call(failing, app_scope(), BatchRequestItem(path="/x"), 1))
+    assert result.status == status
+    assert json.loads(result.body)["detail"] == detail
+
+
+def test_call_without_handler_is_server_error() -> None:
+    async def failing(scope, receive, send) -> None:
+        raise RuntimeError("boom")
+
+    result = asyncio.run(call(failing, app_scope(), BatchRequestItem(path="/x"), 1))
+    assert result.status == 500
+
+
+def pinned_reads(items: list[BatchRequestItem]) -> tuple[dict[str, bool], dict]:
+    """Whether each call read from the primary, and the batch state after."""
+    pinned: dict[str, bool] = {}
+
+    async def app(scope, receive, send) -> None:
+        pinned[scope["path"]] = sticky_to_primary(scope)
+        status = 422 if scope["path"].endswith("invalid") else 200
+        await JSONResponse(None, status_code=status)(scope, receive, send)
+
+    parent = parent_scope()
+    asyncio.run(run_batch(app, parent, items, concurrency=2, timeout=1))
+    return pinned, parent["state"]
+
+
+def test_reads_after_a_write_use_the_primary() -> None:
+    pinned, state = pinned_reads(
+        [
+            BatchRequestItem(path="/cart/before"),
+            BatchRequestItem(method="POST", path="/cart/invalid"),
+            BatchRequestItem(path="/cart/between"),
+            BatchRequestItem(method="POST", path="/cart/add"),
+            BatchRequestItem(path="/cart/after"),
+        ]
+    )
+    assert pinned == {
+        "/api/cart/before": False,
+        "/api/cart/invalid": False,
+        "/api/cart/between": False,
+        "/api/cart/add": False,
+        "/api/cart/after": True,
+    }
+    assert sticky_to_primary({"state": state})
+
+
+def test_batch_of_reads_does_not_pin_the_client() -> None:
+    pinned, state = pinned_reads(
+        [BatchRequestItem(path="/products/1"), BatchRequestItem(path="/reviews")]
+    )
+    assert not any(pinned.values())
+    assert not sticky_to_primary({"state": state})
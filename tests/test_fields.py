@@ -0,0 +1,60 @@
+"""Unit tests for ``?fields=`` projections of API lists."""
+
+import json
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.api.v1.utils import fields_response, parse_fields
+from app.models import Product
+from app.schemas import ProductRead
+
+
+class ProductCard(BaseModel):
+    """Schema exposing a field that is not a column."""
+
+    id: int
+    name: str
+    category: str
+
+
+@pytest.mark.parametrize("value", [None, ""])
+def test_absent_parameter_loads_full_objects(value: str | None) -> None:
+    assert parse_fields(value, ProductRead, Product) is None
+
+
+def test_strips_and_deduplicates_in_order() -> None:
+    fields = parse_fields(" price,id , price,,name ", ProductRead, Product)
+    assert fields == ["price", "id", "name"]
+
+
+@pytest.mark.parametrize(
+    "value, schema",
+    [
+        ("id,secret", ProductRead),
+        # Relationship, not a column
+        ("id,category", ProductCard),
+        (" , ,", ProductRead),
+    ],
+    ids=["not in schema", "not a column", "only separators"],
+)
+def test_rejects_unknown_fields(value: str, schema: type[BaseModel]) -> None:
+    with pytest.raises(HTTPException) as info:
+        parse_fields(value, schema, Product)
+    assert info.value.status_code == 400
+    assert info.value.detail.startswith("Unknown fields")
+
+
+def test_lists_fields_both_in_schema_and_model() -> None:
+    with pytest.raises(HTTPException) as info:
+        parse_fields("category", ProductCard, Product)
+    assert info.value.detail == (
+        "Unknown fields: ['category']. Available: ['id', 'name']"
+    )
+
+
+def test_fields_response_encodes_rows() -> None:
+    response = fields_response([{"id": 1, "name": "Phone"}])
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [{"id": 1, "name": "Phone"}]
@@ -0,0 +1,52 @@
+"""Unit tests for merging metrics of several workers."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.monitoring.metrics import SnapshotStore, merge_snapshots
+
+# Far above any real pid, so never alive
+EXITED_PID = 2**22 + 1
+
+
+def snapshot(value: float) -> dict:
+    return {
+        "requests": {
+            "type": "counter",
+            "help": "Requests.",
+            "mode": "sum",
+            "samples": [["requests", {"route": "/"}, value]],
+        },
+        "in_progress": {
+            "type": "gauge",
+            "help": "In progress.",
+            "mode": "sum",
+            "samples": [["in_progress", {}, value]],
+        },
+    }
+
+
+def values(store: SnapshotStore) -> dict[str, float]:
+    merged = merge_snapshots(store.read_all())
+    return {name: metric["samples"][0][2] for name, metric in merged.items()}
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="folding needs fcntl")
+def test_exited_workers_fold_into_one_file(tmp_path: Path) -> None:
+    for started in (1, 2):
+        path = tmp_path / f"{EXITED_PID}-{started}.json"
+        path.write_text(json.dumps(snapshot(10)))
+    store = SnapshotStore(tmp_path)
+    store.write(snapshot(1))
+
+    assert values(store) == {"requests": 21, "in_progress": 1}
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == sorted(
+        [store.path.name, SnapshotStore.DEAD]
+    )
+
+    (tmp_path / f"{EXITED_PID}-3.json").write_text(json.dumps(snapshot(100)))
+    assert values(store) == {"requests": 121, "in_progress": 1}
+    assert values(store) == {"requests": 121, "in_progress": 1}
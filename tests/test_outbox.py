@@ -0,0 +1,71 @@
+"""Unit tests for outbox delivery limits."""
+
+import asyncio
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import OutboxSettings
+from app.core.outbox import OutboxDispatcher, OutboxSink
+from app.crud.outbox import Delivery
+
+
+def outbox_settings(**values) -> OutboxSettings:
+    return OutboxSettings(_env_file=None, **values)
+
+
+def delivery(message_id: int = 1) -> Delivery:
+    return Delivery(message_id, "order.created", "slow", {"order_id": 1}, 1)
+
+
+class BlockingSink(OutboxSink):
+    """Sends in a thread that only ends when released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    async def send(self, delivery: Delivery) -> None:
+        await asyncio.to_thread(self.release.wait, 5)
+
+
+def test_lease_must_cover_a_send_and_recording_results() -> None:
+    with pytest.raises(ValidationError, match="at least twice"):
+        outbox_settings(LEASE=20, SEND_TIMEOUT=15)
+
+
+@pytest.mark.parametrize(
+    "lease, batch_size",
+    [(60, 12), (30, 4), (3600, 50)],
+)
+def test_batch_fits_in_lease(lease: float, batch_size: int) -> None:
+    cfg = outbox_settings(LEASE=lease, SEND_TIMEOUT=15, CONCURRENCY=4, BATCH_SIZE=50)
+    assert OutboxDispatcher({}, cfg).batch_size == batch_size
+
+
+def test_timed_out_thread_keeps_its_slot() -> None:
+    sink = BlockingSink()
+    cfg = outbox_settings(LEASE=0.2, SEND_TIMEOUT=0.05, CONCURRENCY=1)
+
+    async def main() -> list[str | None]:
+        dispatcher = OutboxDispatcher({"slow": sink}, cfg)
+        deadline = asyncio.get_running_loop().time() + 0.1
+        errors = await asyncio.gather(
+            dispatcher.deliver(delivery(1), deadline),
+            dispatcher.deliver(delivery(2), deadline),
+        )
+        assert dispatcher.limits["slow"].locked()
+        sink.release.set()
+        await asyncio.sleep(0.05)
+        assert not dispatcher.limits["slow"].locked()
+        return errors
+
+    timed_out, no_slot = asyncio.run(main())
+    assert timed_out == "TimeoutError()"
+    assert no_slot == "No free send slot within the lease"
+
+
+def test_unknown_sink_is_an_error() -> None:
+    dispatcher = OutboxDispatcher({}, outbox_settings())
+    error = asyncio.run(dispatcher.deliver(delivery(), 0))
+    assert error == "Sink 'slow' is not configured"
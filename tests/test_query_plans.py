@@ -0,0 +1,263 @@
+"""Plan regression tests for CRUD queries.
+
+Runs read-only ``*Crud`` methods against a database loaded with
+``make seed``, captures every statement they execute and fails if
+``EXPLAIN`` shows a sequential scan on a large table. Skipped when the
+database is unreachable or not seeded.
+
+Not covered: ``search_products`` text search (``ILIKE '%...%'`` needs a
+trigram index) and ``get_categories_with_product_count``, which counts
+every active product by design.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import settings
+from app.crud import (
+    category_crud,
+    order_crud,
+    order_item_crud,
+    product_crud,
+    review_crud,
+    user_crud,
+)
+from app.crud.order import ORDER_INCLUDES
+from app.crud.sales import (
+    category_rollup_select,
+    changed_days,
+    product_rollup_select,
+)
+from app.models import OrderStatus
+
+LARGE_TABLES = {"products", "users", "orders", "order_items", "reviews"}
+
+# Fewer products than this and the planner rightly prefers seq scans
+MIN_PRODUCTS = 100_000
+
+
+@dataclass
+class Sample:
+    """Existing ids to query with."""
+
+    product_id: int
+    product_slug: str
+    category_id: int
+    user_id: int
+    username: str
+    email: str
+    order_id: int
+
+
+type Case = Callable[[AsyncSession, Sample], Awaitable[object]]
+
+HOUR = timedelta(hours=1)
+
+
+def _utc_now() -> datetime:
+    """Naive UTC like the timestamp columns."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+CASES: dict[str, Case] = {
+    "ProductCrud.get_by_slug": lambda s, x: product_crud.get_by_slug(s, x.product_slug),
+    "ProductCrud.get_by_category": lambda s, x: product_crud.get_by_category(
+        s, x.category_id
+    ),
+    "ProductCrud.get_active_products": lambda s, x: product_crud.get_active_products(s),
+    "ProductCrud.get_low_stock_products": (
+        lambda s, x: product_crud.get_low_stock_products(s)
+    ),
+    "ProductCrud.search_products[newest]": lambda s, x: product_crud.search_products(s),
+    "ProductCrud.search_products[category]": (
+        lambda s, x: product_crud.search_products(s, category_id=x.category_id)
+    ),
+    "ProductCrud.search_products[price]": lambda s, x: product_crud.search_products(
+        s, min_price=Decimal("100"), max_price=Decimal("120"), sort_by="price_asc"
+    ),
+    "ProductCrud.search_products[category_price]": (
+        lambda s, x: product_crud.search_products(
+            s,
+            category_id=x.category_id,
+            min_price=Decimal("10"),
+            max_price=Decimal("100"),
+            sort_by="price_desc",
+        )
+    ),
+    "ProductCrud.search_products[name]": lambda s, x: product_crud.search_products(
+        s, sort_by="name_asc"
+    ),
+    "CategoryCrud.get_with_products": lambda s, x: category_crud.get_with_products(
+        s, x.category_id
+    ),
+    "OrderCrud.get_by_user_id": lambda s, x: order_crud.get_by_user_id(s, x.user_id),
+    "OrderCrud.get_by_user_id[include]": lambda s, x: order_crud.get_by_user_id(
+        s, x.user_id, include=ORDER_INCLUDES
+    ),
+    "OrderCrud.get_by_status": lambda s, x: order_crud.get_by_status(
+        s, OrderStatus.pending
+    ),
+    "OrderCrud.get_user_orders_by_status": (
+        lambda s, x: order_crud.get_user_orders_by_status(
+            s, x.user_id, OrderStatus.delivered
+        )
+    ),
+    "OrderCrud.get_with_items": lambda s, x: order_crud.get_with_items(s, x.order_id),
+    "OrderItemCrud.get_by_order_id": lambda s, x: order_item_crud.get_by_order_id(
+        s, x.order_id
+    ),
+    "ReviewCrud.get_by_product_id": lambda s, x: review_crud.get_by_product_id(
+        s, x.product_id
+    ),
+    "ReviewCrud.get_by_user_id": lambda s, x: review_crud.get_by_user_id(s, x.user_id),
+    "ReviewCrud.get_user_review_for_product": (
+        lambda s, x: review_crud.get_user_review_for_product(s, x.user_id, x.product_id)
+    ),
+    "ReviewCrud.get_average_rating": lambda s, x: review_crud.get_average_rating(
+        s, x.product_id
+    ),
+    "ReviewCrud.get_rating_counts": lambda s, x: review_crud.get_rating_counts(
+        s, x.product_id
+    ),
+    "UserCrud.get_user_by_username": lambda s, x: user_crud.get_user_by_username(
+        s, x.username
+    ),
+    "UserCrud.get_user_by_email": lambda s, x: user_crud.get_user_by_email(s, x.email),
+    "UserCrud.get_active_users": lambda s, x: user_crud.get_active_users(s),
+    "UserCrud.get_user_statistics": lambda s, x: user_crud.get_user_statistics(
+        s, x.user_id
+    ),
+    "BaseCrud.get_multi": lambda s, x: order_crud.get_multi(s, offset=1000),
+    "sales.changed_days": lambda s, x: changed_days(s, _utc_now() - HOUR, _utc_now()),
+    "sales.product_rollup_select": lambda s, x: s.execute(
+        product_rollup_select([_utc_now().date()])
+    ),
+    "sales.category_rollup_select": lambda s, x: s.execute(
+        category_rollup_select([_utc_now().date()])
+    ),
+}
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Large tables read with a sequential scan anywhere in plan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan["Relation Name"] in LARGE_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def _sample(session: AsyncSession) -> Sample | None:
+    products = await session.scalar(text("SELECT COUNT(*) FROM products"))
+    if products < MIN_PRODUCTS:
+        return None
+
+    product = (
+        await session.execute(
+            text("SELECT id, slug, category_id FROM products WHERE is_active LIMIT 1")
+        )
+    ).one()
+    user = (
+        await session.execute(
+            text(
+                "SELECT u.id, u.username, u.email FROM users u "
+                "WHERE EXISTS (SELECT 1 FROM orders o WHERE o.user_id = u.id) LIMIT 1"
+            )
+        )
+    ).one()
+    order_id = await session.scalar(
+        text("SELECT id FROM orders WHERE user_id = :user_id LIMIT 1"),
+        {"user_id": user.id},
+    )
+    return Sample(
+        product_id=product.id,
+        product_slug=product.slug,
+        category_id=product.category_id,
+        user_id=user.id,
+        username=user.username,
+        email=user.email,
+        order_id=order_id,
+    )
+
+
+async def _explain_case(case: Case) -> list[tuple[str, list[str]]] | None:
+    """Run case and EXPLAIN each captured statement.
+
+    Returns None when the dataset is not loaded.
+    """
+    engine = create_async_engine(settings.db.DATABASE_URL, poolclass=NullPool)
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, params, context, many):
+        statements.append((statement, tuple(params or ())))
+
+    try:
+        async with AsyncSession(engine) as session:
+            sample = await _sample(session)
+            if sample is None:
+                return None
+
+            event.listen(engine.sync_engine, "before_cursor_execute", capture)
+            await case(session, sample)
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+            conn = await session.connection()
+            raw = (await conn.get_raw_connection()).driver_connection
+            results = []
+            for statement, params in statements:
+                plan = await raw.fetchval(f"EXPLAIN (FORMAT JSON) {statement}", *params)
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                results.append((statement, seq_scans(plan[0]["Plan"])))
+            return results
+    finally:
+        await engine.dispose()
+
+
+def _database_available() -> bool:
+    async def ping() -> None:
+        engine = create_async_engine(settings.db.DATABASE_URL, poolclass=NullPool)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        finally:
+            await engine.dispose()
+
+    try:
+        asyncio.run(asyncio.wait_for(ping(), timeout=5))
+    except OSError, TimeoutError, DBAPIError:
+        return False
+    return True
+
+
+pytestmark = pytest.mark.skipif(
+    not _database_available(), reason="database is not available"
+)
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_no_seq_scan_on_large_tables(name: str) -> None:
+    results = asyncio.run(_explain_case(CASES[name]))
+    if results is None:
+        pytest.skip(f"dataset too small, run `make seed` (>= {MIN_PRODUCTS} products)")
+
+    assert results, f"{name} executed no statements"
+    offending = [
+        f"{', '.join(tables)}: {statement}" for statement, tables in results if tables
+    ]
+    assert not offending, f"{name} scans large tables sequentially:\n" + "\n".join(
+        offending
+    )
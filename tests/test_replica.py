@@ -0,0 +1,84 @@
+"""Unit tests for read-your-writes stickiness on the primary."""
+
+import asyncio
+import time
+
+import itsdangerous
+import pytest
+
+from app.core.replica import (
+    ReadYourWritesMiddleware,
+    record_write,
+    sticky_to_primary,
+)
+
+SECRET = "secret"
+
+
+def request(
+    middleware: ReadYourWritesMiddleware,
+    method: str = "GET",
+    cookie: str | None = None,
+    status: int = 200,
+    wrote: bool | None = None,
+) -> tuple[bool, str | None]:
+    """Stickiness seen by the app and the ``primary_until`` cookie set."""
+    seen: dict = {}
+
+    async def app(scope, receive, send) -> None:
+        seen["sticky"] = sticky_to_primary(scope)
+        if wrote is not None:
+            record_write(scope, wrote)
+        await send({"type": "http.response.start", "status": status, "headers": []})
+
+    async def send(message) -> None:
+        for name, value in message.get("headers", []):
+            if name == b"set-cookie":
+                seen["cookie"] = value.decode().split(";")[0].split("=", 1)[1]
+
+    headers = [(b"cookie", f"session=x; primary_until={cookie}".encode())]
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/api/v1/orders",
+        "headers": headers if cookie is not None else [],
+    }
+    middleware.app = app
+    asyncio.run(middleware(scope, None, send))
+    return seen["sticky"], seen.get("cookie")
+
+
+@pytest.fixture
+def middleware() -> ReadYourWritesMiddleware:
+    return ReadYourWritesMiddleware(None, secret_key=SECRET, sticky_seconds=5)
+
+
+def test_reads_without_writes_use_replica(middleware) -> None:
+    assert request(middleware) == (False, None)
+
+
+def test_write_pins_later_reads(middleware) -> None:
+    sticky, cookie = request(middleware, "POST", status=201)
+    assert not sticky
+    assert cookie is not None
+    assert request(middleware, cookie=cookie) == (True, None)
+
+
+def test_failed_write_sets_no_cookie(middleware) -> None:
+    assert request(middleware, "POST", status=422) == (False, None)
+
+
+def test_unsafe_request_without_writes_sets_no_cookie(middleware) -> None:
+    assert request(middleware, "POST", wrote=False) == (False, None)
+    assert request(middleware, "POST", wrote=True)[1] is not None
+
+
+@pytest.mark.parametrize(
+    "deadline, secret",
+    [(time.time() - 1, SECRET), (time.time() + 60, "forged")],
+    ids=["expired", "forged"],
+)
+def test_rejects_expired_or_forged_cookie(middleware, deadline, secret) -> None:
+    signer = itsdangerous.Signer(secret, salt="read-your-writes")
+    cookie = signer.sign(f"{deadline:.3f}").decode()
+    assert request(middleware, cookie=cookie) == (False, None)
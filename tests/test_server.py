@@ -0,0 +1,68 @@
+"""Unit tests for sizing worker pools to the connection budget."""
+
+import pytest
+
+from app.core import settings
+from app.core.server import dedicated_connections, size_pools
+
+
+@pytest.fixture
+def budget(monkeypatch: pytest.MonkeyPatch):
+    """Set connection limits and pools; no connections outside pools."""
+
+    def configure(max_connections: int, reserved: int = 0, instances: int = 1):
+        monkeypatch.setattr(settings.server, "DB_MAX_CONNECTIONS", max_connections)
+        monkeypatch.setattr(settings.server, "DB_RESERVED_CONNECTIONS", reserved)
+        monkeypatch.setattr(settings.server, "INSTANCES", instances)
+
+    monkeypatch.setattr(settings.db, "POOL_SIZE", 10)
+    monkeypatch.setattr(settings.db, "MAX_OVERFLOW", 10)
+    monkeypatch.setattr(settings.pools, "ENABLED", True)
+    for pool in (settings.pools.CHECKOUT, settings.pools.ADMIN):
+        monkeypatch.setattr(pool, "SIZE", 4)
+        monkeypatch.setattr(pool, "MAX_OVERFLOW", 2)
+    monkeypatch.setattr(settings.pools.BACKGROUND, "SIZE", 2)
+    monkeypatch.setattr(settings.pools.BACKGROUND, "MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings.events, "ENABLED", False)
+    monkeypatch.setattr(settings.db, "SLOW_QUERY_MS", 0)
+    return configure
+
+
+def total(pools: dict[str, tuple[int, int]]) -> int:
+    return sum(size + overflow for size, overflow in pools.values())
+
+
+def test_keeps_pools_within_budget(budget) -> None:
+    budget(1000)
+    assert size_pools(workers=4) == {
+        "storefront": (10, 10),
+        "checkout": (4, 2),
+        "admin": (4, 2),
+        "background": (2, 0),
+    }
+
+
+def test_shrinks_pools_to_worker_share(budget) -> None:
+    budget(110, reserved=10, instances=2)
+    pools = size_pools(workers=5)
+
+    assert total(pools) <= 10
+    assert all(size >= 1 for size, _ in pools.values())
+    assert pools["storefront"][0] > pools["background"][0]
+
+
+def test_reserves_connections_outside_pools(budget, monkeypatch) -> None:
+    budget(70)
+    assert total(size_pools(workers=2)) == 34
+
+    monkeypatch.setattr(settings.events, "ENABLED", True)
+    monkeypatch.setattr(settings.db, "SLOW_QUERY_MS", 100)
+    monkeypatch.setattr(settings.db, "SLOW_QUERY_EXPLAIN", True)
+    assert dedicated_connections() == 2
+    assert total(size_pools(workers=2)) <= 33
+
+
+def test_rejects_budget_below_one_connection_per_pool(budget) -> None:
+    budget(12)
+    with pytest.raises(ValueError, match="cannot serve 4 pools"):
+        size_pools(workers=4)
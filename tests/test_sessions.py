@@ -0,0 +1,95 @@
+"""Unit tests for lazily decoded cookie sessions."""
+
+import json
+import time
+from base64 import b64encode
+
+import itsdangerous
+import pytest
+
+from app.core.sessions import LazySession
+
+SECRET = "secret"
+MAX_AGE = 3600
+
+signer = itsdangerous.TimestampSigner(SECRET)
+
+
+class _SignedAt(itsdangerous.TimestampSigner):
+    def __init__(self, timestamp: float) -> None:
+        super().__init__(SECRET)
+        self.timestamp = int(timestamp)
+
+    def get_timestamp(self) -> int:
+        return self.timestamp
+
+
+def cookie(data: dict, signed_at: float | None = None) -> str:
+    """Session cookie value as ``LazySessionMiddleware`` would set it."""
+    by = signer if signed_at is None else _SignedAt(signed_at)
+    return by.sign(b64encode(json.dumps(data).encode())).decode()
+
+
+def session(cookie_value: str | None = None) -> LazySession:
+    headers = [(b"accept", b"*/*")]
+    if cookie_value is not None:
+        headers.append((b"cookie", f"other=1; session={cookie_value}".encode()))
+    return LazySession({"headers": headers}, "session", signer, MAX_AGE)
+
+
+def test_untouched_session_is_never_decoded() -> None:
+    lazy = session("not a valid cookie")
+    assert lazy.encode() is None
+    assert not lazy.had_cookie
+
+
+def test_reads_signed_cookie() -> None:
+    lazy = session(cookie({"user_id": 1}))
+    assert lazy["user_id"] == 1
+    assert lazy.had_cookie
+    assert lazy.encode() is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["garbage", cookie({"user_id": 1})[:-2] + "xx"],
+    ids=["unsigned", "bad signature"],
+)
+def test_invalid_cookie_gives_empty_session(value: str) -> None:
+    lazy = session(value)
+    assert dict(lazy) == {}
+    assert not lazy.had_cookie
+
+
+def test_expired_cookie_gives_empty_session() -> None:
+    lazy = session(cookie({"user_id": 1}, signed_at=time.time() - MAX_AGE - 10))
+    assert "user_id" not in lazy
+
+
+def test_changes_are_encoded() -> None:
+    lazy = session(cookie({"user_id": 1}))
+    lazy["cart"] = {"5": 2}
+    assert json.loads(lazy.encode()) == {"user_id": 1, "cart": {"5": 2}}
+
+
+def test_new_empty_session_sends_nothing() -> None:
+    lazy = session()
+    assert lazy.get("user_id") is None
+    assert lazy.encode() is None
+
+
+def test_cleared_session_is_encoded_empty() -> None:
+    lazy = session(cookie({"user_id": 1}))
+    lazy.clear()
+    assert lazy.encode() == b"{}"
+    assert lazy.had_cookie
+
+
+def test_refreshes_cookie_after_half_of_max_age() -> None:
+    fresh = session(cookie({"user_id": 1}, signed_at=time.time() - 60))
+    assert fresh["user_id"] == 1
+    assert fresh.encode() is None
+
+    aging = session(cookie({"user_id": 1}, signed_at=time.time() - MAX_AGE * 0.6))
+    assert aging["user_id"] == 1
+    assert json.loads(aging.encode()) == {"user_id": 1}
@@ -0,0 +1,107 @@
+"""Unit tests for the verified JWT claims cache."""
+
+import time
+
+import pytest
+
+from app.core.token_cache import VerifiedTokenCache
+
+NOW = 1_000_000.0
+
+
+@pytest.fixture(autouse=True)
+def frozen_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(time, "time", lambda: NOW)
+
+
+def claims(sub: str = "1", exp: float = NOW + 60, **extra) -> dict:
+    return {"sub": sub, "exp": exp, **extra}
+
+
+def test_returns_copy_of_cached_claims() -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.put("token", claims())
+
+    cached = cache.get("token")
+    assert cached == claims()
+    cached["sub"] = "2"
+    assert cache.get("token") == claims()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sub": "1"},
+        claims(exp=NOW),
+        claims(exp=NOW - 1),
+        claims(nbf=NOW + 1),
+    ],
+    ids=["no exp", "expires now", "expired", "not yet valid"],
+)
+def test_does_not_cache_unusable_tokens(payload: dict) -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.put("token", payload)
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_caches_token_valid_since_nbf() -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.put("token", claims(nbf=NOW))
+    assert cache.get("token") is not None
+
+
+def test_drops_entry_once_expired(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.put("token", claims(exp=NOW + 60))
+
+    monkeypatch.setattr(time, "time", lambda: NOW + 60)
+    assert cache.get("token") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = VerifiedTokenCache(maxsize=2)
+    cache.put("a", claims("a"))
+    cache.put("b", claims("b"))
+    cache.get("a")
+    cache.put("c", claims("c"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_zero_size_disables_cache() -> None:
+    cache = VerifiedTokenCache(maxsize=0)
+    cache.put("token", claims())
+    assert cache.get("token") is None
+
+
+def test_evict_subject_drops_all_tokens_of_user() -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    cache.put("a1", claims("1"))
+    cache.put("a2", claims("1", jti="2"))
+    cache.put("b", claims("2"))
+
+    cache.evict_subject(1)
+
+    assert cache.get("a1") is None
+    assert cache.get("a2") is None
+    assert cache.get("b") is not None
+
+
+def test_decode_verifies_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = VerifiedTokenCache(maxsize=10)
+    calls = []
+
+    def decode_jwt(token: str) -> dict:
+        calls.append(token)
+        return claims()
+
+    monkeypatch.setattr("app.core.token_cache.AuthUtils.decode_jwt", decode_jwt)
+
+    assert cache.decode("token") == claims()
+    assert cache.decode("token") == claims()
+    assert calls == ["token"]
+    assert (cache.hits, cache.misses) == (1, 1)
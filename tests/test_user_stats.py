@@ -0,0 +1,103 @@
+"""Unit tests for user statistics deltas of a flush."""
+
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.crud.user_stats import (
+    StatsDelta,
+    cascaded_reviews_select,
+    collect_deltas,
+)
+from app.models import Category, Order, OrderStatus, Product, Review, User
+
+
+def persistent(session: Session, obj):
+    """Attach ``obj`` as if loaded from the database."""
+    make_transient_to_detached(obj)
+    session.add(obj)
+    return obj
+
+
+def order(user_id: int, status: OrderStatus, total: str = "10.00") -> Order:
+    return Order(id=user_id * 100, user_id=user_id, status=status, total_price=total)
+
+
+def test_delta_counts_orders_by_status() -> None:
+    delta = StatsDelta()
+    delta.add_order(OrderStatus.pending, "5.00", 1)
+    delta.add_order(OrderStatus.paid, Decimal("20.50"), 1)
+    delta.add_order(OrderStatus.delivered, "7.00", 1)
+    delta.add_order(OrderStatus.pending, "5.00", -1)
+
+    assert delta == StatsDelta(
+        total_orders=2,
+        completed_orders=1,
+        total_spent=Decimal("20.50"),
+    )
+    assert delta
+    assert not StatsDelta()
+
+
+def test_new_and_deleted_rows() -> None:
+    session = Session()
+    session.add(order(1, OrderStatus.paid, "12.00"))
+    session.add(Review(user_id=1, product_id=1, rating=5))
+    session.delete(persistent(session, Review(id=7, user_id=2, product_id=1)))
+
+    assert collect_deltas(session) == {
+        1: StatsDelta(total_orders=1, total_spent=Decimal("12.00"), total_reviews=1),
+        2: StatsDelta(total_reviews=-1),
+    }
+
+
+def test_changed_order_moves_between_statuses_and_users() -> None:
+    session = Session()
+    paid = persistent(session, order(1, OrderStatus.paid))
+    paid.status = OrderStatus.delivered
+    moved = persistent(session, Review(id=3, user_id=1, product_id=1))
+    moved.user_id = 2
+
+    assert collect_deltas(session) == {
+        1: StatsDelta(
+            completed_orders=1,
+            total_spent=Decimal("-10.00"),
+            total_reviews=-1,
+        ),
+        2: StatsDelta(total_reviews=1),
+    }
+
+
+def test_unchanged_rows_give_no_delta() -> None:
+    session = Session()
+    kept = persistent(session, order(1, OrderStatus.pending))
+    kept.status = OrderStatus.pending
+    assert collect_deltas(session) == {}
+
+
+def test_cascaded_reviews_are_subtracted() -> None:
+    session = Session()
+    session.add(Review(user_id=1, product_id=2, rating=4))
+    assert collect_deltas(session, {1: 3, 2: 1}) == {
+        1: StatsDelta(total_reviews=-2),
+        2: StatsDelta(total_reviews=-1),
+    }
+
+
+def test_cascade_select_only_for_product_and_category_deletes() -> None:
+    assert cascaded_reviews_select([Review(id=1), User(id=1)]) is None
+
+    stmt = cascaded_reviews_select(
+        [Product(id=1), Category(id=2), User(id=3), Review(id=4)]
+    )
+    sql = str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert "products.id IN (1)" in sql
+    assert "products.category_id IN (2)" in sql
+    assert "reviews.user_id NOT IN (3)" in sql
+    assert "reviews.id NOT IN (4)" in sql
+    assert "GROUP BY reviews.user_id" in sql